@@ -0,0 +1,9 @@
+"""
+헤드리스 성능 벤치마크 (SDL dummy 비디오 드라이버 / Qt offscreen, 화면 필요 없음)
+
+    python -m benchmarks                                  # 전체 실행, 결과를 JSON 으로 출력
+    python -m benchmarks --out baseline.json              # 결과 저장
+    python -m benchmarks --compare baseline.json          # 저장된 기준과 비교해 느려진 항목 표시
+    python -m benchmarks --suite game --sizes 10 1000
+    python -m benchmarks --suite startup                  # import/시작 시간 (새 인터프리터에서)
+"""
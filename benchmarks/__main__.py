@@ -0,0 +1,85 @@
+import os
+import sys
+
+# 화면 없이 돌도록 pygame/Qt 를 불러오기 전에 설정
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import json
+import time
+import argparse
+import platform
+import tempfile
+import importlib
+from .timing import compare
+
+SUITES = ("game", "io", "editor", "startup")
+MODULES = {"game": "benchmarks.game", "io": "benchmarks.mapio", "editor": "benchmarks.editor",
+           "startup": "benchmarks.startup"}
+DEFAULT_SIZES = (10, 100, 1000, 10000, 100000)
+
+
+def run(suites=SUITES, sizes=DEFAULT_SIZES, repeat=5, workdir=None):
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for suite in suites:
+            module = importlib.import_module(MODULES[suite])
+            results.update(module.run(sizes, workdir or tmp, repeat))
+    return {
+        "meta": {
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "sizes": list(sizes),
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def print_comparison(rows, out=sys.stdout):
+    for name, old, new, ratio, status in rows:
+        old_s = f"{old:10.3f}" if old is not None else f"{'-':>10s}"
+        new_s = f"{new:10.3f}" if new is not None else f"{'-':>10s}"
+        ratio_s = f"{ratio:6.2f}x" if ratio is not None else " " * 7
+        # 한쪽에만 있는 항목도 빠뜨리지 않고 표시한다 (이름이 바뀌었거나 스위트/크기가 다를 때)
+        mark = {"regression": "  << REGRESSION", "improved": "  (faster)",
+                "new": "  (new: not in baseline)", "missing": "  (missing: not in this run)"}.get(status, "")
+        print(f"{name:40s} {old_s} {new_s} ms {ratio_s}{mark}", file=out)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="헤드리스 성능 벤치마크")
+    parser.add_argument("--suite", nargs="+", choices=SUITES, default=list(SUITES))
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(DEFAULT_SIZES), help="맵 크기 (지형 열 수)")
+    parser.add_argument("--repeat", type=int, default=5, help="항목마다 표본 수")
+    parser.add_argument("--out", help="결과 JSON 저장 경로 (없으면 표준 출력)")
+    parser.add_argument("--compare", metavar="BASELINE", help="기준 결과 JSON 과 비교")
+    parser.add_argument("--threshold", type=float, default=0.15, help="이 비율 이상 느려지면 회귀로 표시")
+    parser.add_argument("--workdir", help="생성한 맵 파일을 둘 디렉터리 (기본: 임시)")
+    args = parser.parse_args(argv)
+
+    report = run(args.suite, args.sizes, args.repeat, args.workdir)
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+    elif not args.compare:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+        rows = compare(report["results"], baseline, args.threshold)
+        print_comparison(rows)
+        regressions = [r for r in rows if r[4] == "regression"]
+        if regressions:
+            print(f"{len(regressions)} regression(s) over {args.threshold:.0%}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
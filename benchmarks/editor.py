@@ -0,0 +1,26 @@
+"""편집기: Canvas.paintEvent (Qt offscreen, 1배 줌 / 맵 전체 보기)"""
+from PyQt5 import QtGui, QtWidgets
+
+from map_editor import MapData
+from map_editor.gui import Canvas
+from .levels import level_file
+from .timing import measure
+
+
+def run(sizes, workdir, repeat):
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    results = {}
+    for size in sizes:
+        data = MapData()
+        data.load(level_file(workdir, size))
+        canvas = Canvas(data)
+        canvas.resize(640, 480)
+        image = QtGui.QImage(canvas.size(), QtGui.QImage.Format.Format_RGB32)
+        for name, setup in (("paint_1x", lambda: None), ("paint_fit", canvas.fit_view)):
+            setup()
+            stats = measure(lambda: canvas.render(image), repeat)
+            stats["platforms"] = len(data.store)
+            results[f"editor.{name}[{size}]"] = stats
+        canvas.deleteLater()
+    app.processEvents()
+    return results
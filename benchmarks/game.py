@@ -0,0 +1,42 @@
+"""게임 쪽: Player.update, 플랫폼 그리기, 한 프레임 전체 (업데이트 + 렌더)"""
+from collections import defaultdict
+
+import pygame
+
+import main
+from engine import AssetManager, FullRedrawRenderer, InterpolatedView, StaticLayerRenderer
+from .levels import level_file
+from .timing import measure
+
+
+def run(sizes, workdir, repeat):
+    pygame.init()
+    screen = pygame.display.set_mode((main.WIDTH, main.HEIGHT))
+    # 게임 시작 경로와 같게 플레이어 애셋만 불러온다
+    assets = AssetManager("assets", size=(main.TILE_SIZE, main.TILE_SIZE)).load(main.PLAYER_ASSETS)
+    keys = defaultdict(bool, {pygame.K_RIGHT: True})
+    mouse = (main.WIDTH // 2, main.HEIGHT // 2)
+    results = {}
+    for size in sizes:
+        platforms = main.load_level(level_file(workdir, size))
+        count = len(platforms)
+        player = main.Player(assets, platforms)
+        view = InterpolatedView(player)
+        dynamic = pygame.sprite.Group(view)
+
+        def record(name, func):
+            stats = measure(func, repeat)
+            stats["platforms"] = count
+            results[f"game.{name}[{size}]"] = stats
+
+        record("player_update", lambda: player.update(keys, mouse))
+        record("draw_platforms", lambda: platforms.draw(screen))
+        for mode, renderer in (("static", StaticLayerRenderer(screen, platforms)),
+                               ("full", FullRedrawRenderer(screen, platforms))):
+            def frame():
+                player.update(keys, mouse)
+                view.sync(1.0)
+                renderer.render(dynamic)
+            record(f"frame_{mode}", frame)
+    pygame.quit()
+    return results
@@ -0,0 +1,10 @@
+import os
+from map_editor.generator import generate_map
+
+
+def level_file(workdir, size, ext=".vmap"):
+    """size 열짜리 무작위 지형 맵 파일 (공중 발판 포함이라 플랫폼 수는 size 보다 조금 많다)"""
+    path = os.path.join(workdir, f"terrain_{size}{ext}")
+    if not os.path.exists(path):
+        generate_map({"type": "terrain", "columns": size, "seed": 0}, path)
+    return path
@@ -0,0 +1,25 @@
+"""맵 입출력: load_platforms, MapData.load, MapData.save (JSON / .vmap)"""
+import os
+
+from map_editor import MapData, load_platforms
+from .levels import level_file
+from .timing import measure
+
+
+def run(sizes, workdir, repeat):
+    results = {}
+    for size in sizes:
+        data = MapData()
+        for ext in (".json", ".vmap"):
+            path = level_file(workdir, size, ext)
+            fmt = ext[1:]
+            data.load(path)
+            count = len(data.store)
+            out = os.path.join(workdir, f"save_{size}{ext}")
+            for name, func in ((f"load_platforms_{fmt}", lambda: load_platforms(path)),
+                               (f"mapdata_load_{fmt}", lambda: data.load(path)),
+                               (f"mapdata_save_{fmt}", lambda: data.save(out))):
+                stats = measure(func, repeat)
+                stats["platforms"] = count
+                results[f"io.{name}[{size}]"] = stats
+    return results
@@ -0,0 +1,38 @@
+"""시작 비용: 새 인터프리터에서 모듈 import 와 헤드리스 첫 스텝까지 걸리는 시간 (맵 크기와 무관)"""
+import os
+import sys
+import subprocess
+
+from .levels import level_file
+from .timing import measure
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 게임을 띄울 때 불러오는 모듈들 - 무거운 선택 모듈(PyQt5, matplotlib)이 끼어들면 여기서 드러난다
+IMPORTS = ("main", "engine", "map_editor", "value_plotter")
+
+
+def _python(code):
+    subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def loaded_modules(module):
+    """module 을 불러온 뒤 sys.modules 에 올라온 최상위 패키지 이름들"""
+    code = f"import sys, {module}; print(' '.join(sorted({{m.partition('.')[0] for m in sys.modules}})))"
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True, capture_output=True, text=True)
+    return out.stdout.split()
+
+
+def run(sizes, workdir, repeat):
+    results = {}
+    results["startup.interpreter"] = measure(lambda: _python("pass"), repeat)
+    for module in IMPORTS:
+        stats = measure(lambda: _python(f"import {module}"), repeat)
+        stats["modules"] = len(loaded_modules(module))
+        results[f"startup.import_{module}"] = stats
+    # 맵 크기가 아니라 시작 비용을 보려는 것이므로 가장 작은 맵 하나로만 잰다
+    map_file = level_file(workdir, min(sizes))
+    results["startup.headless_first_step"] = measure(
+        lambda: _python(f"import main; main.main(['--headless', '1', '--map', {map_file!r}])"), repeat)
+    return results
@@ -0,0 +1,57 @@
+import time
+import statistics
+
+
+def measure(func, repeat=5, min_time=0.02):
+    """
+    func() 한 번의 실행 시간 통계 (ms)
+    아주 빠른 함수는 한 표본이 min_time 초 이상 되도록 여러 번 묶어서 잰다
+    """
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or number >= 1 << 20:
+            break
+        number *= 2 if elapsed <= 0 else max(2, min(16, int(min_time / elapsed) + 1))
+    samples = [elapsed / number]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - start) / number)
+    return {
+        "median_ms": statistics.median(samples) * 1000,
+        "min_ms": min(samples) * 1000,
+        "max_ms": max(samples) * 1000,
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def compare(results, baseline, threshold=0.15, noise_ms=0.01):
+    """
+    결과와 기준의 median 을 비교
+    반환: [(이름, 기준 ms, 현재 ms, 비율, 상태)] - 상태는 "regression" / "improved" / "ok" / "new" / "missing"
+    noise_ms 보다 짧은 항목은 측정 오차로 보고 비율만 표시한다
+    """
+    rows = []
+    for name in sorted(set(results) | set(baseline)):
+        if name not in baseline:
+            rows.append((name, None, results[name]["median_ms"], None, "new"))
+            continue
+        if name not in results:
+            rows.append((name, baseline[name]["median_ms"], None, None, "missing"))
+            continue
+        old, new = baseline[name]["median_ms"], results[name]["median_ms"]
+        ratio = new / old if old > 0 else float("inf")
+        status = "ok"
+        if max(old, new) >= noise_ms:
+            if ratio > 1 + threshold:
+                status = "regression"
+            elif ratio < 1 / (1 + threshold):
+                status = "improved"
+        rows.append((name, old, new, ratio, status))
+    return rows
@@ -0,0 +1,45 @@
+from .spatial import (
+    PlatformGroup,
+    SpatialHash,
+)
+from .render import (
+    CameraRenderer,
+    FullRedrawRenderer,
+    StaticLayerRenderer,
+)
+from .assets import AssetManager
+from .timestep import (
+    FixedTimestep,
+    InterpolatedView,
+)
+from .collision import (
+    move_swept,
+    sweep_aabb,
+)
+from .camera import Camera
+from .chunks import (
+    ChunkedLevel,
+    ChunkStreamer,
+    is_chunked_level,
+    write_chunked_level,
+)
+from .profiler import (
+    CachedText,
+    FrameProfiler,
+    ProfilerOverlay,
+)
+from .replay import (
+    InputLog,
+    InputRecorder,
+    replay,
+    state_checksum,
+)
+from .snapshot import (
+    SnapshotRing,
+    load_snapshot,
+    restore_snapshot,
+    save_snapshot,
+    snapshot_info,
+    take_snapshot,
+)
+from .hotreload import MapWatcher
@@ -0,0 +1,85 @@
+import os
+import pygame
+
+
+class AssetManager:
+    """
+    이미지 에셋 캐시: assets/ 아래 이미지를 한 번만 읽어서
+    필요한 변형(크기 조정, 좌우 반전)을 미리 만들고 하나의 아틀라스 Surface에 모은다
+    스프라이트는 frame(key, flip)으로 아틀라스의 subsurface를 받아 쓰므로
+    게임 루프에서는 Surface를 새로 만들지 않는다
+    """
+    EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp")
+
+    def __init__(self, root="assets", size=None, sizes=None, padding=1, max_atlas_width=1024):
+        self.root = root
+        self.size = size                # 기본 크기 (None 이면 원본 크기)
+        self.sizes = sizes or {}        # 키별 크기 지정
+        self.padding = padding
+        self.max_atlas_width = max_atlas_width
+        self.atlas = None
+        self.frames = {}                # (key, flipped) -> subsurface
+        self.regions = {}               # (key, flipped) -> 아틀라스 내 Rect
+
+    def scan(self):
+        """root 아래 이미지 파일을 찾아 {키: 경로} 반환 (키는 확장자를 뺀 상대 경로)"""
+        found = {}
+        for dirpath, _, filenames in os.walk(self.root):
+            for name in sorted(filenames):
+                if not name.lower().endswith(self.EXTENSIONS):
+                    continue
+                path = os.path.join(dirpath, name)
+                key = os.path.splitext(os.path.relpath(path, self.root))[0].replace(os.sep, "/")
+                found[key] = path
+        return found
+
+    def load(self, keys=None):
+        """
+        이미지를 읽어 변형을 만들고 아틀라스로 묶는다
+        (display.set_mode 이후에 호출해야 convert_alpha가 가능)
+        """
+        paths = self.scan()
+        if keys is not None:
+            paths = {k: paths[k] for k in keys}
+
+        variants = []
+        for key, path in paths.items():
+            image = pygame.image.load(path)
+            size = self.sizes.get(key, self.size)
+            if size is not None and image.get_size() != tuple(size):
+                image = pygame.transform.scale(image, size)
+            variants.append(((key, False), image))
+            variants.append(((key, True), pygame.transform.flip(image, True, False)))
+
+        self._pack(variants)
+        return self
+
+    def _pack(self, variants):
+        # 높이 순으로 줄(shelf) 단위 배치
+        pad = self.padding
+        order = sorted(variants, key=lambda v: v[1].get_height(), reverse=True)
+        width_limit = max([self.max_atlas_width] + [img.get_width() + pad for _, img in order])
+        x = y = shelf_h = atlas_w = 0
+        placed = []
+        for vkey, img in order:
+            w, h = img.get_size()
+            if x + w > width_limit:
+                x, y = 0, y + shelf_h + pad
+                shelf_h = 0
+            placed.append((vkey, img, pygame.Rect(x, y, w, h)))
+            x += w + pad
+            shelf_h = max(shelf_h, h)
+            atlas_w = max(atlas_w, x)
+
+        atlas = pygame.Surface((max(atlas_w, 1), max(y + shelf_h, 1)), pygame.SRCALPHA)
+        for _, img, rect in placed:
+            atlas.blit(img, rect)
+        self.atlas = atlas.convert_alpha()
+        self.regions = {vkey: rect for vkey, _, rect in placed}
+        self.frames = {vkey: self.atlas.subsurface(rect) for vkey, rect in self.regions.items()}
+
+    def frame(self, key, flipped=False):
+        return self.frames[(key, flipped)]
+
+    def __contains__(self, key):
+        return (key, False) in self.frames
@@ -0,0 +1,26 @@
+import pygame
+
+
+class Camera:
+    """
+    화면(뷰포트)과 월드 좌표 변환: 대상을 화면 가운데에 두고 월드 경계 안으로 제한한다
+    """
+    def __init__(self, width, height, world=None):
+        self.rect = pygame.Rect(0, 0, width, height)
+        self.world = pygame.Rect(world) if world is not None else None
+
+    @property
+    def offset(self):
+        return self.rect.topleft
+
+    def follow(self, target_rect):
+        self.rect.center = target_rect.center
+        if self.world is not None:
+            # 월드가 화면보다 작으면 clamp_ip가 가운데 정렬한다
+            self.rect.clamp_ip(self.world)
+
+    def to_screen(self, rect):
+        return rect.move(-self.rect.x, -self.rect.y)
+
+    def to_world(self, pos):
+        return pos[0] + self.rect.x, pos[1] + self.rect.y
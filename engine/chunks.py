@@ -0,0 +1,180 @@
+import os
+import json
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+import pygame
+from map_editor.core import load_platforms
+
+MANIFEST = "level.json"
+FORMAT_VERSION = 1
+ORDER_STRIDE = 1 << 32      # 청크마다 충돌 순서 번호를 이만큼씩 띄운다 (청크 안 플랫폼 수 상한)
+
+
+def _chunk_filename(cx, cy):
+    return f"chunk_{cx}_{cy}.json"
+
+
+def write_chunked_level(platforms, directory, chunk_size=(640, 480)):
+    """
+    플랫폼 목록을 청크 단위 파일로 나눠 저장
+    각 플랫폼은 좌상단 좌표가 속한 청크에 들어가고,
+    청크 경계를 넘는 최대 길이(overhang)를 manifest 에 기록해 로더가 이웃 청크를 함께 읽게 한다
+    """
+    cw, ch = chunk_size
+    os.makedirs(directory, exist_ok=True)
+    chunks = {}
+    overhang = [0, 0]
+    left = top = right = bottom = None
+    for p in platforms:
+        key = (p.x // cw, p.y // ch)
+        chunks.setdefault(key, []).append(p.to_dict())
+        overhang[0] = max(overhang[0], p.x + p.width - (key[0] + 1) * cw)
+        overhang[1] = max(overhang[1], p.y + p.height - (key[1] + 1) * ch)
+        left = p.x if left is None else min(left, p.x)
+        top = p.y if top is None else min(top, p.y)
+        right = p.x + p.width if right is None else max(right, p.x + p.width)
+        bottom = p.y + p.height if bottom is None else max(bottom, p.y + p.height)
+
+    for (cx, cy), items in chunks.items():
+        with open(os.path.join(directory, _chunk_filename(cx, cy)), "w") as f:
+            json.dump(items, f)
+
+    # 월드 경계: 원점과 최소 한 청크를 포함
+    wl, wt = min(left or 0, 0), min(top or 0, 0)
+    wr, wb = max(right or 0, cw), max(bottom or 0, ch)
+    manifest = {
+        "version": FORMAT_VERSION,
+        "chunk_size": [cw, ch],
+        "overhang": overhang,
+        "bounds": [wl, wt, wr - wl, wb - wt],
+        "chunks": [[cx, cy, _chunk_filename(cx, cy)] for cx, cy in sorted(chunks)],
+    }
+    with open(os.path.join(directory, MANIFEST), "w") as f:
+        json.dump(manifest, f, indent=4)
+    return manifest
+
+
+def is_chunked_level(path):
+    return os.path.isfile(os.path.join(path, MANIFEST))
+
+
+class ChunkedLevel:
+    """
+    청크 레벨 manifest: 청크 크기, 월드 경계, 청크 파일 목록
+    """
+    def __init__(self, directory):
+        self.directory = directory
+        with open(os.path.join(directory, MANIFEST), "r") as f:
+            manifest = json.load(f)
+        if manifest.get("version") != FORMAT_VERSION:
+            raise ValueError(f"지원하지 않는 레벨 버전: {manifest.get('version')}")
+        self.chunk_size = tuple(manifest["chunk_size"])
+        self.overhang = tuple(manifest.get("overhang", (0, 0)))
+        self.bounds = pygame.Rect(manifest["bounds"])
+        self.files = {(cx, cy): name for cx, cy, name in manifest["chunks"]}
+        self.ranks = {key: i for i, key in enumerate(sorted(self.files))}
+        self.layout = self._layout_id(directory)
+
+    def _layout_id(self, directory):
+        """
+        레벨 구성의 32비트 id - 스트리밍으로 불러온 청크는 계속 바뀌므로 불러온 플랫폼이 아니라 파일로 정한다
+        청크 파일을 다 읽지 않도록 manifest 내용과 청크 파일의 크기/수정 시각으로 만든다
+        """
+        with open(os.path.join(directory, MANIFEST), "rb") as f:
+            h = zlib.crc32(f.read())
+        for key in sorted(self.files):
+            st = os.stat(os.path.join(directory, self.files[key]))
+            h = zlib.crc32(b"%s:%d:%d;" % (self.files[key].encode(), st.st_size, st.st_mtime_ns), h)
+        return h
+
+    def order(self, key, i):
+        """청크 key 의 i 번째 플랫폼의 충돌 순서 번호 - 불러온 순서와 상관없이 (청크, 청크 안 순서)로 정해진다"""
+        return (self.ranks[key] + 1) * ORDER_STRIDE + i
+
+    def chunks_in(self, rect):
+        """rect 에 그려질 수 있는 (존재하는) 청크 키 목록"""
+        cw, ch = self.chunk_size
+        ox, oy = self.overhang
+        x0 = (rect.left - max(ox, 0)) // cw
+        y0 = (rect.top - max(oy, 0)) // ch
+        x1 = (rect.right - 1) // cw
+        y1 = (rect.bottom - 1) // ch
+        return [(cx, cy) for cy in range(y0, y1 + 1) for cx in range(x0, x1 + 1) if (cx, cy) in self.files]
+
+    def read_chunk(self, key):
+        return load_platforms(os.path.join(self.directory, self.files[key]))
+
+
+class ChunkStreamer:
+    """
+    카메라 주변 청크만 불러와 스프라이트로 만들고, 멀어진 청크는 내린다
+    - 파일 읽기/파싱은 백그라운드 스레드에서, 스프라이트 생성은 메인 스레드에서
+    - 이동 방향으로 preload 만큼 미리 읽고, 화면에서 evict 거리 이상 멀어지면 제거
+    """
+    def __init__(self, level, platforms, make_sprite, preload=None, evict=None, workers=1):
+        self.level = level
+        self.platforms = platforms          # PlatformGroup
+        self.make_sprite = make_sprite      # EditablePlatform -> Sprite
+        cw, ch = level.chunk_size
+        self.preload = preload if preload is not None else (cw, ch // 2)
+        self.evict = evict if evict is not None else (cw * 2, ch)
+        self.loaded = {}                    # key -> [sprite, ...]
+        self.pending = {}                   # key -> Future
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="chunk-loader")
+        self._last_view = None
+
+    def _region(self, view, margin, direction=(0, 0)):
+        mx, my = margin
+        dx, dy = direction
+        # 진행 방향 쪽은 margin 만큼, 반대쪽은 절반만 넓힌다
+        left = view.left - (mx if dx <= 0 else mx // 2)
+        right = view.right + (mx if dx >= 0 else mx // 2)
+        top = view.top - (my if dy <= 0 else my // 2)
+        bottom = view.bottom + (my if dy >= 0 else my // 2)
+        return pygame.Rect(left, top, right - left, bottom - top)
+
+    def ensure_loaded(self, rect):
+        """rect 주변 청크를 즉시(동기) 불러온다 - 시작 시점이나 순간이동 후 사용"""
+        for key in self.level.chunks_in(rect):
+            if key in self.loaded:
+                continue
+            future = self.pending.pop(key, None)
+            items = future.result() if future is not None else self.level.read_chunk(key)
+            self._attach(key, items)
+
+    def update(self, view):
+        """매 프레임 호출: 완료된 청크 반영, 필요한 청크 요청, 먼 청크 제거"""
+        direction = (0, 0)
+        if self._last_view is not None:
+            direction = (view.x - self._last_view.x, view.y - self._last_view.y)
+        self._last_view = view.copy()
+
+        for key, future in list(self.pending.items()):
+            if future.done():
+                del self.pending[key]
+                self._attach(key, future.result())
+
+        for key in self.level.chunks_in(self._region(view, self.preload, direction)):
+            if key not in self.loaded and key not in self.pending:
+                self.pending[key] = self._executor.submit(self.level.read_chunk, key)
+
+        keep = set(self.level.chunks_in(self._region(view, self.evict)))
+        for key in [k for k in self.loaded if k not in keep]:
+            self._detach(key)
+        for key in [k for k in self.pending if k not in keep]:
+            self.pending.pop(key).cancel()
+
+    def _attach(self, key, items):
+        sprites = [self.make_sprite(p) for p in items]
+        # 불러오기/내리기 순서는 실제 플레이(카메라)와 재생(플레이어 주변만)에서 다르므로 고정 번호를 붙인다
+        for i, sprite in enumerate(sprites):
+            sprite.order = self.level.order(key, i)
+        self.platforms.add(*sprites)
+        self.loaded[key] = sprites
+
+    def _detach(self, key):
+        self.platforms.remove(*self.loaded.pop(key))
+
+    def close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
@@ -0,0 +1,109 @@
+import math
+import pygame
+
+_EPS = 1e-9
+
+
+def sweep_aabb(x, y, w, h, dx, dy, other):
+    """
+    움직이는 사각형 (x, y, w, h)가 변위 (dx, dy) 동안 other(Rect)와 처음 닿는 시각 계산
+    반환: (toi, normal_x, normal_y) - toi는 0~1, 닿지 않으면 None
+    이미 겹쳐 있는 경우는 충돌로 보지 않는다 (빠져나오는 이동은 막지 않음)
+    """
+    ox, oy, ow, oh = other.x, other.y, other.width, other.height
+
+    if dx > 0:
+        x_entry, x_exit = (ox - (x + w)) / dx, (ox + ow - x) / dx
+    elif dx < 0:
+        x_entry, x_exit = (ox + ow - x) / dx, (ox - (x + w)) / dx
+    elif x + w <= ox or x >= ox + ow:
+        return None
+    else:
+        x_entry, x_exit = -math.inf, math.inf
+
+    if dy > 0:
+        y_entry, y_exit = (oy - (y + h)) / dy, (oy + oh - y) / dy
+    elif dy < 0:
+        y_entry, y_exit = (oy + oh - y) / dy, (oy - (y + h)) / dy
+    elif y + h <= oy or y >= oy + oh:
+        return None
+    else:
+        y_entry, y_exit = -math.inf, math.inf
+
+    entry = max(x_entry, y_entry)
+    exit_ = min(x_exit, y_exit)
+    if entry >= exit_ or entry < -_EPS or entry > 1:
+        return None
+    if x_entry > y_entry:
+        return max(entry, 0.0), (-1 if dx > 0 else 1), 0
+    return max(entry, 0.0), 0, (-1 if dy > 0 else 1)
+
+
+def _corner(x, y, w, h, dx, dy, hit, other):
+    # 닿는 순간 다른 축으로 겹치는 길이가 없으면 꼭짓점만 스친 것 (타일 이음매에서 생긴다)
+    toi, nx, _ = hit
+    if nx:
+        y += dy * toi
+        return min(y + h, other.bottom) - max(y, other.top) <= _EPS
+    x += dx * toi
+    return min(x + w, other.right) - max(x, other.left) <= _EPS
+
+
+def move_swept(x, y, w, h, dx, dy, index, max_iterations=4):
+    """
+    연속 충돌(swept AABB) 이동: 변위를 따라 가장 먼저 닿는 플랫폼부터 순서대로 처리하고
+    닿은 축의 이동만 멈춘 뒤 남은 변위로 계속 미끄러진다
+    index 는 query(rect)를 지원하는 SpatialHash
+    같은 시각에 닿는 것이 여럿이면 면으로 닿는 것을 꼭짓점만 스치는 것보다 먼저 처리한다 - 그래서 결과가
+    플랫폼 순서나 타일을 어떻게 나눴는지와 상관없이 덮인 영역의 모양으로만 정해진다
+    반환: (x, y, hit_x, hit_y, landed)
+        hit_x  - 좌우 벽에 닿음
+        hit_y  - 위/아래로 닿음
+        landed - 위에서 내려오다 착지함
+    """
+    hit_x = hit_y = landed = False
+    for _ in range(max_iterations):
+        if not dx and not dy:
+            break
+        # 이동 경로 전체를 덮는 사각형으로 후보 질의
+        left = math.floor(min(x, x + dx)) - 1
+        top = math.floor(min(y, y + dy)) - 1
+        right = math.ceil(max(x, x + dx) + w) + 1
+        bottom = math.ceil(max(y, y + dy) + h) + 1
+        region = pygame.Rect(left, top, right - left, bottom - top)
+
+        best = None
+        for _, platform in index.query(region):
+            r = platform.rect
+            if r.width <= 0 or r.height <= 0:
+                continue
+            hit = sweep_aabb(x, y, w, h, dx, dy, r)
+            if hit is None:
+                continue
+            key = (hit[0], _corner(x, y, w, h, dx, dy, hit, r))
+            if best is None or key < best[0]:
+                best = (key, hit[1], hit[2], r)
+        if best is None:
+            x += dx
+            y += dy
+            break
+
+        (toi, _), nx, ny, r = best
+        x += dx * toi
+        y += dy * toi
+        dx *= 1 - toi
+        dy *= 1 - toi
+        # 접촉면에 정확히 붙여서 부동소수 오차 누적을 막는다
+        if nx:
+            x = r.left - w if nx < 0 else r.right
+            dx = 0
+            hit_x = True
+        else:
+            if ny < 0:
+                y = r.top - h
+                landed = True
+            else:
+                y = r.bottom
+            dy = 0
+            hit_y = True
+    return x, y, hit_x, hit_y, landed
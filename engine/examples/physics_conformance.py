@@ -0,0 +1,91 @@
+"""
+BatchPhysics 와 main.Player 의 프레임 단위 일치 검사
+같은 맵/입력으로 Player(1개씩)와 BatchPhysics(N개)를 돌려 매 프레임 상태를 비교한다
+
+    python engine/examples/physics_conformance.py [--agents N] [--frames F] [--seed S]
+    (python -m engine.examples.physics_conformance 도 된다, CI 에서는 test/test_physics_conformance.py 가 돌린다)
+"""
+import os
+import sys
+import random
+import argparse
+from collections import defaultdict
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+# 스크립트로 바로 실행해도 저장소 루트의 data/main/engine 을 찾도록
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import pygame
+from data import Facing
+from engine import PlatformGroup, AssetManager
+from engine.physics import BatchPhysics
+import main
+
+KEYS = {
+    "left": pygame.K_LEFT,
+    "right": pygame.K_RIGHT,
+    "push": pygame.K_c,
+    "jump": pygame.K_SPACE,
+}
+
+
+def random_level(rng, count=40):
+    platforms = PlatformGroup(main.TILE_SIZE)
+    for _ in range(count):
+        x = rng.randrange(0, main.WIDTH, 20)
+        y = rng.randrange(120, main.HEIGHT, 20)
+        w = rng.choice([10, 40, 80, 160])
+        h = rng.choice([10, 20, 40])
+        platforms.add(main.Platform(x, y, w, h))
+    return platforms
+
+
+def run(agents=1, frames=2000, seed=0):
+    rng = random.Random(seed)
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    assets = AssetManager(os.path.join(ROOT, "assets"), size=(main.TILE_SIZE, main.TILE_SIZE)).load(main.PLAYER_ASSETS)
+    platforms = random_level(rng)
+
+    players = [main.Player(assets, platforms) for _ in range(agents)]
+    batch = BatchPhysics(agents, platforms, bounds=(main.WIDTH, main.HEIGHT))
+
+    held = [dict.fromkeys(KEYS, False) for _ in range(agents)]
+    for frame in range(frames):
+        inputs = {name: [] for name in KEYS}
+        aim = []
+        for i, player in enumerate(players):
+            # 입력을 몇 프레임씩 유지하며 무작위로 바꾼다
+            for name in KEYS:
+                if rng.random() < 0.08:
+                    held[i][name] = not held[i][name]
+                inputs[name].append(held[i][name])
+            mouse = (rng.randrange(main.WIDTH), rng.randrange(main.HEIGHT))
+            aim.append(mouse)
+            keys = defaultdict(bool, {KEYS[name]: held[i][name] for name in KEYS})
+            player.update(keys, mouse)
+
+        batch.step(aim_x=[a[0] for a in aim], aim_y=[a[1] for a in aim], **inputs)
+
+        for i, player in enumerate(players):
+            expected = (player.rect.x, player.rect.y, player.velocity_x, player.velocity_y,
+                        player.on_ground, player.can_push, player.facing_right, player.facing_clamp)
+            actual = (int(batch.x[i]), int(batch.y[i]), float(batch.vx[i]), float(batch.vy[i]),
+                      bool(batch.on_ground[i]), bool(batch.can_push[i]), bool(batch.facing_right[i]),
+                      Facing(int(batch.facing[i])))
+            if expected != actual:
+                raise AssertionError(f"frame {frame} agent {i}: Player={expected} BatchPhysics={actual}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--agents", type=int, default=1)
+    parser.add_argument("--frames", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run(args.agents, args.frames, args.seed)
+    print(f"OK: {args.agents} agent(s), {args.frames} frames match Player")
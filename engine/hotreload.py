@@ -0,0 +1,137 @@
+"""
+맵 파일 핫 리로드: 파일이 바뀌면 새 플랫폼 목록을 지금 PlatformGroup 과 비교해서 바뀐 것만 넣고 뺀다
+
+- 파일 읽기/파싱/비교는 백그라운드 스레드에서 하고, 메인 스레드는 결과(추가/삭제 목록)만 반영한다
+- 한 프레임에 반영하는 개수는 max_changes 로 제한하고, 남은 것은 다음 프레임으로 넘긴다
+- 저장 도중의 파일을 읽지 않도록 크기/수정 시각이 한 번 더 같게 나올 때까지 기다린다
+플랫폼은 (x, y, width, height, color) 값으로 비교하므로, 옮긴 플랫폼은 삭제 + 추가가 된다
+"""
+import os
+import time
+from collections import Counter, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+
+from map_editor.core import load_platforms
+
+
+def platform_key(x, y, width, height, color):
+    return x, y, width, height, tuple(color[:3])
+
+
+def _sprite_key(sprite):
+    r = sprite.rect
+    return platform_key(r.x, r.y, r.width, r.height, sprite.color)
+
+
+class MapWatcher:
+    """
+    filename 을 지켜보다가 바뀌면 platforms(PlatformGroup)를 증분 갱신
+    make_sprite(p)는 read 가 돌려준 플랫폼(x/y/width/height/color)으로 스프라이트를 만든다
+    스프라이트는 비교를 위해 color 속성을 가져야 한다
+    """
+    def __init__(self, filename, platforms, make_sprite, read=load_platforms, interval=0.5, max_changes=2000):
+        self.filename = filename
+        self.platforms = platforms
+        self.make_sprite = make_sprite
+        self.read = read
+        self.interval = interval
+        self.max_changes = max_changes
+        self.live = defaultdict(list)           # 키 -> [스프라이트, ...]
+        for sprite in platforms:
+            self.live[_sprite_key(sprite)].append(sprite)
+        self._keys = Counter({key: len(sprites) for key, sprites in self.live.items()})
+        self._stat = self._read_stat()
+        self._settling = None                   # 바뀐 것을 본 stat (한 번 더 같으면 읽는다)
+        self._next_poll = 0.0
+        self._future = None
+        self._queue = deque()                   # (True, 플랫폼) 추가 / (False, 키) 삭제
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="map-reload")
+        self.reloads = 0
+        self.error = None
+
+    def _read_stat(self):
+        try:
+            st = os.stat(self.filename)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    @property
+    def busy(self):
+        return self._future is not None or bool(self._queue)
+
+    def update(self, now=None):
+        """
+        매 프레임 호출: 파일 변경 확인, 끝난 비교 결과 받기, 쌓인 변경을 max_changes 개까지 반영
+        반환: 이번에 바뀐 영역(Rect) 목록 - 렌더러 invalidate(rect) 에 넘긴다
+        """
+        now = time.perf_counter() if now is None else now
+        if self._future is not None and self._future.done():
+            self._receive(self._future)
+            self._future = None
+        if self._future is None and now >= self._next_poll:
+            self._next_poll = now + self.interval
+            self._check()
+        return self._apply()
+
+    def _check(self):
+        stat = self._read_stat()
+        if stat is None or stat == self._stat:
+            self._settling = None
+            return
+        if stat != self._settling:
+            self._settling = stat
+            return
+        self._settling = None
+        self._stat = stat
+        self._future = self._executor.submit(self._diff, self._keys)
+
+    def _diff(self, old):
+        items = {}
+        new = Counter()
+        for p in self.read(self.filename):
+            key = platform_key(p.x, p.y, p.width, p.height, p.color)
+            new[key] += 1
+            items.setdefault(key, p)
+        removed = [key for key, n in (old - new).items() for _ in range(n)]
+        added = [items[key] for key, n in (new - old).items() for _ in range(n)]
+        return new, removed, added
+
+    def _receive(self, future):
+        try:
+            new, removed, added = future.result()
+        except (OSError, ValueError) as e:
+            # 읽다가 실패하면 (쓰는 도중 등) 다음 변경 때 다시 시도
+            self.error = e
+            self._stat = None
+            return
+        self.error = None
+        self._keys = new
+        self._queue.extend((False, key) for key in removed)
+        self._queue.extend((True, p) for p in added)
+        self.reloads += 1
+
+    def _apply(self):
+        queue = self._queue
+        if not queue:
+            return []
+        live = self.live
+        platforms = self.platforms
+        rects = []
+        for _ in range(min(self.max_changes, len(queue))):
+            is_add, item = queue.popleft()
+            if is_add:
+                sprite = self.make_sprite(item)
+                live[_sprite_key(sprite)].append(sprite)
+                platforms.add(sprite)
+            else:
+                sprites = live[item]
+                sprite = sprites.pop()
+                if not sprites:
+                    del live[item]
+                platforms.remove(sprite)
+            rects.append(sprite.rect.copy())
+        return rects
+
+    def close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
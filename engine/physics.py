@@ -0,0 +1,266 @@
+import numpy as np
+from data import Facing
+
+_FACING_NORTH = Facing.NORTH.value
+_FACING_SOUTH = Facing.SOUTH.value
+_FACING_EAST = Facing.EAST.value
+_FACING_WEST = Facing.WEST.value
+
+# 셀 좌표를 하나의 정수 키로 합칠 때 쓰는 오프셋 (음수 좌표 허용)
+_CELL_OFFSET = 1 << 20
+_CELL_SPAN = 1 << 21
+
+
+def _round_half_away(v):
+    """pygame.Rect 좌표 대입과 같은 반올림 (0.5는 0에서 먼 쪽으로)"""
+    a = np.abs(v)
+    r = np.floor(a)
+    r += (a - r) >= 0.5
+    return (np.sign(v) * r).astype(np.int64)
+
+
+class BatchPhysics:
+    """
+    N개 에이전트용 벡터화 물리 엔진 (structure-of-arrays)
+    위치/속도/on_ground/can_push 등을 NumPy 배열로 보관하고,
+    Player.update 와 같은 가속/마찰/중력/점프/푸시 스킬/플랫폼 충돌 규칙을 한 번에 적용한다
+    """
+    def __init__(self, n, platforms=(), bounds=(640, 480), size=(40, 40), spawn=(100, 100),
+                 max_velocity_x=6, gravity_const=0.5, jump_power=-12, push_skill_power=7,
+                 acceleration=0.5, friction=0.5, cell_size=40):
+        self.n = n
+        self.width, self.height = bounds
+        self.w, self.h = size
+        self.max_velocity_x = max_velocity_x
+        self.gravity_const = gravity_const
+        self.jump_power = jump_power
+        self.push_skill_power = push_skill_power
+        self.acceleration = acceleration
+        self.friction = friction
+        self.cell_size = cell_size
+
+        self.x = np.full(n, spawn[0], dtype=np.int64)
+        self.y = np.full(n, spawn[1], dtype=np.int64)
+        self.vx = np.zeros(n)
+        self.vy = np.zeros(n)
+        self.facing_right = np.ones(n, dtype=bool)
+        self.facing = np.full(n, _FACING_NORTH, dtype=np.int8)
+        self.on_ground = np.zeros(n, dtype=bool)
+        self.can_push = np.ones(n, dtype=bool)
+        self.is_jumping = np.zeros(n, dtype=bool)
+
+        self.set_platforms(platforms)
+
+    # ------------------------------------------------------------------ 플랫폼
+    def set_platforms(self, platforms):
+        """
+        플랫폼 목록(x/y/width/height 또는 rect 속성을 가진 객체) 등록
+        순서가 충돌 처리 순서가 된다 (pygame Group 의 삽입 순서와 동일하게 넘길 것)
+        """
+        rows = []
+        for p in platforms:
+            r = getattr(p, "rect", None)
+            if r is not None:
+                rows.append((r.x, r.y, r.width, r.height))
+            else:
+                rows.append((p.x, p.y, p.width, p.height))
+        arr = np.array(rows, dtype=np.int64).reshape(-1, 4)
+        self.px, self.py, self.pw, self.ph = arr.T.copy()
+        self._build_grid()
+
+    def _cell_keys(self, cx, cy):
+        return (cy + _CELL_OFFSET) * _CELL_SPAN + (cx + _CELL_OFFSET)
+
+    def _build_grid(self):
+        # 크기가 0 이하인 플랫폼은 colliderect 에 걸리지 않으므로 제외
+        cs = self.cell_size
+        valid = np.flatnonzero((self.pw > 0) & (self.ph > 0))
+        x0 = self.px[valid] // cs
+        y0 = self.py[valid] // cs
+        x1 = (self.px[valid] + self.pw[valid] - 1) // cs
+        y1 = (self.py[valid] + self.ph[valid] - 1) // cs
+        nx = x1 - x0 + 1
+        ny = y1 - y0 + 1
+        counts = nx * ny
+        total = int(counts.sum())
+        owner = np.repeat(np.arange(len(valid)), counts)
+        local = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        cx = x0[owner] + local % nx[owner]
+        cy = y0[owner] + local // nx[owner]
+        keys = self._cell_keys(cx, cy)
+        order = np.argsort(keys, kind="stable")
+        self._grid_keys = keys[order]
+        self._grid_items = valid[owner[order]]
+
+    def _gather_pairs(self, rx0, ry0, rx1, ry1):
+        """각 에이전트 영역(셀 범위)에 걸친 플랫폼 (agent, platform) 쌍을 플랫폼 순서대로 반환"""
+        nx = rx1 - rx0 + 1
+        ny = ry1 - ry0 + 1
+        counts = nx * ny
+        agent = np.repeat(np.arange(len(rx0)), counts)
+        local = np.arange(int(counts.sum())) - np.repeat(np.cumsum(counts) - counts, counts)
+        cx = rx0[agent] + local % nx[agent]
+        cy = ry0[agent] + local // nx[agent]
+        keys = self._cell_keys(cx, cy)
+        lo = np.searchsorted(self._grid_keys, keys, "left")
+        hi = np.searchsorted(self._grid_keys, keys, "right")
+        hits = hi - lo
+        pair_agent = np.repeat(agent, hits)
+        offs = np.arange(int(hits.sum())) - np.repeat(np.cumsum(hits) - hits, hits)
+        pair_plat = self._grid_items[np.repeat(lo, hits) + offs]
+        # 여러 셀에 걸친 플랫폼 중복 제거 + (에이전트, 플랫폼 순서)로 정렬
+        combined = np.unique(pair_agent * len(self.px) + pair_plat)
+        return combined // max(len(self.px), 1), combined % max(len(self.px), 1)
+
+    # ------------------------------------------------------------------ 스텝
+    def step(self, left=False, right=False, push=False, jump=False, aim_x=0, aim_y=0):
+        """
+        한 스텝 진행. 입력은 길이 N 배열 또는 스칼라(모든 에이전트 공통)
+        aim_x/aim_y 는 Player 의 마우스 위치에 해당한다
+        """
+        n = self.n
+        left = np.broadcast_to(np.asarray(left, dtype=bool), (n,))
+        right = np.broadcast_to(np.asarray(right, dtype=bool), (n,))
+        push = np.broadcast_to(np.asarray(push, dtype=bool), (n,))
+        jump = np.broadcast_to(np.asarray(jump, dtype=bool), (n,))
+
+        vx, vy = self.vx, self.vy
+        # 이동 처리: 왼쪽 > 오른쪽 > 푸시 > 마찰 순서
+        m_left = left
+        m_right = ~left & right
+        m_push = ~left & ~right & push & self.can_push
+        m_fric = ~left & ~right & ~m_push
+
+        vx[m_left] -= self.acceleration
+        vx[m_right] += self.acceleration
+        self.facing_right[m_left] = False
+        self.facing_right[m_right] = True
+
+        self.can_push[m_push] = False
+        f = self.facing
+        psp = self.push_skill_power
+        vy[m_push & (f == _FACING_NORTH)] = psp
+        vy[m_push & (f == _FACING_SOUTH)] = -psp
+        vx[m_push & (f == _FACING_EAST)] = -psp
+        vx[m_push & (f == _FACING_WEST)] = psp
+
+        pos = m_fric & (vx > 0)
+        neg = m_fric & (vx < 0)
+        vx[pos] = np.maximum(vx[pos] - self.friction, 0)
+        vx[neg] = np.minimum(vx[neg] + self.friction, 0)
+
+        np.clip(vx, -self.max_velocity_x, self.max_velocity_x, out=vx)
+
+        m_jump = jump & self.on_ground
+        vy[m_jump] = self.jump_power
+        self.is_jumping[m_jump] = True
+        self.on_ground[m_jump] = False
+
+        # X/Y 이동
+        self.x = _round_half_away(self.x + vx)
+        vy += self.gravity_const
+        old_bottom = self.y + self.h
+        self.y = _round_half_away(self.y + vy)
+
+        # 플랫폼 충돌
+        self.on_ground[:] = False
+        if len(self._grid_keys):
+            self._collide(old_bottom)
+
+        # 바닥
+        x, y, w, h = self.x, self.y, self.w, self.h
+        floor = y + h > self.height
+        y[floor] = self.height - h
+        vy[floor] = 0
+        self.on_ground[floor] = True
+        self.can_push[floor] = True
+
+        # 화면 경계
+        m = x < 0
+        x[m] = 0
+        vx[m] = 0
+        m = x + w > self.width
+        x[m] = self.width - w
+        vx[m] = 0
+        m = y < 0
+        y[m] = 0
+        vy[m] = 0
+
+        # 조준 방향 (Player 의 마우스 방향 계산과 동일)
+        aim_x = np.broadcast_to(np.asarray(aim_x), (n,))
+        aim_y = np.broadcast_to(np.asarray(aim_y), (n,))
+        deg = (np.degrees(np.arctan2(-(aim_y - y), aim_x - x)) + 360) % 360
+        self.facing = np.select(
+            [(45 <= deg) & (deg < 135), (135 <= deg) & (deg < 225), (225 <= deg) & (deg < 315)],
+            [_FACING_NORTH, _FACING_WEST, _FACING_SOUTH],
+            _FACING_EAST,
+        ).astype(np.int8)
+
+    def _collide(self, old_bottom):
+        cs = self.cell_size
+        w, h = self.w, self.h
+        x, y, vx, vy = self.x, self.y, self.vx, self.vy
+        px, py, pw, ph = self.px, self.py, self.pw, self.ph
+
+        # 각 에이전트의 질의 영역: rect 를 크기만큼 사방으로 늘린 사각형
+        rx0, ry0 = x - w, y - h
+        rx1, ry1 = x + 2 * w, y + 2 * h
+        pair_agent, pair_plat = self._gather_pairs(rx0 // cs, ry0 // cs, (rx1 - 1) // cs, (ry1 - 1) // cs)
+        if not len(pair_agent):
+            return
+        # 에이전트별 k 번째 후보를 한 라운드에 함께 처리 (에이전트 내부 순서는 플랫폼 순서)
+        starts = np.searchsorted(pair_agent, np.arange(self.n))
+        rank = np.arange(len(pair_agent)) - starts[pair_agent]
+        by_rank = np.argsort(rank, kind="stable")
+        rank_sorted = rank[by_rank]
+        bounds = np.searchsorted(rank_sorted, np.arange(rank_sorted[-1] + 2))
+        last_plat = np.full(self.n, -1, dtype=np.int64)
+        escaped = np.zeros(self.n, dtype=bool)
+
+        for k in range(len(bounds) - 1):
+            sel = by_rank[bounds[k]:bounds[k + 1]]
+            a = pair_agent[sel]
+            p = pair_plat[sel]
+            # 충돌 처리로 rect 가 질의 영역을 벗어나면 나머지는 개별 처리로 넘긴다
+            out = (x[a] < rx0[a]) | (y[a] < ry0[a]) | (x[a] + w > rx1[a]) | (y[a] + h > ry1[a])
+            escaped[a[out]] = True
+            keep = ~escaped[a]
+            a, p = a[keep], p[keep]
+            if not len(a):
+                continue
+            last_plat[a] = p
+            self._resolve(a, px[p], py[p], pw[p], ph[p], old_bottom[a])
+
+        escaped |= (x < rx0) | (y < ry0) | (x + w > rx1) | (y + h > ry1)
+        # 드물게 영역을 벗어난 에이전트: 남은 플랫폼을 순서대로 하나씩 처리
+        for i in np.flatnonzero(escaped):
+            for j in range(last_plat[i] + 1, len(px)):
+                if pw[j] <= 0 or ph[j] <= 0:
+                    continue
+                ai = np.array([i])
+                self._resolve(ai, px[j:j + 1], py[j:j + 1], pw[j:j + 1], ph[j:j + 1], old_bottom[ai])
+
+    def _resolve(self, a, px, py, pw, ph, old_bottom):
+        """에이전트 a 들과 각자 대응하는 플랫폼 하나씩에 대해 Player.update 의 충돌 규칙 적용"""
+        w, h = self.w, self.h
+        x, y, vx, vy = self.x[a], self.y[a], self.vx[a], self.vy[a]
+        hit = (x < px + pw) & (x + w > px) & (y < py + ph) & (y + h > py)
+        if not hit.any():
+            return
+        pt, pb = py, py + ph
+        pl, pr = px, px + pw
+        # 착지
+        land = hit & (vy > 0) & (old_bottom <= pt) & (pt < y + h)
+        # 천장
+        ceil = hit & ~land & (vy < 0) & (y <= pb) & (pb < y - vy)
+        y = np.where(land, pt - h, np.where(ceil, pb, y))
+        vy = np.where(land | ceil, 0.0, vy)
+        # 좌우 벽
+        wall_r = hit & (vx > 0) & (x + w > pl) & (x < pl)
+        wall_l = hit & ~wall_r & (vx < 0) & (x < pr) & (x + w > pr)
+        x = np.where(wall_r, pl - w, np.where(wall_l, pr, x))
+        vx = np.where(wall_r | wall_l, 0.0, vx)
+
+        self.x[a], self.y[a], self.vx[a], self.vy[a] = x, y, vx, vy
+        self.on_ground[a[land]] = True
+        self.can_push[a[land]] = True
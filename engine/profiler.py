@@ -0,0 +1,150 @@
+import time
+from array import array
+
+PHASES = ("events", "input", "physics", "collision", "draw", "flip")
+
+
+class FrameProfiler:
+    """
+    프레임 단계별 시간 측정
+    - begin_frame() 후 각 단계가 끝날 때 mark(phase)를 부르면 직전 mark 부터의 시간이 그 단계에 더해진다
+      (한 프레임에 물리 스텝이 여러 번 돌면 physics/collision 은 합산)
+    - 최근 capacity 프레임을 고정 크기 링 버퍼에 두고 p50/p99 를 계산한다
+    - start_trace(path)로 프레임마다 한 줄씩 CSV 로 남긴다
+    enabled 가 False 면 모든 호출이 바로 반환되므로 꺼 두면 비용이 거의 없다
+    enabled 를 바꾸면 다음 begin_frame() 부터 적용된다 (프레임 중간에 켜져서 반쪽 프레임이 기록되지 않도록)
+    """
+    def __init__(self, phases=PHASES, capacity=600):
+        self.phases = tuple(phases)
+        self.capacity = capacity
+        self._enabled = False       # 요청된 상태 (다음 프레임부터)
+        self._active = False        # 이번 프레임을 재고 있는지
+        self._slot = {p: i for i, p in enumerate(self.phases)}
+        # 단계별 + 프레임 전체(마지막 열) 링 버퍼 (ms)
+        self._ring = [array("d", bytes(8 * capacity)) for _ in range(len(self.phases) + 1)]
+        self._acc = [0.0] * len(self.phases)
+        self._start = self._last = 0.0
+        self.frames = 0         # 링 버퍼에 기록된 누적 프레임 수
+        self._trace = None
+
+    @property
+    def enabled(self):
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value):
+        self._enabled = bool(value)
+
+    def begin_frame(self):
+        if self._enabled and not self._active:
+            # 꺼져 있던 동안의 오래된 표본이 p99 에 남지 않도록 새로 켤 때 비운다
+            self.reset()
+        self._active = self._enabled
+        if not self._active:
+            return
+        self._start = self._last = time.perf_counter()
+        acc = self._acc
+        for i in range(len(acc)):
+            acc[i] = 0.0
+
+    def mark(self, phase):
+        if not self._active:
+            return
+        now = time.perf_counter()
+        self._acc[self._slot[phase]] += now - self._last
+        self._last = now
+
+    def end_frame(self):
+        if not self._active:
+            return
+        total = time.perf_counter() - self._start
+        pos = self.frames % self.capacity
+        for column, seconds in zip(self._ring, self._acc):
+            column[pos] = seconds * 1000
+        self._ring[-1][pos] = total * 1000
+        self.frames += 1
+        if self._trace is not None:
+            self._trace.write(f"{self.frames},{self._start:.6f},"
+                              + ",".join(f"{s * 1000:.4f}" for s in self._acc) + f",{total * 1000:.4f}\n")
+
+    def reset(self):
+        self.frames = 0
+
+    def percentiles(self, q=(50, 99)):
+        """{단계 또는 "frame": (p50, p99, ...)} ms - 아직 기록이 없으면 빈 dict"""
+        n = min(self.frames, self.capacity)
+        if not n:
+            return {}
+        out = {}
+        for name, column in zip(self.phases + ("frame",), self._ring):
+            values = sorted(column[:n])
+            out[name] = tuple(values[min(n - 1, int(n * p / 100))] for p in q)
+        return out
+
+    @property
+    def tracing(self):
+        return self._trace is not None
+
+    def start_trace(self, path):
+        """프레임별 단계 시간(ms)을 CSV 로 기록 시작 (측정도 함께 켠다)"""
+        self.stop_trace()
+        self._trace = open(path, "w", buffering=1 << 16)
+        self._trace.write("frame,start_s," + ",".join(f"{p}_ms" for p in self.phases) + ",frame_ms\n")
+        self.enabled = True
+
+    def stop_trace(self):
+        if self._trace is not None:
+            self._trace.close()
+            self._trace = None
+
+
+class CachedText:
+    """글자가 바뀔 때만 font.render 를 다시 하는 텍스트 Surface"""
+    def __init__(self, font, color=(255, 255, 255)):
+        self.font = font
+        self.color = color
+        self.text = None
+        self.surface = None
+
+    def set(self, text):
+        if text != self.text:
+            self.text = text
+            self.surface = self.font.render(text, True, self.color)
+        return self.surface
+
+
+class ProfilerOverlay:
+    """
+    단계별 p50/p99 오버레이
+    값은 refresh 초마다만 다시 계산하고, 줄마다 CachedText 를 써서 바뀐 줄만 다시 렌더링한다
+    """
+    def __init__(self, profiler, font, pos=(10, 34), refresh=0.5, color=(255, 255, 0)):
+        self.profiler = profiler
+        self.font = font
+        self.pos = pos
+        self.refresh = refresh
+        self.visible = False
+        self._lines = [CachedText(font, color) for _ in range(len(profiler.phases) + 2)]
+        self._items = []
+        self._next = 0.0
+
+    def toggle(self):
+        self.visible = not self.visible
+        self._next = 0.0
+        return self.visible
+
+    def items(self, now):
+        """(surface, pos) 목록 - render 의 overlays 에 그대로 넘긴다"""
+        if not self.visible:
+            return ()
+        if now >= self._next:
+            self._next = now + self.refresh
+            stats = self.profiler.percentiles()
+            texts = [f"{'phase':10s}   p50     p99  (ms)"]
+            for name in self.profiler.phases + ("frame",):
+                p50, p99 = stats.get(name, (0.0, 0.0))
+                texts.append(f"{name:10s} {p50:6.2f}  {p99:6.2f}")
+            x, y = self.pos
+            step = self.font.get_linesize()
+            self._items = [(line.set(text), (x, y + i * step)) for i, (line, text) in enumerate(zip(self._lines, texts))]
+        return self._items
@@ -0,0 +1,463 @@
+"""
+레벨 도달 가능성 분석: 스폰 지점에서 Player 의 이동 모델(가속/마찰/점프/중력/푸시 스킬)로
+어떤 플랫폼 위에 설 수 있는지 찾는다
+
+- 땅에 선 상태를 (x 구간, y, 속도)로 묶어 하나의 탐색 상태로 보고, 상태마다 입력 묶음(걷기, 점프 +
+  공중 방향 유지/놓기, 공중 푸시)을 실제 게임과 같은 discrete 충돌로 착지할 때까지 흉내 낸다
+- 충돌 후보 순서까지 게임과 같도록 SpatialHash 를 그대로 쓴다
+- 한 단계(BFS 층)의 상태들을 프로세스 풀에 나눠서 펼친다
+- 같은 칸(x 구간, y)에서 같은 방향으로 더 빠른 상태가 이미 있으면 느린 상태는 펼치지 않는다
+- 꼭대기를 지나 떨어지는 중에 아직 못 밟은 플랫폼(바닥 포함)이 닿을 수 있는 범위 아래쪽에 하나도 없으면
+  그 입력 묶음은 거기서 멈춘다 - 이미 밟은 플랫폼 위는 걸어서 닿는다고 보는 근사라서 벽으로 막힌 면은
+  놓칠 수 있다
+- 결과는 (맵 내용, 이동 모델, 경계, 스폰, 이산화 설정) 해시로 캐시해서 같은 입력이면 바로 돌려준다
+
+    python -m engine.reachability map.json
+    python -m engine.reachability map.vmap --workers 4 --bounds 0 0 32000 480
+"""
+import os
+import sys
+import json
+import math
+import time
+import hashlib
+import argparse
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pygame
+
+from .spatial import SpatialHash
+
+ANALYSIS_VERSION = 2
+SPAWN = (100, 100)
+BOUNDS = (0, 0, 640, 480)
+CACHE_DIR = ".reachability_cache"
+MAX_FRAMES = 300        # 입력 묶음 하나를 흉내 내는 최대 프레임 수
+X_BIN = 16              # 선 위치를 이 픽셀 단위로 묶는다
+VX_BIN = 2              # 착지 속도를 이 단위로 묶는다
+APEX_CHECK_FRAMES = 8   # 떨어지는 중에 새로 설 곳이 남았는지 다시 확인하는 간격
+
+# 공중 푸시 효과 (Player.update: 바라보는 방향의 반대로 밀림)
+PUSHES = ("up", "down", "left", "right")
+
+
+class MovementModel:
+    """Player 의 이동 상수 (기본값은 main.Player 와 같다)"""
+    def __init__(self, size=(40, 40), max_velocity_x=6, gravity_const=0.5, jump_power=-12,
+                 push_skill_power=7, acceleration=0.5, friction=0.5):
+        self.size = tuple(size)
+        self.max_velocity_x = max_velocity_x
+        self.gravity_const = gravity_const
+        self.jump_power = jump_power
+        self.push_skill_power = push_skill_power
+        self.acceleration = acceleration
+        self.friction = friction
+
+    @classmethod
+    def from_player(cls, player):
+        return cls(player.rect.size, player.max_velocity_x, player.gravity_const, player.jump_power,
+                   player.push_skill_power, player.acceleration, player.friction)
+
+    def params(self):
+        return (self.size, self.max_velocity_x, self.gravity_const, self.jump_power,
+                self.push_skill_power, self.acceleration, self.friction)
+
+
+class _Solid:
+    __slots__ = ("rect", "index")
+
+    def __init__(self, rect, index):
+        self.rect = rect
+        self.index = index
+
+
+class _Body:
+    """Player.update(dt=1, discrete 충돌)와 같은 계산을 하는 최소 상태"""
+    __slots__ = ("rect", "vx", "vy", "on_ground", "can_push")
+
+    def __init__(self, x, y, vx, model):
+        self.rect = pygame.Rect((x, y), model.size)
+        self.vx = vx
+        self.vy = 0
+        self.on_ground = True
+        self.can_push = True
+
+    def step(self, m, world, left=False, right=False, push=None, up=False):
+        """한 스텝 진행 - 이번 스텝에 착지한 플랫폼 번호 (없으면 None, 바닥 경계면 -1)"""
+        if left:
+            self.vx -= m.acceleration
+        elif right:
+            self.vx += m.acceleration
+        elif push is not None and self.can_push:
+            self.can_push = False
+            if push == "down":
+                self.vy = m.push_skill_power
+            elif push == "up":
+                self.vy = -m.push_skill_power
+            elif push == "left":
+                self.vx = -m.push_skill_power
+            else:
+                self.vx = m.push_skill_power
+        elif self.vx > 0:
+            self.vx = max(0, self.vx - m.friction)
+        elif self.vx < 0:
+            self.vx = min(0, self.vx + m.friction)
+        self.vx = max(-m.max_velocity_x, min(self.vx, m.max_velocity_x))
+        if up and self.on_ground:
+            self.vy = m.jump_power
+            self.on_ground = False
+
+        rect = self.rect
+        landed = None
+        rect.x += self.vx
+        self.vy += m.gravity_const
+        old_bottom = rect.bottom
+        rect.y += self.vy
+        self.on_ground = False
+        for solid in world.candidates(rect):
+            p = solid.rect
+            if rect.colliderect(p):
+                if self.vy > 0 and old_bottom <= p.top < rect.bottom:
+                    rect.bottom = p.top
+                    self.vy = 0
+                    self.on_ground = True
+                    self.can_push = True
+                    landed = solid.index
+                elif self.vy < 0 and rect.top <= p.bottom < rect.top - self.vy:
+                    rect.top = p.bottom
+                    self.vy = 0
+                if self.vx > 0 and rect.right > p.left and rect.left < p.left:
+                    rect.right = p.left
+                    self.vx = 0
+                elif self.vx < 0 and rect.left < p.right and rect.right > p.right:
+                    rect.left = p.right
+                    self.vx = 0
+
+        bounds = world.bounds
+        if rect.bottom > bounds.bottom:
+            rect.bottom = bounds.bottom
+            self.vy = 0
+            self.on_ground = True
+            self.can_push = True
+            landed = -1
+        if rect.left < bounds.left:
+            rect.left = bounds.left
+            self.vx = 0
+        if rect.right > bounds.right:
+            rect.right = bounds.right
+            self.vx = 0
+        if rect.top < bounds.top:
+            rect.top = bounds.top
+            self.vy = 0
+        return landed
+
+
+class _World:
+    def __init__(self, rects, model, bounds):
+        self.model = model
+        self.bounds = pygame.Rect(bounds)
+        self.index = SpatialHash(model.size[0] * 2)
+        for i, r in enumerate(rects):
+            self.index.insert(_Solid(pygame.Rect(r), i))
+        self._margin = (model.size[0] * 4, model.size[1] * 4)
+        self._region = pygame.Rect(0, 0, 0, 0)
+        self._pending = []
+        box = np.array(rects, dtype=np.int64).reshape(-1, 4)
+        self.left, self.top = box[:, 0], box[:, 1]
+        self.right = box[:, 0] + box[:, 2]
+        self.open = np.ones(len(box), dtype=bool)     # 아직 못 밟은 플랫폼
+        self.floor_open = True
+
+    def candidates(self, rect):
+        """
+        SpatialHash.candidates 와 같은 순서로 충돌 후보를 내지만, 질의 영역을 넓게 잡아 다음 스텝에서도
+        rect 가 그 안에 있으면 질의 결과를 그대로 다시 쓴다
+        """
+        region, pending = self._region, self._pending
+        last = 0
+        i = 0
+        while True:
+            if not region.contains(rect):
+                region = self._region = rect.inflate(self._margin)
+                self._pending = self.index.query(region)
+                pending = [entry for entry in self._pending if entry[0] > last] if last else self._pending
+                i = 0
+            if i >= len(pending):
+                return
+            last, solid = pending[i]
+            i += 1
+            yield solid
+
+    def set_reached(self, reached):
+        self.open[:] = True
+        self.open[[i for i in reached if i >= 0]] = False
+        self.floor_open = -1 not in reached
+
+    def may_land(self, body):
+        """
+        떨어지는 body 가 앞으로 아직 못 밟은 곳(플랫폼 또는 바닥)에 설 수 있는지 (넉넉하게 잡은 추정)
+        남은 낙하 시간 동안 최고 속도로 움직일 수 있는 가로 범위 안에서, 윗면이 body 아래(푸시로 더 뜰 수
+        있으면 그만큼 위까지)에 있는 플랫폼을 찾는다
+        """
+        if self.floor_open:
+            return True
+        m = self.model
+        rect = body.rect
+        push = m.push_skill_power if body.can_push else 0
+        lift = push * push / (2 * m.gravity_const)
+        fall = max(0, self.bounds.bottom - rect.bottom) + lift
+        frames = push / m.gravity_const + math.sqrt(2 * fall / m.gravity_const) + 2
+        reach = max(m.max_velocity_x, push, abs(body.vx)) * frames
+        return bool(np.any(self.open & (self.right > rect.left - reach) & (self.left < rect.right + reach)
+                           & (self.top >= rect.bottom - lift)))
+
+
+def _actions():
+    """땅에 선 상태에서 시도할 입력 묶음 (방향, 점프, 방향을 누르는 프레임 수, 푸시 프레임, 푸시 방향)"""
+    actions = []
+    for d in ("left", "right"):
+        for hold in (4, 12, 24):
+            actions.append((d, False, hold, None, None))
+    for d in (None, "left", "right"):
+        for hold in (6, 12, MAX_FRAMES):
+            actions.append((d, True, hold, None, None))
+        for at in (4, 10, 16):
+            for push in PUSHES:
+                actions.append((d, True, MAX_FRAMES, at, push))
+    return actions
+
+
+ACTIONS = _actions()
+
+
+def _simulate(world, start, action):
+    """
+    start(x, y, vx)에서 입력 묶음을 흉내 낸다
+    반환: (다시 땅에 선 상태 또는 None, 지나가며 착지한 플랫폼 번호 집합 - 바닥은 -1)
+    """
+    d, jump, hold, push_at, push = action
+    body = _Body(start[0], start[1], start[2], world.model)
+    left_ground = False
+    next_check = 0
+    landings = set()
+    for frame in range(MAX_FRAMES):
+        pushing = frame == push_at
+        held = d if frame < hold and not pushing else None
+        landed = body.step(world.model, world, held == "left", held == "right",
+                           push if pushing else None, jump and frame == 0)
+        if landed is not None:
+            landings.add(landed)
+        if not body.on_ground:
+            left_ground = True
+            if body.vy > 0 and frame >= next_check:
+                # 꼭대기를 지났는데 새로 설 곳이 아래에 없으면 더 볼 필요가 없다 (몇 프레임마다 다시 확인)
+                if not world.may_land(body):
+                    return None, landings
+                next_check = frame + APEX_CHECK_FRAMES
+        elif left_ground or (frame >= hold and body.vx == 0):
+            # 공중에 떴다가 다시 섰거나, 걷기를 멈추고 완전히 섰을 때
+            return (body.rect.x, body.rect.y, body.vx), landings
+    return None, landings
+
+
+def _key(state):
+    x, y, vx = state
+    return x // X_BIN, y, round(vx / VX_BIN)
+
+
+def _prune(found, best):
+    """
+    칸(x 구간, y)마다 방향(-1/0/1)별로 가장 빠른 상태만 남긴다 - 같은 칸에서 같은 방향으로 더 빠르거나 같은
+    상태가 이미 펼쳐졌으면(best) 버린다. best 를 갱신하고 새로 펼칠 상태 목록 반환
+    """
+    strongest = {}
+    for state in found:
+        bx, y, v = _key(state)
+        slot = (bx, y, (v > 0) - (v < 0))
+        kept = strongest.get(slot)
+        if kept is None or abs(v) > abs(_key(kept)[2]):
+            strongest[slot] = state
+    frontier = []
+    for slot, state in strongest.items():
+        v = abs(_key(state)[2])
+        if best.get(slot, -1) < v:
+            best[slot] = v
+            frontier.append(state)
+    return frontier
+
+
+_world = None
+
+
+def _init_worker(rects, params, bounds):
+    global _world
+    _world = _World(rects, MovementModel(*params), bounds)
+
+
+def _expand(states, reached=()):
+    """
+    상태 목록을 펼쳐 (새 상태 목록, 착지한 플랫폼 번호 집합) 반환 (작업 프로세스에서 실행)
+    reached: 이 층을 시작할 때까지 밟은 플랫폼 번호 (-1 은 바닥) - 떨어지는 중에 멈출지 판단하는 데 쓴다
+    """
+    _world.set_reached(reached)
+    found = []
+    landings = set()
+    for state in states:
+        for action in ACTIONS:
+            end, landed = _simulate(_world, state, action)
+            landings |= landed
+            if end is not None:
+                found.append(end)
+    return found, landings
+
+
+def _spawn_state(world, spawn):
+    # 스폰 지점에서 입력 없이 떨어져 처음 선 곳
+    body = _Body(spawn[0], spawn[1], 0, world.model)
+    body.on_ground = False
+    landings = set()
+    for _ in range(MAX_FRAMES):
+        landed = body.step(world.model, world)
+        if landed is not None:
+            landings.add(landed)
+            return (body.rect.x, body.rect.y, body.vx), landings
+    return None, landings
+
+
+def content_hash(rects, model, bounds, spawn):
+    h = hashlib.sha256()
+    h.update(json.dumps([ANALYSIS_VERSION, model.params(), list(bounds), list(spawn), MAX_FRAMES, X_BIN, VX_BIN,
+                         APEX_CHECK_FRAMES, ACTIONS]).encode())
+    for r in rects:
+        h.update(b"%d,%d,%d,%d;" % tuple(r))
+    return h.hexdigest()
+
+
+def analyze(rects, model=None, bounds=BOUNDS, spawn=SPAWN, workers=None, cache_dir=CACHE_DIR, batch=64,
+            progress=None):
+    """
+    rects: 플랫폼 (x, y, width, height) 목록 (게임의 충돌 순서와 같도록 맵 순서 그대로)
+    반환: {"platforms", "reachable", "unreachable", "states", "seconds", "cached", "hash"}
+    workers 가 1 이면 프로세스 풀 없이 이 프로세스에서 돈다 (None 이면 CPU 수)
+    progress(layer, states, frontier, reachable)가 있으면 BFS 층마다 부른다
+    """
+    global _world
+    start = time.perf_counter()
+    model = model or MovementModel()
+    rects = [tuple(int(v) for v in r) for r in rects]
+    digest = content_hash(rects, model, bounds, spawn)
+    cache_file = os.path.join(cache_dir, digest + ".json") if cache_dir else None
+    if cache_file and os.path.exists(cache_file):
+        with open(cache_file) as f:
+            result = json.load(f)
+        result["cached"] = True
+        result["seconds"] = time.perf_counter() - start
+        return result
+
+    world = _World(rects, model, bounds)
+    first, reached = _spawn_state(world, spawn)
+    best = {}
+    frontier = _prune([first], best) if first is not None else []
+    states = len(frontier)
+    layer = 0
+
+    workers = workers or os.cpu_count() or 1
+    pool = None
+    if workers > 1:
+        # fork 는 pygame/SDL 상태까지 복제하므로 spawn 으로 띄우고, 맵은 작업 프로세스마다 한 번만 넘긴다
+        pool = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn"),
+                                   initializer=_init_worker, initargs=(rects, model.params(), tuple(bounds)))
+    else:
+        _world = world
+    try:
+        while frontier:
+            if progress is not None:
+                progress(layer, states, len(frontier), sum(1 for i in reached if i >= 0))
+            # 한 층을 작업 프로세스 수보다 넉넉히 쪼개 나눠 준다
+            size = max(1, min(batch, -(-len(frontier) // (workers * 4))))
+            chunks = [frontier[i:i + size] for i in range(0, len(frontier), size)]
+            known = [tuple(reached)] * len(chunks)
+            results = pool.map(_expand, chunks, known) if pool is not None else map(_expand, chunks, known)
+            found = []
+            for states_found, landings in results:
+                reached |= landings
+                found.extend(states_found)
+            frontier = _prune(found, best)
+            states += len(frontier)
+            layer += 1
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    reachable = sorted(i for i in reached if i >= 0)
+    reachable_set = set(reachable)
+    result = {
+        "hash": digest,
+        "platforms": len(rects),
+        "reachable": reachable,
+        "unreachable": [i for i in range(len(rects)) if i not in reachable_set],
+        "states": states,
+        "seconds": time.perf_counter() - start,
+        "cached": False,
+    }
+    if cache_file:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(cache_file, "w") as f:
+            json.dump(result, f)
+    return result
+
+
+def analyze_map(map_data, **kwargs):
+    """MapData (또는 x/y/width/height 를 가진 플랫폼 목록)를 분석"""
+    platforms = getattr(map_data, "platforms", map_data)
+    return analyze([(p.x, p.y, p.width, p.height) for p in platforms], **kwargs)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m engine.reachability",
+                                     description="스폰 지점에서 설 수 있는 플랫폼 분석")
+    parser.add_argument("map", help="맵 파일 (.json/.vmap)")
+    parser.add_argument("--workers", type=int, default=None, help="작업 프로세스 수 (기본: CPU 수, 1 이면 풀 없음)")
+    parser.add_argument("--bounds", nargs=4, type=int, default=list(BOUNDS), metavar=("X", "Y", "W", "H"),
+                        help="이동 가능 영역 (아래 경계는 바닥으로 취급)")
+    parser.add_argument("--spawn", nargs=2, type=int, default=list(SPAWN), metavar=("X", "Y"))
+    parser.add_argument("--cache-dir", default=CACHE_DIR, help="결과 캐시 디렉터리")
+    parser.add_argument("--no-cache", action="store_true")
+    parser.add_argument("--list", type=int, default=20, metavar="N", help="닿을 수 없는 플랫폼을 N 개까지 출력")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON 으로 출력")
+    parser.add_argument("--quiet", action="store_true", help="진행 상황을 출력하지 않음")
+    args = parser.parse_args(argv)
+
+    from map_editor.core import MapData
+    data = MapData()
+    data.load(args.map)
+    def progress(layer, states, frontier, reachable):
+        print(f"\rlayer {layer}: {states} states, {frontier} to expand, {reachable} platforms reached",
+              end="", file=sys.stderr, flush=True)
+
+    result = analyze_map(data, bounds=args.bounds, spawn=args.spawn, workers=args.workers,
+                         cache_dir=None if args.no_cache else args.cache_dir,
+                         progress=None if args.quiet else progress)
+    if not args.quiet and not result["cached"]:
+        print(file=sys.stderr)
+    if args.json:
+        json.dump(result, sys.stdout)
+        print()
+        return 0
+    unreachable = result["unreachable"]
+    print(f"{len(result['reachable'])}/{result['platforms']} platforms reachable, "
+          f"{len(unreachable)} unreachable ({result['states']} states, {result['seconds']:.2f}s"
+          f"{', cached' if result['cached'] else ''})")
+    platforms = data.platforms
+    for i in unreachable[:args.list]:
+        p = platforms[i]
+        print(f"  #{i}: x={p.x} y={p.y} w={p.width} h={p.height}")
+    if len(unreachable) > args.list:
+        print(f"  ... and {len(unreachable) - args.list} more")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,153 @@
+import pygame
+
+
+class FullRedrawRenderer:
+    """
+    기존 방식: 매 프레임 화면 전체를 지우고 모든 스프라이트를 다시 그린 뒤 flip
+    """
+    name = "full"
+
+    def __init__(self, screen, static_sprites, bg_color=(0, 0, 0)):
+        self.screen = screen
+        self.static_sprites = static_sprites
+        self.bg_color = bg_color
+
+    def reset(self):
+        pass
+
+    def invalidate(self, rect=None):
+        pass
+
+    def render(self, dynamic_sprites, overlays=()):
+        self.draw(dynamic_sprites, overlays)
+        self.present()
+
+    def draw(self, dynamic_sprites, overlays=()):
+        self.screen.fill(self.bg_color)
+        self.static_sprites.draw(self.screen)
+        dynamic_sprites.draw(self.screen)
+        for surf, pos in overlays:
+            self.screen.blit(surf, pos)
+
+    def present(self):
+        pygame.display.flip()
+
+
+class StaticLayerRenderer:
+    """
+    정적 플랫폼을 배경 Surface에 한 번만 그려 두고,
+    매 프레임 움직이는 스프라이트/오버레이가 덮었던 영역만 복원 후 다시 그린다
+    display.update(rects)로 바뀐 영역만 화면에 반영
+    """
+    name = "static"
+
+    def __init__(self, screen, static_sprites, bg_color=(0, 0, 0)):
+        self.screen = screen
+        self.static_sprites = static_sprites
+        self.bg_color = bg_color
+        self.background = None
+        self._dirty = []
+        self._drawn = []
+        self._full_update = True
+        self.invalidate()
+
+    def invalidate(self, rect=None):
+        """
+        배경 다시 그리기: rect가 없으면 전체, 있으면 그 영역만
+        플랫폼이 추가/삭제/이동된 뒤 호출한다
+        """
+        if self.background is None or rect is None:
+            self.background = pygame.Surface(self.screen.get_size()).convert()
+            self.background.fill(self.bg_color)
+            self.static_sprites.draw(self.background)
+            self._full_update = True
+            return
+        rect = pygame.Rect(rect).clip(self.background.get_rect())
+        if not rect.width or not rect.height:
+            return
+        self.background.fill(self.bg_color, rect)
+        self.background.set_clip(rect)
+        index = getattr(self.static_sprites, "index", None)
+        sprites = [s for _, s in index.query(rect)] if index is not None else self.static_sprites
+        for sprite in sprites:
+            if sprite.rect.colliderect(rect):
+                self.background.blit(sprite.image, sprite.rect)
+        self.background.set_clip(None)
+        self._dirty.append(rect)
+
+    def reset(self):
+        """다른 렌더러에서 전환될 때 화면 전체를 한 번 갱신"""
+        self._full_update = True
+        self._dirty = []
+
+    def render(self, dynamic_sprites, overlays=()):
+        self.draw(dynamic_sprites, overlays)
+        self.present()
+
+    def draw(self, dynamic_sprites, overlays=()):
+        screen = self.screen
+        background = self.background
+        if self._full_update:
+            screen.blit(background, (0, 0))
+        else:
+            for rect in self._dirty:
+                screen.blit(background, rect, rect)
+
+        drawn = []
+        for sprite in dynamic_sprites:
+            drawn.append(screen.blit(sprite.image, sprite.rect))
+        for surf, pos in overlays:
+            drawn.append(screen.blit(surf, pos))
+        self._drawn = drawn
+
+    def present(self):
+        if self._full_update:
+            pygame.display.flip()
+            self._full_update = False
+        else:
+            pygame.display.update(self._dirty + self._drawn)
+        # 다음 프레임에 복원해야 할 영역
+        self._dirty = self._drawn
+
+
+class CameraRenderer:
+    """
+    스크롤 레벨용: 카메라 영역과 겹치는 플랫폼만 공간 인덱스로 골라 그린다 (뷰포트 컬링)
+    프레임당 작업량은 레벨 전체 크기가 아니라 화면에 보이는 양에 비례한다
+    """
+    name = "camera"
+
+    def __init__(self, screen, static_sprites, camera, bg_color=(0, 0, 0)):
+        self.screen = screen
+        self.static_sprites = static_sprites
+        self.camera = camera
+        self.bg_color = bg_color
+
+    def reset(self):
+        pass
+
+    def invalidate(self, rect=None):
+        pass
+
+    def render(self, dynamic_sprites, overlays=()):
+        self.draw(dynamic_sprites, overlays)
+        self.present()
+
+    def draw(self, dynamic_sprites, overlays=()):
+        screen = self.screen
+        view = self.camera.rect
+        ox, oy = view.topleft
+        screen.fill(self.bg_color)
+        blit = screen.blit
+        for _, sprite in self.static_sprites.index.query(view):
+            r = sprite.rect
+            if r.colliderect(view):
+                blit(sprite.image, (r.x - ox, r.y - oy))
+        for sprite in dynamic_sprites:
+            r = sprite.rect
+            blit(sprite.image, (r.x - ox, r.y - oy))
+        for surf, pos in overlays:
+            blit(surf, pos)
+
+    def present(self):
+        pygame.display.flip()
@@ -0,0 +1,147 @@
+"""
+입력 기록/재생 (.vrep, little-endian)
+
+    헤더   : magic(4s) version(H) key_count(H) count(I) sim_step(d) checksum(Q) meta_size(I) pad(4x)
+    키     : pygame 키 코드(I) * key_count  - 비트 i 가 i 번째 키
+    메타   : UTF-8 JSON meta_size 바이트 (맵 파일, 충돌 방식 등) - 4바이트 경계까지 0 으로 채움
+    레코드 : keys(I) mouse_x(i) mouse_y(i)  - 물리 스텝마다 12바이트
+
+렌더 프레임이 아니라 물리 스텝마다 남기므로 재생은 프레임 속도와 상관없이 같은 입력을 같은 스텝에 넣는다.
+기록을 끝낼 때 마지막 상태의 checksum 을 헤더에 써 두고, 재생 후 같은 값이 나오는지로 결과를 검증한다
+"""
+import json
+import struct
+import hashlib
+from collections import defaultdict
+
+import numpy as np
+import pygame
+
+MAGIC = b"VNGR"
+VERSION = 1
+EXTENSION = ".vrep"
+
+HEADER = struct.Struct("<4sHHIdQI4x")
+RECORD_DTYPE = [("keys", "<u4"), ("mouse_x", "<i4"), ("mouse_y", "<i4")]
+_RECORD = struct.Struct("<Iii")
+
+# Player.update 가 읽는 키들
+TRACKED_KEYS = (
+    pygame.K_LEFT, pygame.K_a, pygame.K_RIGHT, pygame.K_d, pygame.K_c,
+    pygame.K_UP, pygame.K_w, pygame.K_SPACE,
+)
+
+# 체크섬에 넣는 플레이어 상태: rect(x, y, w, h), 소수점 위치, 속도, 플래그, 방향
+_STATE = struct.Struct("<iiiiddddBBBB")
+
+
+def state_checksum(player):
+    """플레이어 상태의 64비트 해시 - 재생 결과가 기록 때와 같은지 비교하는 데 쓴다"""
+    r = player.rect
+    data = _STATE.pack(
+        r.x, r.y, r.width, r.height,
+        float(player.pos_x), float(player.pos_y), float(player.velocity_x), float(player.velocity_y),
+        bool(player.on_ground), bool(player.can_push), bool(player.facing_right), player.facing_clamp.value,
+    )
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "little")
+
+
+class InputRecorder:
+    """
+    물리 스텝마다 record(keys, mouse_pos)로 입력을 흘려 쓰고, close(checksum) 때 헤더를 채운다
+    keys 는 pygame.key.get_pressed() 처럼 키 코드로 인덱싱되는 것이면 된다
+    """
+    def __init__(self, filename, sim_step, keys=TRACKED_KEYS, meta=None):
+        self.keys = tuple(keys)
+        if len(self.keys) > 32:
+            raise ValueError("at most 32 keys can be recorded")
+        self.sim_step = sim_step
+        self.count = 0
+        meta = json.dumps(meta or {}).encode("utf-8")
+        self._meta = meta + bytes(-len(meta) % 4)
+        self._f = open(filename, "wb")
+        self._write_header(0)
+        self._f.write(struct.pack(f"<{len(self.keys)}I", *self.keys))
+        self._f.write(self._meta)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _write_header(self, checksum):
+        self._f.write(HEADER.pack(MAGIC, VERSION, len(self.keys), self.count, self.sim_step, checksum,
+                                  len(self._meta)))
+
+    def bits(self, keys):
+        bits = 0
+        for i, code in enumerate(self.keys):
+            if keys[code]:
+                bits |= 1 << i
+        return bits
+
+    def record(self, keys, mouse_pos):
+        self._f.write(_RECORD.pack(self.bits(keys), int(mouse_pos[0]), int(mouse_pos[1])))
+        self.count += 1
+
+    def close(self, checksum=0):
+        if self._f.closed:
+            return
+        self._f.seek(0)
+        self._write_header(checksum)
+        self._f.close()
+
+
+class InputLog:
+    """기록 파일 전체를 읽어 둔 입력 로그 - records 는 RECORD_DTYPE 구조체 배열"""
+    def __init__(self, filename):
+        with open(filename, "rb") as f:
+            data = f.read()
+        if len(data) < HEADER.size:
+            raise ValueError(f"not an input recording: {filename}")
+        magic, version, key_count, count, sim_step, checksum, meta_size = HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ValueError(f"not an input recording: {filename}")
+        if version != VERSION:
+            raise ValueError(f"unsupported input recording version: {version}")
+        offset = HEADER.size
+        self.keys = struct.unpack_from(f"<{key_count}I", data, offset)
+        offset += 4 * key_count
+        self.meta = json.loads(data[offset:offset + meta_size].rstrip(b"\0") or b"{}")
+        offset += meta_size
+        self.records = np.frombuffer(data, dtype=RECORD_DTYPE, count=count, offset=offset)
+        self.sim_step = sim_step
+        self.checksum = checksum
+        self.filename = filename
+
+    def __len__(self):
+        return len(self.records)
+
+    def steps(self):
+        """스텝마다 (키 상태, 마우스 위치) - 키 상태는 같은 비트 조합끼리 같은 dict 를 다시 쓴다"""
+        states = {}
+        codes = self.keys
+        for bits, mx, my in zip(self.records["keys"].tolist(), self.records["mouse_x"].tolist(),
+                                self.records["mouse_y"].tolist()):
+            state = states.get(bits)
+            if state is None:
+                state = states[bits] = defaultdict(bool, {code: True for i, code in enumerate(codes) if bits >> i & 1})
+            yield state, (mx, my)
+
+
+def replay(log, player, dt=1, before_step=None):
+    """
+    log 의 입력을 player 에 그대로 넣어 끝까지 돌리고 마지막 상태의 checksum 반환
+    렌더링도 프레임 제한도 없으므로 CPU 가 허락하는 만큼 빠르게 돈다
+    before_step(player)가 있으면 스텝마다 먼저 부른다 (청크 스트리밍 등)
+    """
+    update = player.update
+    if before_step is None:
+        for keys, mouse_pos in log.steps():
+            update(keys, mouse_pos, dt=dt)
+    else:
+        for keys, mouse_pos in log.steps():
+            before_step(player)
+            update(keys, mouse_pos, dt=dt)
+    return state_checksum(player)
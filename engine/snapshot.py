@@ -0,0 +1,110 @@
+"""
+게임 상태 스냅샷: 플레이어 상태를 고정 크기 struct 로 묶어 미리 잡아 둔 링 버퍼에 매 프레임 찍는다
+
+    레코드 : frame(I) layout(I) x(i) y(i) width(i) height(i)
+             pos_x(d) pos_y(d) velocity_x(d) velocity_y(d) facing_angle(d)
+             on_ground(B) can_push(B) facing_right(B) is_jumping(B) facing_clamp(B) pad(3x)  - 72바이트
+    파일   : magic(4s) version(H) pad(2x) + 레코드 하나 (.vsnap)
+
+찍기는 bytearray 의 정해진 칸에 pack_into 하는 것뿐이라 할당이 없고, 되감기는 칸 번호 계산 한 번이다
+플랫폼은 저장하지 않고 레벨 구성 id(layout: PlatformGroup.layout 또는 ChunkedLevel.layout)만 남긴다
+- 되돌릴 때 맵이 바뀌었는지 확인하는 용도
+"""
+import struct
+
+MAGIC = b"VNGS"
+VERSION = 2
+EXTENSION = ".vsnap"
+
+SNAPSHOT = struct.Struct("<IIiiiidddddBBBBB3x")
+_FILE_HEADER = struct.Struct("<4sHxx")
+
+
+def _fields(player, frame, layout):
+    r = player.rect
+    return (frame, layout, r.x, r.y, r.width, r.height,
+            player.pos_x, player.pos_y, player.velocity_x, player.velocity_y, player.facing_angle_deg,
+            player.on_ground, player.can_push, player.facing_right, player.is_jumping, player.facing_clamp.value)
+
+
+def take_snapshot(player, frame=0, layout=0):
+    """player 상태를 SNAPSHOT 바이트로"""
+    return SNAPSHOT.pack(*_fields(player, frame, layout))
+
+
+def snapshot_info(data):
+    """SNAPSHOT 바이트의 (frame, layout) - 되돌리기 전에 레벨 구성이 같은지 확인할 때"""
+    return SNAPSHOT.unpack_from(data)[:2]
+
+
+def restore_snapshot(player, data):
+    """SNAPSHOT 바이트를 player 에 되돌리고 (frame, layout) 반환"""
+    (frame, layout, x, y, w, h, pos_x, pos_y, vx, vy, angle,
+     on_ground, can_push, facing_right, is_jumping, facing) = SNAPSHOT.unpack_from(data)
+    player.rect.update(x, y, w, h)
+    player.prev_pos = player.rect.topleft     # 보간이 되감기 전 위치에서 출발하지 않도록
+    player.pos_x, player.pos_y = pos_x, pos_y
+    player.velocity_x, player.velocity_y = vx, vy
+    player.facing_angle_deg = angle
+    player.on_ground, player.can_push = bool(on_ground), bool(can_push)
+    player.facing_right, player.is_jumping = bool(facing_right), bool(is_jumping)
+    player.facing_clamp = type(player.facing_clamp)(facing)
+    return frame, layout
+
+
+def save_snapshot(filename, data):
+    with open(filename, "wb") as f:
+        f.write(_FILE_HEADER.pack(MAGIC, VERSION))
+        f.write(data)
+
+
+def load_snapshot(filename):
+    with open(filename, "rb") as f:
+        raw = f.read()
+    if len(raw) != _FILE_HEADER.size + SNAPSHOT.size:
+        raise ValueError(f"not a snapshot file: {filename}")
+    magic, version = _FILE_HEADER.unpack_from(raw)
+    if magic != MAGIC:
+        raise ValueError(f"not a snapshot file: {filename}")
+    if version != VERSION:
+        raise ValueError(f"unsupported snapshot version: {version}")
+    return raw[_FILE_HEADER.size:]
+
+
+class SnapshotRing:
+    """
+    최근 capacity 개 스냅샷을 담는 고정 크기 링 버퍼
+    capture()는 새 칸에 덮어쓰고, rewind(n)은 n 개 전 스냅샷으로 되돌린 뒤 그보다 새 것들을 버린다
+    """
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self._buf = bytearray(SNAPSHOT.size * capacity)
+        self._view = memoryview(self._buf)
+        self.count = 0          # 지금까지 찍은 수 (덮어쓴 것 포함) - 다음에 쓸 칸 번호
+        self.valid = 0          # 아직 덮어쓰이지 않고 되감을 수 있는 수
+
+    def __len__(self):
+        return self.valid
+
+    def capture(self, player, frame=0, layout=0):
+        SNAPSHOT.pack_into(self._buf, (self.count % self.capacity) * SNAPSHOT.size, *_fields(player, frame, layout))
+        self.count += 1
+        self.valid = min(self.valid + 1, self.capacity)
+
+    def get(self, back=0):
+        """back 개 전 스냅샷 (0 = 가장 최근) - 링 버퍼를 가리키는 memoryview 이므로 오래 둘 거면 bytes() 로 복사"""
+        if not 0 <= back < len(self):
+            raise IndexError(f"no snapshot {back} frames back (have {len(self)})")
+        offset = ((self.count - 1 - back) % self.capacity) * SNAPSHOT.size
+        return self._view[offset:offset + SNAPSHOT.size]
+
+    def rewind(self, player, back=1):
+        """back 개 전 스냅샷을 player 에 되돌리고 (frame, layout) 반환 - 그 뒤의 스냅샷은 버린다"""
+        result = restore_snapshot(player, self.get(back))
+        self.count -= back
+        self.valid -= back
+        return result
+
+    def clear(self):
+        self.count = 0
+        self.valid = 0
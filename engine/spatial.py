@@ -0,0 +1,160 @@
+import zlib
+
+import pygame
+
+
+class SpatialHash:
+    """
+    균일 격자(spatial hash) 브로드페이즈: 셀 크기 단위로 스프라이트를 등록하고
+    사각형 주변의 후보만 추가(삽입) 순서대로 돌려준다
+    """
+    def __init__(self, cell_size):
+        self.cell_size = cell_size
+        self.cells = {}
+        self._entries = {}   # sprite -> (seq, 등록된 셀 키 목록)
+        self._seq = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, sprite):
+        return sprite in self._entries
+
+    def _cell_range(self, rect):
+        cs = self.cell_size
+        x0, y0 = rect.left // cs, rect.top // cs
+        # 폭/높이가 0인 사각형도 최소 한 칸은 차지하도록 처리
+        x1 = (rect.right - 1) // cs if rect.width > 0 else x0
+        y1 = (rect.bottom - 1) // cs if rect.height > 0 else y0
+        return x0, y0, x1, y1
+
+    def _keys(self, rect):
+        x0, y0, x1, y1 = self._cell_range(rect)
+        return [(cx, cy) for cy in range(y0, y1 + 1) for cx in range(x0, x1 + 1)]
+
+    def insert(self, sprite, seq=None):
+        """
+        seq 를 주면 삽입 순서 대신 그 값으로 후보 순서를 정한다 - 청크 레벨처럼 불러오는 순서가 실행마다
+        달라도 충돌 처리 순서(타일 이음매에서 결과가 갈림)가 같게 하려고 쓴다
+        """
+        if sprite in self._entries:
+            self.remove(sprite)
+        keys = self._keys(sprite.rect)
+        if seq is None:
+            self._seq += 1
+            seq = self._seq
+        self._entries[sprite] = (seq, keys)
+        for key in keys:
+            self.cells.setdefault(key, {})[sprite] = seq
+
+    def remove(self, sprite):
+        entry = self._entries.pop(sprite, None)
+        if entry is None:
+            return
+        for key in entry[1]:
+            cell = self.cells[key]
+            del cell[sprite]
+            if not cell:
+                del self.cells[key]
+
+    def move(self, sprite):
+        """sprite.rect가 바뀐 뒤 호출: 삽입 순서는 유지한 채 셀만 다시 계산"""
+        entry = self._entries.get(sprite)
+        if entry is None:
+            self.insert(sprite)
+            return
+        seq, old_keys = entry
+        new_keys = self._keys(sprite.rect)
+        if new_keys == old_keys:
+            return
+        for key in old_keys:
+            cell = self.cells[key]
+            del cell[sprite]
+            if not cell:
+                del self.cells[key]
+        for key in new_keys:
+            self.cells.setdefault(key, {})[sprite] = seq
+        self._entries[sprite] = (seq, new_keys)
+
+    def clear(self):
+        self.cells.clear()
+        self._entries.clear()
+
+    def query(self, rect, after=0):
+        """rect와 겹칠 수 있는 셀의 스프라이트를 삽입 순서대로 반환 (seq > after 만)"""
+        x0, y0, x1, y1 = self._cell_range(rect)
+        found = {}
+        cells = self.cells
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                cell = cells.get((cx, cy))
+                if cell:
+                    found.update(cell)
+        if after:
+            return sorted((seq, s) for s, seq in found.items() if seq > after)
+        return sorted((seq, s) for s, seq in found.items())
+
+    def candidates(self, rect, margin=None):
+        """
+        충돌 후보를 삽입 순서대로 yield 하는 제너레이터
+        rect가 충돌 처리 중에 움직이더라도 질의 영역을 벗어나면 다시 질의하므로
+        전체 목록을 순서대로 도는 것과 같은 결과를 보장한다
+        """
+        if margin is None:
+            margin = (rect.width, rect.height)
+        region = rect.inflate(margin[0] * 2, margin[1] * 2)
+        last = 0
+        pending = self.query(region)
+        i = 0
+        while True:
+            if not region.contains(rect):
+                region = rect.inflate(margin[0] * 2, margin[1] * 2)
+                pending = self.query(region, after=last)
+                i = 0
+            if i >= len(pending):
+                return
+            last, sprite = pending[i]
+            i += 1
+            yield sprite
+
+
+class PlatformGroup(pygame.sprite.Group):
+    """
+    SpatialHash를 함께 관리하는 스프라이트 그룹
+    add/remove 시 인덱스가 자동으로 갱신된다
+    layout 은 지금 들어 있는 플랫폼 사각형들의 32비트 내용 해시 (순서 무관, 추가/삭제 때 증분 갱신)
+    - 스냅샷이 어떤 구성에서 찍혔는지 구분하는 데 쓴다
+    스프라이트에 order 속성이 있으면 그 값이 충돌 후보 순서가 된다 (SpatialHash.insert 의 seq)
+    """
+    def __init__(self, cell_size, *sprites):
+        self.index = SpatialHash(cell_size)
+        self.layout = 0
+        self._hashes = {}    # sprite -> layout 에 더한 값
+        super().__init__(*sprites)
+
+    def _add_hash(self, sprite):
+        h = zlib.crc32(b"%d,%d,%d,%d" % tuple(sprite.rect))
+        self._hashes[sprite] = h
+        self.layout = (self.layout + h) & 0xFFFFFFFF
+
+    def _remove_hash(self, sprite):
+        self.layout = (self.layout - self._hashes.pop(sprite)) & 0xFFFFFFFF
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self.index.insert(sprite, getattr(sprite, "order", None))
+        self._add_hash(sprite)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self.index.remove(sprite)
+        self._remove_hash(sprite)
+
+    def moved(self, sprite):
+        """플랫폼의 rect를 직접 바꾼 경우 인덱스 갱신"""
+        self.index.move(sprite)
+        self._remove_hash(sprite)
+        self._add_hash(sprite)
+
+    def candidates(self, rect, margin=None):
+        return self.index.candidates(rect, margin)
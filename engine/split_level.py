@@ -0,0 +1,22 @@
+"""
+맵 JSON을 청크 레벨 디렉터리로 변환
+
+    python -m engine.split_level map.json level_dir [--chunk-size W H]
+"""
+import argparse
+from map_editor.core import load_platforms
+from engine.chunks import write_chunked_level
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="맵 JSON을 청크 레벨 디렉터리로 변환")
+    parser.add_argument("source", help="맵 JSON 파일")
+    parser.add_argument("directory", help="출력 디렉터리")
+    parser.add_argument("--chunk-size", type=int, nargs=2, default=(640, 480), metavar=("W", "H"))
+    args = parser.parse_args(argv)
+    manifest = write_chunked_level(load_platforms(args.source), args.directory, tuple(args.chunk_size))
+    print(f"{len(manifest['chunks'])} chunks written to {args.directory}")
+
+
+if __name__ == "__main__":
+    main()
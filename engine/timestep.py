@@ -0,0 +1,54 @@
+import pygame
+
+
+class FixedTimestep:
+    """
+    고정 시간 간격 시뮬레이션용 누산기(accumulator)
+    렌더 프레임마다 흐른 시간을 쌓아 두고 step 단위로 물리 스텝 횟수를 돌려준다
+    한 프레임에 max_steps 를 넘으면 남은 시간을 버려서 death spiral 을 막는다
+    """
+    def __init__(self, step=1 / 60, max_steps=5):
+        self.step = step
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.dropped = 0.0      # max_steps 때문에 버린 누적 시간(초)
+
+    def advance(self, frame_time):
+        """frame_time(초)만큼 시간을 흘리고 이번 프레임에 실행할 스텝 수 반환"""
+        self.accumulator += frame_time
+        steps = int(self.accumulator // self.step)
+        if steps > self.max_steps:
+            self.dropped += (steps - self.max_steps) * self.step
+            steps = self.max_steps
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= steps * self.step
+        return steps
+
+    @property
+    def alpha(self):
+        """직전 스텝과 다음 스텝 사이의 보간 비율 (0~1)"""
+        return min(self.accumulator / self.step, 1.0)
+
+    def reset(self):
+        self.accumulator = 0.0
+
+
+class InterpolatedView(pygame.sprite.Sprite):
+    """
+    렌더링 전용 스프라이트: 대상의 직전/현재 위치 사이를 보간해 그린다
+    대상은 prev_pos 속성(직전 스텝의 topleft)을 가져야 한다
+    """
+    def __init__(self, target):
+        super().__init__()
+        self.target = target
+        self.rect = target.rect.copy()
+
+    @property
+    def image(self):
+        return self.target.image
+
+    def sync(self, alpha=1.0):
+        x0, y0 = self.target.prev_pos
+        x1, y1 = self.target.rect.topleft
+        self.rect.topleft = (round(x0 + (x1 - x0) * alpha), round(y0 + (y1 - y0) * alpha))
@@ -1,24 +1,46 @@
 import os
+import sys
+import time
+import argparse
+from collections import defaultdict
 import pygame
 import math
 from data import Facing
-from map_editor.core import load_platforms
-from value_plotter import plot_value
+from map_editor.core import EditablePlatform, load_platforms
+from map_editor.optimize import merge_platforms, format_stats
+from map_editor.binary import BinaryMap, is_binary_map
+from engine import (
+    PlatformGroup, FullRedrawRenderer, StaticLayerRenderer, AssetManager,
+    FixedTimestep, InterpolatedView, move_swept,
+    Camera, CameraRenderer, ChunkedLevel, ChunkStreamer, is_chunked_level,
+    CachedText, FrameProfiler, ProfilerOverlay,
+    InputLog, InputRecorder, replay, state_checksum,
+    SnapshotRing, load_snapshot, restore_snapshot, save_snapshot, snapshot_info,
+    MapWatcher,
+)
 
 # 기본 설정
 WIDTH = 640
 HEIGHT = 480
 FPS = 60
 TILE_SIZE = 40
-
-# 파이게임 초기화
-pygame.init()
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Platformer Game")
-clock = pygame.time.Clock()
-
-# 폰트 초기화
-font = pygame.font.SysFont(None, 24)
+# Player 가 쓰는 스프라이트 (나머지 assets/ 이미지는 불러오지 않는다)
+PLAYER_ASSETS = ('Idle', 'Move')
+# 렌더링 방식: "static" (배경 캐시 + dirty rect) / "full" (매 프레임 전체 다시 그리기)
+# 게임 중 F2로 전환해 프레임 시간을 비교할 수 있다
+RENDER_MODE = "static"
+# 물리 스텝 간격(초)과 한 렌더 프레임에 허용하는 최대 스텝 수
+# Player의 물리 상수들은 모두 BASE_STEP(1/60초) 기준 값이고,
+# SIM_STEP을 키우면 Player.update의 dt(= SIM_STEP / BASE_STEP)로 보정된다
+BASE_STEP = 1 / 60
+SIM_STEP = BASE_STEP
+MAX_STEPS_PER_FRAME = 5
+# 맵 JSON 파일 또는 청크 레벨 디렉터리 (engine.chunks 로 변환)
+MAP_FILE = "./map_editor/tester.json"
+# 되감기: 최근 몇 초의 프레임별 스냅샷을 남길지 (Backspace 를 누르고 있으면 한 프레임씩 되감음)
+REWIND_SECONDS = 10
+# F5 / F9 빠른 저장 / 불러오기 파일
+QUICKSAVE_FILE = "quicksave.vsnap"
 
 # Platform 클래스
 class Platform(pygame.sprite.Sprite):
@@ -27,19 +49,24 @@ class Platform(pygame.sprite.Sprite):
         self.image = pygame.Surface((width, height))
         self.image.fill(color)
         self.rect = self.image.get_rect(topleft=(x,y))
+        self.color = color  # 맵 핫 리로드에서 파일의 플랫폼과 비교할 때 쓴다
 
 # Player 클래스
 class Player(pygame.sprite.Sprite):
-    def __init__(self):
+    def __init__(self, assets, platforms, bounds=None):
         super().__init__()
-        self.image_idle = pygame.image.load(os.path.join('assets', 'Idle.png')).convert_alpha()
-        self.image_idle = pygame.transform.scale(self.image_idle, (TILE_SIZE, TILE_SIZE))
-        self.image_move = pygame.image.load(os.path.join('assets', 'Move.png')).convert_alpha()
-        self.image_move = pygame.transform.scale(self.image_move, (TILE_SIZE, TILE_SIZE))
-        self.image = self.image_idle
+        self.platforms = platforms
+        # 이동 가능 영역 (기본: 한 화면)
+        self.bounds = pygame.Rect(bounds) if bounds is not None else pygame.Rect(0, 0, WIDTH, HEIGHT)
+        # (facing_right) -> 프레임, 아틀라스에서 미리 꺼내 둔다
+        self.frames_idle = {True: assets.frame('Idle'), False: assets.frame('Idle', flipped=True)}
+        self.frames_move = {True: assets.frame('Move'), False: assets.frame('Move', flipped=True)}
+        self.image = self.frames_idle[True]
         self.rect = self.image.get_rect()
         self.rect.x = 100
         self.rect.y = 100
+        self.prev_pos = self.rect.topleft  # 직전 스텝 위치 (렌더 보간용)
+        self.pos_x, self.pos_y = self.rect.topleft  # swept 모드의 소수점 위치
         self.facing_right = True
         self.facing_angle_deg = 0
         self.facing_clamp = Facing.NORTH
@@ -55,15 +82,21 @@ class Player(pygame.sprite.Sprite):
         self.is_jumping = False
         self.can_push = True  # 새로운 변수 추가: 푸시 스킬 사용 가능 여부
         self.on_ground = False
+        # 충돌 처리 방식: "discrete" (이동 후 겹침 검사) / "swept" (연속 충돌, 큰 dt·고속에서도 관통 없음)
+        self.collision_mode = "discrete"
+        self.profiler = None  # FrameProfiler: 이동/충돌 시간을 physics/collision 단계로 나눠 잰다
+
+    def update(self, keys, mouse_pos=None, dt=1):
+        # dt: BASE_STEP 단위 경과 시간 (1 = 기존 한 프레임)
+        self.prev_pos = self.rect.topleft
 
-    def update(self, keys):
         # 이동 처리
         if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-            self.velocity_x -= self.acceleration
+            self.velocity_x -= self.acceleration * dt
             if self.facing_right:
                 self.facing_right = False
         elif keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-            self.velocity_x += self.acceleration
+            self.velocity_x += self.acceleration * dt
             if not self.facing_right:
                 self.facing_right = True
         elif keys[pygame.K_c] and self.can_push:
@@ -77,7 +110,7 @@ class Player(pygame.sprite.Sprite):
             elif self.facing_clamp == Facing.WEST:
                 self.velocity_x = self.push_skill_power
         else:
-            self.apply_friction()
+            self.apply_friction(dt)
 
         self.velocity_x = max(-self.max_velocity_x, min(self.velocity_x, self.max_velocity_x))
 
@@ -85,62 +118,42 @@ class Player(pygame.sprite.Sprite):
             if self.on_ground:
                 self.jump()
 
-        # X축 이동
-        self.rect.x += self.velocity_x
-
-        # Y축 이동
-        self.velocity_y += self.gravity_const
-        old_bottom = self.rect.bottom
-        self.rect.y += self.velocity_y
-
-        # 플랫폼 충돌 처리
-        self.on_ground = False
-        for platform in platforms:
-            if self.rect.colliderect(platform.rect):
-                # 위에서 떨어질 때 (착지)
-                if self.velocity_y > 0 and old_bottom <= platform.rect.top < self.rect.bottom:
-                    self.rect.bottom = platform.rect.top
-                    self.velocity_y = 0
-                    self.on_ground = True
-                    self.can_push = True
-                # 아래에서 점프해 부딪힐 때
-                elif self.velocity_y < 0 and self.rect.top <= platform.rect.bottom < self.rect.top - self.velocity_y:
-                    self.rect.top = platform.rect.bottom
-                    self.velocity_y = 0
-                # 왼쪽 또는 오른쪽으로 부딪힐 때 (수평 충돌 처리)
-                if self.velocity_x > 0 and self.rect.right > platform.rect.left and self.rect.left < platform.rect.left:
-                    self.rect.right = platform.rect.left
-                    self.velocity_x = 0  # 수평 속도 0
-                elif self.velocity_x < 0 and self.rect.left < platform.rect.right and self.rect.right > platform.rect.right:
-                    self.rect.left = platform.rect.right
-                    self.velocity_x = 0  # 수평 속도 0
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.mark("physics")
+        if self.collision_mode == "swept":
+            self.move_swept(dt)
+        else:
+            self.move_discrete(dt)
+        if profiler is not None:
+            profiler.mark("collision")
 
         # 바닥과 충돌
-        if self.rect.bottom > HEIGHT:
-            self.rect.bottom = HEIGHT
+        if self.rect.bottom > self.bounds.bottom:
+            self.rect.bottom = self.bounds.bottom
             self.velocity_y = 0
             self.on_ground = True
             self.can_push = True
 
         # 이미지 설정
         if abs(self.velocity_x) > 0.5:
-            self.image = self.image_move if self.facing_right else pygame.transform.flip(self.image_move, True, False)
+            self.image = self.frames_move[self.facing_right]
         else:
-            self.image = self.image_idle if self.facing_right else pygame.transform.flip(self.image_idle, True, False)
+            self.image = self.frames_idle[self.facing_right]
 
         # 화면 경계 제한
-        if self.rect.left < 0:
-            self.rect.left = 0
+        if self.rect.left < self.bounds.left:
+            self.rect.left = self.bounds.left
             self.velocity_x = 0
-        if self.rect.right > WIDTH:
-            self.rect.right = WIDTH
+        if self.rect.right > self.bounds.right:
+            self.rect.right = self.bounds.right
             self.velocity_x = 0
-        if self.rect.top < 0:
-            self.rect.top = 0
+        if self.rect.top < self.bounds.top:
+            self.rect.top = self.bounds.top
             self.velocity_y = 0
 
         # 마우스 방향 계산
-        mousePos = pygame.mouse.get_pos()
+        mousePos = pygame.mouse.get_pos() if mouse_pos is None else mouse_pos
         self.facing_angle_deg = math.degrees(
             math.atan2(
                 -(mousePos[1] - self.rect.y),
@@ -157,14 +170,66 @@ class Player(pygame.sprite.Sprite):
         else:
             self.facing_clamp = Facing.EAST
 
-    def apply_friction(self):
+    def move_discrete(self, dt=1):
+        # X축 이동
+        self.rect.x += self.velocity_x * dt
+
+        # Y축 이동
+        self.velocity_y += self.gravity_const * dt
+        old_bottom = self.rect.bottom
+        self.rect.y += self.velocity_y * dt
+
+        # 플랫폼 충돌 처리
+        self.on_ground = False
+        for platform in self.platforms.candidates(self.rect):
+            if self.rect.colliderect(platform.rect):
+                # 위에서 떨어질 때 (착지)
+                if self.velocity_y > 0 and old_bottom <= platform.rect.top < self.rect.bottom:
+                    self.rect.bottom = platform.rect.top
+                    self.velocity_y = 0
+                    self.on_ground = True
+                    self.can_push = True
+                # 아래에서 점프해 부딪힐 때
+                elif self.velocity_y < 0 and self.rect.top <= platform.rect.bottom < self.rect.top - self.velocity_y * dt:
+                    self.rect.top = platform.rect.bottom
+                    self.velocity_y = 0
+                # 왼쪽 또는 오른쪽으로 부딪힐 때 (수평 충돌 처리)
+                if self.velocity_x > 0 and self.rect.right > platform.rect.left and self.rect.left < platform.rect.left:
+                    self.rect.right = platform.rect.left
+                    self.velocity_x = 0  # 수평 속도 0
+                elif self.velocity_x < 0 and self.rect.left < platform.rect.right and self.rect.right > platform.rect.right:
+                    self.rect.left = platform.rect.right
+                    self.velocity_x = 0  # 수평 속도 0
+
+    def move_swept(self, dt=1):
+        # 연속 충돌: 이번 스텝의 변위를 따라 처음 닿는 면부터 순서대로 처리
+        # rect가 외부에서 바뀌었으면(경계 보정 등) 소수점 위치를 다시 맞춘다
+        if (round(self.pos_x), round(self.pos_y)) != self.rect.topleft:
+            self.pos_x, self.pos_y = self.rect.topleft
+        self.velocity_y += self.gravity_const * dt
+        x, y, hit_x, hit_y, landed = move_swept(
+            self.pos_x, self.pos_y, self.rect.width, self.rect.height,
+            self.velocity_x * dt, self.velocity_y * dt, self.platforms.index
+        )
+        self.on_ground = False
+        if hit_x:
+            self.velocity_x = 0
+        if hit_y:
+            self.velocity_y = 0
+        if landed:
+            self.on_ground = True
+            self.can_push = True
+        self.pos_x, self.pos_y = x, y
+        self.rect.topleft = (round(x), round(y))
+
+    def apply_friction(self, dt=1):
         if abs(self.velocity_x) > 0:
             if self.velocity_x > 0:
-                self.velocity_x -= self.friction
+                self.velocity_x -= self.friction * dt
                 if self.velocity_x < 0:
                     self.velocity_x = 0
             else:
-                self.velocity_x += self.friction
+                self.velocity_x += self.friction * dt
                 if self.velocity_x > 0:
                     self.velocity_x = 0
 
@@ -174,30 +239,331 @@ class Player(pygame.sprite.Sprite):
         self.on_ground = False
 
 # 맵 데이터 로드
-platforms = pygame.sprite.Group()
-loaded = load_platforms("./map_editor/tester.json")
-for p in loaded:
-    platforms.add(Platform(p.x, p.y, p.width, p.height, p.color))
-
-# 스프라이트 그룹
-all_sprites = pygame.sprite.Group()
-player = Player()
-all_sprites.add(player)
-all_sprites.add(*platforms)
-
-# 메인 루프
-running = True
-while running:
-    clock.tick(FPS)
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
-    keys = pygame.key.get_pressed()
-    player.update(keys)
-    screen.fill((0, 0, 0))
-    all_sprites.draw(screen)
-    fps_text = font.render(f"FPS: {clock.get_fps():.1f}", True, (255,255,255))
-    screen.blit(fps_text, (10,10))
-    pygame.display.flip()
-
-pygame.quit()
+def make_platform(p):
+    return Platform(p.x, p.y, p.width, p.height, p.color)
+
+def check_merge(merge, collision):
+    # 합친 맵은 swept 충돌에서만 원래 맵과 결과가 같다 (discrete 는 타일 이음매에 걸리므로 달라짐)
+    if merge and collision != "swept":
+        raise ValueError("merged levels require swept collision")
+
+def load_level(filename=MAP_FILE, merge=False, stats=None):
+    # merge: 붙어 있는 같은 색 타일을 큰 사각형으로 합쳐서 충돌 후보/블릿 수를 줄인다 (swept 충돌 전용, check_merge)
+    # stats: dict 를 주면 합친 결과(before/after)를 채운다 - 보여 줄지는 부르는 쪽이 정한다
+    platforms = PlatformGroup(TILE_SIZE)
+    if merge:
+        merged, merge_stats = merge_platforms(load_platforms(filename), EditablePlatform)
+        if stats is not None:
+            stats.update(merge_stats)
+        for p in merged:
+            platforms.add(make_platform(p))
+        return platforms
+    if is_binary_map(filename):
+        # 바이너리 맵은 mmap 으로 레코드를 바로 읽는다 (중간 객체 없음)
+        with BinaryMap(filename) as records:
+            for x, y, w, h, color, _ in records:
+                platforms.add(Platform(x, y, w, h, color))
+        return platforms
+    for p in load_platforms(filename):
+        platforms.add(make_platform(p))
+    return platforms
+
+# 게임 실행 (창 + 고정 스텝 물리 + 렌더 보간)
+def run(map_file=MAP_FILE, render_mode=RENDER_MODE, fps=FPS, interpolate=True,
+        sim_step=SIM_STEP, collision="discrete", merge=False, profile=False, trace=None, record=None,
+        record_input=None, rewind_seconds=REWIND_SECONDS, watch=True):
+    check_merge(merge, collision)
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.display.set_caption("Platformer Game")
+    clock = pygame.time.Clock()
+    font = pygame.font.SysFont(None, 24)
+
+    # 에셋 로드 (타일 크기로 조정 + 좌우 반전 변형을 아틀라스에 미리 생성)
+    assets = AssetManager('assets', size=(TILE_SIZE, TILE_SIZE)).load(PLAYER_ASSETS)
+    streamer = None
+    if is_chunked_level(map_file):
+        # 청크 레벨: 카메라 주변 청크만 스트리밍
+        level = ChunkedLevel(map_file)
+        platforms = PlatformGroup(TILE_SIZE)
+        streamer = ChunkStreamer(level, platforms, make_platform)
+        player = Player(assets, platforms, level.bounds)
+        camera = Camera(WIDTH, HEIGHT, level.bounds)
+        camera.follow(player.rect)
+        streamer.ensure_loaded(camera.rect)
+    else:
+        merge_stats = {}
+        platforms = load_level(map_file, merge, merge_stats)
+        if merge_stats:
+            pygame.display.set_caption(f"Platformer Game - {format_stats(merge_stats)}")
+        player = Player(assets, platforms)
+        camera = Camera(WIDTH, HEIGHT, player.bounds)
+    player.collision_mode = collision
+    view = InterpolatedView(player)
+    dynamic_sprites = pygame.sprite.Group(view)
+
+    # 렌더러 (스크롤 레벨은 카메라 렌더러만 사용)
+    if streamer is not None:
+        renderers = {"camera": CameraRenderer(screen, platforms, camera)}
+        render_mode = "camera"
+    else:
+        renderers = {
+            "static": StaticLayerRenderer(screen, platforms),
+            "full": FullRedrawRenderer(screen, platforms),
+        }
+    renderer = renderers[render_mode]
+    timestep = FixedTimestep(sim_step, MAX_STEPS_PER_FRAME)
+    dt = sim_step / BASE_STEP
+
+    # 프로파일러: F3 오버레이(p50/p99), F4 프레임 트레이스 기록 - 둘 다 꺼져 있으면 측정도 하지 않는다
+    profiler = FrameProfiler()
+    player.profiler = profiler
+    overlay = ProfilerOverlay(profiler, font)
+    if profile:
+        overlay.toggle()
+    if trace:
+        profiler.start_trace(trace)
+    profiler.enabled = overlay.visible or profiler.tracing
+    fps_text = CachedText(font)
+    fps_refresh = 0.0
+    # 텔레메트리: 프레임마다 몇 가지 값을 .vtel 파일에 덧붙인다 (나중에 load_telemetry 로 분석)
+    recorder = None
+    if record:
+        from value_plotter.telemetry import Recorder
+        recorder = Recorder(record)
+    # 입력 기록: 물리 스텝마다 키/마우스를 남기고, 끝날 때 최종 상태 체크섬을 같이 저장 (--replay 로 재생)
+    input_log = None
+    if record_input:
+        input_log = InputRecorder(record_input, sim_step,
+                                  meta={"map": map_file, "collision": collision, "merge": merge})
+    # 스냅샷 링 버퍼: 매 프레임 플레이어 상태를 찍어 둔다 (입력 기록 중에는 재생이 어긋나므로 되감기를 막음)
+    snapshots = SnapshotRing(max(1, int(rewind_seconds * (fps or FPS))))
+    # 레벨 구성 id: 청크 레벨은 불러온 청크가 계속 바뀌므로 레벨 파일로, 아니면 지금 플랫폼 내용으로 정한다
+    if streamer is not None:
+        layout = lambda: level.layout
+    else:
+        layout = lambda: platforms.layout
+    frame = 0
+    # 맵 핫 리로드: 편집기에서 저장하면 바뀐 플랫폼만 갈아 끼운다 (청크 레벨과 입력 기록 중에는 끔)
+    watcher = None
+    if watch and streamer is None and input_log is None:
+        read = load_platforms
+        if merge:
+            read = lambda filename: merge_platforms(load_platforms(filename), EditablePlatform)[0]
+        watcher = MapWatcher(map_file, platforms, make_platform, read)
+
+    # 메인 루프
+    running = True
+    while running:
+        frame_ms = clock.tick(fps)
+        profiler.begin_frame()
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F2 and streamer is None:
+                renderer = renderers["full" if renderer.name == "static" else "static"]
+                renderer.reset()
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                overlay.toggle()
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+                if profiler.tracing:
+                    profiler.stop_trace()
+                else:
+                    profiler.start_trace(trace or "frame_trace.csv")
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F5 and len(snapshots):
+                save_snapshot(QUICKSAVE_FILE, snapshots.get(0))
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F9 and input_log is None:
+                if os.path.exists(QUICKSAVE_FILE):
+                    try:
+                        data = load_snapshot(QUICKSAVE_FILE)
+                    except ValueError as e:
+                        print(f"{QUICKSAVE_FILE}: {e}", file=sys.stderr)
+                        continue
+                    # 저장한 뒤 맵이 바뀌었으면 새 플랫폼 안에 끼일 수 있으므로 불러오지 않는다
+                    if snapshot_info(data)[1] == layout():
+                        restore_snapshot(player, data)
+                        snapshots.clear()
+                    else:
+                        print(f"{QUICKSAVE_FILE}: saved for a different map layout, not restored", file=sys.stderr)
+            profiler.enabled = overlay.visible or profiler.tracing
+        profiler.mark("events")
+        keys = pygame.key.get_pressed()
+        mouse_pos = camera.to_world(pygame.mouse.get_pos())
+        profiler.mark("input")
+        if keys[pygame.K_BACKSPACE] and input_log is None and len(snapshots) > 1:
+            snapshots.rewind(player, 1)
+        else:
+            for _ in range(timestep.advance(frame_ms / 1000)):
+                if streamer is not None:
+                    # 플레이어 주변은 스텝마다 동기 로드로 보장한다 (재생도 스텝마다 같은 범위를 불러옴)
+                    streamer.ensure_loaded(player.rect.inflate(TILE_SIZE * 4, TILE_SIZE * 4))
+                if input_log is not None:
+                    input_log.record(keys, mouse_pos)
+                player.update(keys, mouse_pos, dt=dt)
+            snapshots.capture(player, frame, layout())
+        frame += 1
+        view.sync(timestep.alpha if interpolate else 1.0)
+        if streamer is not None:
+            camera.follow(view.rect)
+            # 카메라에 보이는 나머지 청크는 백그라운드로 미리 읽는다
+            streamer.update(camera.rect)
+        profiler.mark("physics")
+        # FPS 글자는 0.25초마다만 갱신하고, 바뀌지 않으면 이전 Surface 를 그대로 쓴다
+        now = time.perf_counter()
+        if watcher is not None:
+            changed = watcher.update(now)
+            if changed:
+                # 바뀌기 전 구성에서 찍은 스냅샷으로는 되감지 않는다
+                snapshots.clear()
+            # 바뀐 곳이 많으면 영역마다 다시 그리는 것보다 배경 전체를 한 번 다시 그리는 편이 싸다
+            for r in renderers.values():
+                if len(changed) > 64:
+                    r.invalidate()
+                else:
+                    for rect in changed:
+                        r.invalidate(rect)
+        if now >= fps_refresh:
+            fps_refresh = now + 0.25
+            fps_text.set(f"FPS: {clock.get_fps():.1f} [{renderer.name}] {clock.get_rawtime()} ms")
+        overlays = [(fps_text.surface, (10, 10))]
+        overlays.extend(overlay.items(now))
+        renderer.draw(dynamic_sprites, overlays)
+        profiler.mark("draw")
+        renderer.present()
+        profiler.mark("flip")
+        profiler.end_frame()
+        if recorder is not None:
+            recorder.record("frame_ms", frame_ms)
+            recorder.record("velocity_x", player.velocity_x)
+            recorder.record("velocity_y", player.velocity_y)
+            recorder.record("on_ground", player.on_ground)
+
+    profiler.stop_trace()
+    if recorder is not None:
+        recorder.close()
+    if input_log is not None:
+        input_log.close(state_checksum(player))
+    if streamer is not None:
+        streamer.close()
+    if watcher is not None:
+        watcher.close()
+    pygame.quit()
+
+# 헤드리스 실행: 창 없이(SDL dummy 드라이버) 시뮬레이션만 최대 속도로 돌린다
+def run_headless(steps, map_file=MAP_FILE, keys=None, sim_step=SIM_STEP, collision="discrete", merge=False):
+    check_merge(merge, collision)
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    assets = AssetManager('assets', size=(TILE_SIZE, TILE_SIZE)).load(PLAYER_ASSETS)
+    streamer = None
+    if is_chunked_level(map_file):
+        level = ChunkedLevel(map_file)
+        platforms = PlatformGroup(TILE_SIZE)
+        streamer = ChunkStreamer(level, platforms, make_platform)
+        player = Player(assets, platforms, level.bounds)
+    else:
+        platforms = load_level(map_file, merge)
+        player = Player(assets, platforms)
+    player.collision_mode = collision
+    keys = keys if keys is not None else defaultdict(bool)  # 입력 없음
+    dt = sim_step / BASE_STEP
+
+    start = time.perf_counter()
+    for _ in range(steps):
+        if streamer is not None:
+            near = player.rect.inflate(WIDTH, HEIGHT)
+            streamer.ensure_loaded(near)
+            streamer.update(near)
+        player.update(keys, (0, 0), dt=dt)
+    elapsed = time.perf_counter() - start
+    if streamer is not None:
+        streamer.close()
+
+    pygame.quit()
+    return player, elapsed
+
+# 입력 재생: 기록된 입력을 창 없이 최대 속도로 다시 넣고 최종 상태를 기록 때의 체크섬과 비교한다
+def run_replays(filenames, map_file=None):
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    assets = AssetManager('assets', size=(TILE_SIZE, TILE_SIZE)).load(PLAYER_ASSETS)
+    levels = {}  # 같은 맵을 쓰는 기록끼리는 불러온 플랫폼을 같이 쓴다 (재생 중 바뀌지 않음)
+    results = []
+    for filename in filenames:
+        log = InputLog(filename)
+        level_file = map_file or log.meta.get("map", MAP_FILE)
+        streamer = None
+        before_step = None
+        if is_chunked_level(level_file):
+            level = ChunkedLevel(level_file)
+            platforms = PlatformGroup(TILE_SIZE)
+            streamer = ChunkStreamer(level, platforms, make_platform)
+            player = Player(assets, platforms, level.bounds)
+            before_step = lambda p: streamer.ensure_loaded(p.rect.inflate(TILE_SIZE * 4, TILE_SIZE * 4))
+        else:
+            key = (level_file, log.meta.get("merge", False))
+            if key not in levels:
+                levels[key] = load_level(*key)
+            player = Player(assets, levels[key])
+        player.collision_mode = log.meta.get("collision", "discrete")
+        start = time.perf_counter()
+        checksum = replay(log, player, log.sim_step / BASE_STEP, before_step)
+        elapsed = time.perf_counter() - start
+        if streamer is not None:
+            streamer.close()
+        results.append((filename, len(log), elapsed, checksum == log.checksum))
+    pygame.quit()
+    return results
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Platformer Game")
+    parser.add_argument("--map", default=MAP_FILE, help="맵 파일 (.json/.vmap) 또는 청크 레벨 디렉터리")
+    parser.add_argument("--render", choices=("static", "full"), default=RENDER_MODE, help="렌더링 방식")
+    parser.add_argument("--fps", type=int, default=FPS, help="렌더 프레임 상한")
+    parser.add_argument("--no-interpolate", action="store_true", help="렌더 보간 끄기")
+    parser.add_argument("--headless", type=int, metavar="STEPS", help="창 없이 STEPS 만큼 시뮬레이션")
+    parser.add_argument("--step-rate", type=float, default=1 / SIM_STEP, metavar="HZ",
+                        help="초당 물리 스텝 수 (낮출수록 스텝이 커짐, swept 충돌 권장)")
+    parser.add_argument("--collision", choices=("discrete", "swept"), default="discrete", help="충돌 처리 방식")
+    parser.add_argument("--merge", action="store_true",
+                        help="불러올 때 붙어 있는 같은 색 타일을 합침 (--collision swept 필요)")
+    parser.add_argument("--profile", action="store_true", help="단계별 프레임 시간 오버레이 켜고 시작 (F3)")
+    parser.add_argument("--trace", metavar="CSV", help="프레임별 단계 시간을 CSV 로 기록 (F4 로 켜고 끔)")
+    parser.add_argument("--record", metavar="VTEL", help="프레임 시간/속도를 텔레메트리 파일(.vtel)로 기록")
+    parser.add_argument("--record-input", metavar="VREP", help="물리 스텝별 입력을 기록 (.vrep)")
+    parser.add_argument("--rewind-seconds", type=float, default=REWIND_SECONDS,
+                        help="Backspace 로 되감을 수 있는 최근 시간 (초)")
+    parser.add_argument("--no-watch", action="store_true", help="맵 파일이 바뀌어도 다시 불러오지 않음")
+    parser.add_argument("--replay", nargs="+", metavar="VREP",
+                        help="기록된 입력을 창 없이 최대 속도로 재생하고 최종 상태 검증 (--map 을 주면 그 맵으로)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.merge and args.collision != "swept":
+        # discrete 충돌은 타일 이음매에 걸리므로 합친 맵에서는 결과가 달라진다
+        sys.exit("--merge requires --collision swept")
+    if args.replay:
+        failed = 0
+        map_file = args.map if args.map != MAP_FILE else None
+        for filename, steps, elapsed, ok in run_replays(args.replay, map_file):
+            rate = steps / elapsed if elapsed > 0 else float("inf")
+            print(f"{filename}: {steps} steps in {elapsed:.3f}s ({rate:.0f} steps/s) {'OK' if ok else 'MISMATCH'}")
+            failed += not ok
+        return 1 if failed else 0
+    if args.headless is not None:
+        player, elapsed = run_headless(args.headless, args.map, sim_step=1 / args.step_rate,
+                                       collision=args.collision, merge=args.merge)
+        rate = args.headless / elapsed if elapsed > 0 else float("inf")
+        print(f"{args.headless} steps in {elapsed:.3f}s ({rate:.0f} steps/s), "
+              f"player at {player.rect.topleft}")
+        return 0
+    run(args.map, args.render, args.fps, not args.no_interpolate, 1 / args.step_rate, args.collision, args.merge,
+        args.profile, args.trace, args.record, args.record_input, args.rewind_seconds,
+        not args.no_watch)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
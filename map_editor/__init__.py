@@ -4,4 +4,15 @@ from .core import (
     export_platforms,
     load_platforms,
 )
-from .gui import MapEditorGUI
\ No newline at end of file
+from .store import PlatformStore
+from .quadtree import Quadtree
+from .optimize import merge_platforms
+from .generator import generate_map
+
+
+def __getattr__(name):
+    # GUI 는 PyQt5 를 불러오므로 게임/변환기처럼 core 만 쓰는 쪽은 비용을 내지 않도록 처음 쓸 때 불러온다
+    if name == "MapEditorGUI":
+        from .gui import MapEditorGUI
+        return MapEditorGUI
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,178 @@
+"""
+바이너리 맵 포맷 (.vmap, little-endian)
+
+    헤더   : magic(4s) version(H) flags(H) count(I) string_count(I) records_offset(I) strings_offset(I)
+    레코드 : x(i) y(i) width(i) height(i) r(B) g(B) b(B) pad(x) ptype_index(H) pad(2x)  - 24바이트 고정
+    문자열 : (길이(H) + UTF-8 바이트) * string_count  - ptype 문자열 테이블
+
+레코드가 고정 길이라서 mmap 후 파싱 없이 i번째 플랫폼을 바로 읽을 수 있고,
+문자열 테이블이 맨 뒤에 있어서 개수를 모르는 채로 스트리밍 저장도 가능하다
+"""
+import mmap
+import struct
+
+MAGIC = b"VNGM"
+VERSION = 1
+EXTENSION = ".vmap"
+
+HEADER = struct.Struct("<4sHHIIII")
+RECORD = struct.Struct("<iiiiBBBxHxx")
+_STRLEN = struct.Struct("<H")
+
+# numpy 로 볼 때의 레코드 dtype (RECORD 와 같은 배치)
+RECORD_DTYPE = [
+    ("x", "<i4"), ("y", "<i4"), ("width", "<i4"), ("height", "<i4"),
+    ("r", "u1"), ("g", "u1"), ("b", "u1"), ("_pad0", "u1"),
+    ("ptype", "<u2"), ("_pad1", "<u2"),
+]
+
+
+def is_binary_map(filename):
+    return str(filename).lower().endswith(EXTENSION)
+
+
+class BinaryMapWriter:
+    """
+    바이너리 맵 스트리밍 저장: write()로 레코드를 바로 파일에 쓰고, close() 때 문자열 테이블과 헤더를 채운다
+    """
+    def __init__(self, filename):
+        self._f = open(filename, "wb")
+        self._f.write(HEADER.pack(MAGIC, VERSION, 0, 0, 0, HEADER.size, 0))
+        self._ptypes = {}
+        self.count = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _ptype_index(self, ptype):
+        index = self._ptypes.get(ptype)
+        if index is None:
+            index = self._ptypes[ptype] = len(self._ptypes)
+        return index
+
+    def write(self, x, y, width, height, color=(0, 200, 0), ptype="default"):
+        r, g, b = color[:3]
+        self._f.write(RECORD.pack(x, y, width, height, r, g, b, self._ptype_index(ptype)))
+        self.count += 1
+
+    def write_platform(self, p):
+        self.write(p.x, p.y, p.width, p.height, p.color, p.ptype)
+
+    def write_records(self, records, ptype="default"):
+        """
+        numpy 구조체 배열(RECORD_DTYPE)을 한 번에 기록 (ptype 은 모든 레코드 공통)
+        대량 생성기에서 파이썬 루프 없이 저장할 때 사용
+        """
+        records = records.copy()
+        records["ptype"] = self._ptype_index(ptype)
+        self._f.write(records.tobytes())
+        self.count += len(records)
+
+    def write_columns(self, x, y, width, height, color, ptype, ptypes):
+        """
+        열 배열로 레코드를 한 번에 기록 (PlatformStore 저장용)
+        color: (n, 3) 배열, ptype: ptypes 문자열 테이블의 번호 배열
+        """
+        import numpy as np
+        for column in (x, y, width, height):
+            if len(column) and not (-2**31 <= column.min() and column.max() < 2**31):
+                raise struct.error("platform value out of 32-bit range")   # RECORD.pack 와 같은 오류
+        records = np.zeros(len(x), dtype=np.dtype(RECORD_DTYPE))
+        records["x"], records["y"], records["width"], records["height"] = x, y, width, height
+        records["r"], records["g"], records["b"] = color[:, 0], color[:, 1], color[:, 2]
+        table = np.array([self._ptype_index(t) for t in ptypes], dtype=np.uint16)
+        if len(records):
+            records["ptype"] = table[ptype]
+        self._f.write(records.tobytes())
+        self.count += len(records)
+
+    def close(self):
+        if self._f.closed:
+            return
+        strings_offset = self._f.tell()
+        for ptype in self._ptypes:
+            data = str(ptype).encode("utf-8")
+            self._f.write(_STRLEN.pack(len(data)))
+            self._f.write(data)
+        self._f.seek(0)
+        self._f.write(HEADER.pack(MAGIC, VERSION, 0, self.count, len(self._ptypes), HEADER.size, strings_offset))
+        self._f.close()
+
+
+class BinaryMap:
+    """
+    mmap 으로 연 바이너리 맵 (읽기 전용)
+    len(), 인덱싱, 반복은 레코드를 필요할 때만 struct 로 풀어서 (x, y, width, height, color, ptype) 튜플로 돌려준다
+    """
+    def __init__(self, filename):
+        with open(filename, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, count, string_count, rec_off, str_off = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            self._mm.close()
+            raise ValueError(f"바이너리 맵 파일이 아님: {filename}")
+        if version != VERSION:
+            self._mm.close()
+            raise ValueError(f"지원하지 않는 바이너리 맵 버전: {version}")
+        self.count = count
+        self._rec_off = rec_off
+        self.ptypes = []
+        pos = str_off
+        for _ in range(string_count):
+            (length,) = _STRLEN.unpack_from(self._mm, pos)
+            pos += _STRLEN.size
+            self.ptypes.append(self._mm[pos:pos + length].decode("utf-8"))
+            pos += length
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self.count
+
+    def _unpack(self, fields):
+        x, y, w, h, r, g, b, pi = fields
+        return x, y, w, h, (r, g, b), self.ptypes[pi]
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += self.count
+        if not 0 <= i < self.count:
+            raise IndexError(i)
+        return self._unpack(RECORD.unpack_from(self._mm, self._rec_off + i * RECORD.size))
+
+    def __iter__(self):
+        end = self._rec_off + self.count * RECORD.size
+        for fields in RECORD.iter_unpack(memoryview(self._mm)[self._rec_off:end]):
+            yield self._unpack(fields)
+
+    def as_array(self):
+        """레코드 영역을 복사 없이 numpy 구조체 배열로 본다 (numpy 필요)"""
+        import numpy as np
+        return np.frombuffer(self._mm, dtype=np.dtype(RECORD_DTYPE), count=self.count, offset=self._rec_off)
+
+    def close(self):
+        if not self._mm.closed:
+            try:
+                self._mm.close()
+            except BufferError:
+                # as_array() 결과가 아직 살아 있으면 GC 에 맡긴다
+                pass
+
+
+def save_binary(platforms, filename):
+    with BinaryMapWriter(filename) as writer:
+        for p in platforms:
+            writer.write_platform(p)
+
+
+def load_binary(filename, factory):
+    """factory(x, y, width, height, color, ptype) 로 레코드마다 객체 생성"""
+    with BinaryMap(filename) as m:
+        return [factory(*record) for record in m]
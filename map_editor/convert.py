@@ -0,0 +1,86 @@
+"""
+맵 파일 포맷 변환 (JSON <-> 바이너리 .vmap) 및 크기/로딩 시간 비교
+
+    python -m map_editor.convert map.json map.vmap
+    python -m map_editor.convert map.vmap map.json
+    python -m map_editor.convert map.json --compare
+    python -m map_editor.convert map.json merged.vmap --merge
+"""
+import os
+import time
+import argparse
+import tempfile
+from .core import MapData, load_platforms
+from .binary import BinaryMap, EXTENSION
+from .optimize import format_stats
+
+
+def convert(source, target, merge=False):
+    data = MapData()
+    data.load(source)
+    stats = data.save(target, merge=merge)
+    return len(data.platforms), stats
+
+
+def _best_time(func, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def compare(source, repeat=3):
+    """같은 맵을 JSON/바이너리로 저장해 파일 크기와 로딩 시간을 비교"""
+    data = MapData()
+    data.load(source)
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = os.path.join(tmp, "map.json")
+        bin_path = os.path.join(tmp, "map" + EXTENSION)
+        data.save(json_path)
+        data.save(bin_path)
+
+        def mmap_scan():
+            with BinaryMap(bin_path) as m:
+                for _ in m:
+                    pass
+
+        return {
+            "platforms": len(data.platforms),
+            "json_bytes": os.path.getsize(json_path),
+            "binary_bytes": os.path.getsize(bin_path),
+            "json_load_s": _best_time(lambda: load_platforms(json_path), repeat),
+            "binary_load_s": _best_time(lambda: load_platforms(bin_path), repeat),
+            "binary_mmap_scan_s": _best_time(mmap_scan, repeat),
+        }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="맵 파일 포맷 변환 (JSON <-> .vmap)")
+    parser.add_argument("source", help="원본 맵 파일")
+    parser.add_argument("target", nargs="?", help="출력 파일 (확장자로 포맷 결정)")
+    parser.add_argument("--compare", action="store_true", help="두 포맷의 크기/로딩 시간 비교")
+    parser.add_argument("--merge", action="store_true", help="붙어 있는 같은 색/ptype 플랫폼을 합쳐서 저장")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    if args.target:
+        count, stats = convert(args.source, args.target, args.merge)
+        print(f"{count} platforms: {args.source} -> {args.target}")
+        if stats is not None:
+            print(format_stats(stats))
+    if args.compare:
+        r = compare(args.source, args.repeat)
+        print(f"platforms        : {r['platforms']}")
+        print(f"size   json/bin  : {r['json_bytes']} / {r['binary_bytes']} bytes "
+              f"({r['json_bytes'] / max(r['binary_bytes'], 1):.1f}x)")
+        print(f"load   json/bin  : {r['json_load_s'] * 1000:.2f} / {r['binary_load_s'] * 1000:.2f} ms "
+              f"({r['json_load_s'] / max(r['binary_load_s'], 1e-9):.1f}x)")
+        print(f"mmap record scan : {r['binary_mmap_scan_s'] * 1000:.2f} ms")
+    if not args.target and not args.compare:
+        parser.error("target 또는 --compare 중 하나는 필요합니다")
+
+
+if __name__ == "__main__":
+    main()
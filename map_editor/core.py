@@ -1,16 +1,59 @@
 import json
+import numpy as np
+from collections.abc import MutableSequence
+from .binary import is_binary_map, save_binary, load_binary, BinaryMap, BinaryMapWriter
+from .store import PlatformStore, _coord
+from .quadtree import Quadtree
+from .optimize import merge_platforms
+
+def _field(name):
+    # 맵에 들어 있으면 저장소 열에서, 아니면 자기 슬롯에서 값을 읽고 쓴다
+    local = "_" + name
+
+    def fget(self):
+        if self._store is None:
+            return getattr(self, local)
+        return self._store.get(self._id, name)
+
+    def fset(self, value):
+        if self._store is None:
+            setattr(self, local, value)
+        else:
+            self._store.set(self._id, name, value)
+    return property(fget, fset)
 
 class EditablePlatform:
     """
     플랫폼 데이터 객체: 위치, 크기 및 색상 관리 (순수 데이터)
+    MapData 에 추가되면 값은 MapData.store 의 열에 보관되고, 이 객체는 그 행을 가리키는 뷰가 된다
     """
+    __slots__ = ("_store", "_id", "_x", "_y", "_width", "_height", "_color", "_ptype", "selected")
+
+    x = _field("x")
+    y = _field("y")
+    width = _field("width")
+    height = _field("height")
+    color = _field("color")
+    ptype = _field("ptype")
+
     def __init__(self, x, y, width, height, color=(0, 200, 0), ptype="default"):
+        self._store = None
+        self._id = None
         self.x = x
         self.y = y
         self.width = width
         self.height = height
         self.color = color
         self.ptype = ptype
+        self.selected = False
+
+    def _bind(self, store, pid):
+        self._store, self._id = store, pid
+
+    def _unbind(self):
+        # 저장소에서 빠질 때 현재 값을 자기 슬롯으로 옮겨 둔다
+        self._x, self._y, self._width, self._height, self._color, self._ptype = self._store.values(self._id)
+        self._store = self._id = None
 
     def to_dict(self):
         return {
@@ -25,50 +68,261 @@ class EditablePlatform:
     @classmethod
     def from_dict(cls, data):
         return cls(
-            data['x'], data['y'],
-            data['width'], data['height'],
+            _coord(data['x']), _coord(data['y']),
+            _coord(data['width']), _coord(data['height']),
             tuple(data.get('color', (0,200,0))),
             data.get('ptype', 'default')
         )
 
+# json.dump(..., indent=4) 가 플랫폼 dict 하나를 쓰는 모양 그대로 (들여쓰기가 있으면 json 은 느린 파이썬 인코더를 쓴다)
+_JSON_RECORD = (
+    '    {{\n        "x": {},\n        "y": {},\n        "width": {},\n        "height": {},\n'
+    '        "color": [\n            {},\n            {},\n            {}\n        ],\n        "ptype": {}\n    }}')
+
+def _json_column(data, key):
+    # 모두 정수면 그대로 배열로, 아니면 _coord 로 하나씩 반올림/검사
+    values = [d[key] for d in data]
+    if set(map(type, values)) <= {int}:
+        return np.array(values, dtype=np.int64)
+    return np.array([_coord(v) for v in values], dtype=np.int64)
+
+class PlatformList(MutableSequence):
+    """
+    MapData.platforms 가 돌려주는 z-순서 플랫폼 목록 뷰 - 예전 list 처럼 append/remove/insert/del 이 맵을 바로 고친다
+    읽기(순회/인덱싱)는 구조가 바뀌지 않는 동안 재사용되는 튜플에서 한다
+    """
+    __slots__ = ("_map",)
+
+    def __init__(self, map_data):
+        self._map = map_data
+
+    def _items(self):
+        return self._map._platform_tuple()
+
+    def __len__(self):
+        return len(self._map.store)
+
+    def __getitem__(self, i):
+        items = self._items()
+        return list(items[i]) if isinstance(i, slice) else items[i]
+
+    def __iter__(self):
+        return iter(self._items())
+
+    def __reversed__(self):
+        return reversed(self._items())
+
+    def __contains__(self, platform):
+        return isinstance(platform, EditablePlatform) and platform._store is self._map.store
+
+    def __setitem__(self, i, platform):
+        if isinstance(i, slice):
+            raise TypeError("slice assignment is not supported")
+        old = self._items()[i]
+        index = self._map.index_of(old)
+        self._map.remove_platform(old)
+        self._map.add_platform(platform, index)
+
+    def __delitem__(self, i):
+        items = self._items()
+        for p in (items[i] if isinstance(i, slice) else [items[i]]):
+            self._map.remove_platform(p)
+
+    def insert(self, index, platform):
+        self._map.add_platform(platform, index if index < len(self) else None)
+
+    def append(self, platform):
+        self._map.add_platform(platform)
+
+    def remove(self, platform):
+        self._map.remove_platform(platform)
+
+    def clear(self):
+        self._map.clear()
+
+    def __eq__(self, other):
+        if isinstance(other, (PlatformList, list, tuple)):
+            return list(self._items()) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return f"PlatformList({list(self._items())!r})"
+
 class MapData:
     """
     맵 전체 데이터를 관리: 플랫폼 목록, 저장/불러오기 기능
+    플랫폼 값은 컬럼 저장소(self.store)에 있고 EditablePlatform 은 그 뷰로 쓰인다
     """
     def __init__(self):
-        self.platforms = []
+        self.store = PlatformStore()
+        self._views = {}        # id -> EditablePlatform
+        self._cache = None      # z-순서 뷰 목록
+        self._cache_version = -1
+        self._index = None
+
+    @property
+    def index(self):
+        """플랫폼 id 쿼드트리 - 처음 쓸 때 만들고, 이후에는 저장소 변경을 따라 갱신된다"""
+        if self._index is None:
+            box = self.store.bounding_box() or (0, 0, 1024, 1024)
+            size = 1024
+            while size < max(box[2] - box[0], box[3] - box[1]):
+                size *= 2
+            self._index = self.store.attach_index(Quadtree((box[0], box[1], size)))
+        return self._index
+
+    def _in_z_order(self, ids):
+        row = self.store.row
+        return [self._view(pid) for pid in sorted(ids, key=row)]
 
-    def add_platform(self, platform: EditablePlatform):
-        self.platforms.append(platform)
+    def query_point(self, x, y):
+        """점 (x, y)를 포함하는 플랫폼 목록 (z-순서: 마지막이 맨 위)"""
+        return self._in_z_order(self.index.query_point(x, y))
+
+    def query_rect(self, left, top, width, height):
+        """사각형과 겹치는 플랫폼 목록 (z-순서)"""
+        return self._in_z_order(self.index.query_rect(left, top, width, height))
+
+    def platform_at(self, x, y):
+        """점 (x, y)의 맨 위 플랫폼 (없으면 None)"""
+        ids = self.index.query_point(x, y)
+        return self._view(max(ids, key=self.store.row)) if ids else None
+
+    @property
+    def platforms(self):
+        """z-순서 플랫폼 목록 뷰 (PlatformList) - append/remove 등으로 맵을 직접 고칠 수 있다"""
+        return PlatformList(self)
+
+    @platforms.setter
+    def platforms(self, platforms):
+        self.clear()
+        for p in platforms:
+            self.add_platform(p)
+
+    def _view(self, pid):
+        view = self._views.get(pid)
+        if view is None:
+            # 대량 추가(store.extend)된 행은 처음 접근할 때 뷰를 만든다
+            view = EditablePlatform.__new__(EditablePlatform)
+            view._bind(self.store, pid)
+            view.selected = False
+            self._views[pid] = view
+        return view
+
+    def add_platform(self, platform: EditablePlatform, index=None):
+        # index: z-순서 위치 (None 이면 맨 위)
+        if platform._store is not None:
+            raise ValueError("platform already belongs to a map")
+        values = (platform.x, platform.y, platform.width, platform.height, platform.color, platform.ptype)
+        if index is None:
+            pid = self.store.append(*values)
+        else:
+            pid = self.store.insert(index, *values)
+        platform._bind(self.store, pid)
+        self._views[pid] = platform
+
+    def add_platforms(self, items):
+        """(z-순서 위치, 플랫폼) 목록을 한 번에 원래 자리로 추가 (다중 삭제 되돌리기)"""
+        items = sorted(items, key=lambda e: e[0])
+        for _, platform in items:
+            if platform._store is not None:
+                raise ValueError("platform already belongs to a map")
+        ids = self.store.insert_many(
+            [index for index, _ in items],
+            [(p.x, p.y, p.width, p.height, p.color, p.ptype) for _, p in items])
+        for pid, (_, platform) in zip(ids.tolist(), items):
+            platform._bind(self.store, pid)
+            self._views[pid] = platform
 
     def remove_platform(self, platform: EditablePlatform):
-        self.platforms.remove(platform)
+        if platform._store is not self.store:
+            raise ValueError("platform is not in this map")
+        pid = platform._id
+        platform._unbind()
+        self.store.remove(pid)
+        self._views.pop(pid, None)
+
+    def index_of(self, platform: EditablePlatform):
+        if platform._store is not self.store:
+            raise ValueError("platform is not in this map")
+        return self.store.index_of(platform._id)
 
     def clear(self):
-        self.platforms.clear()
+        for view in self._views.values():
+            view._unbind()
+        self._views.clear()
+        self.store.clear()
 
-    def save(self, filename="map.json"):
-        import json
-        data = [p.to_dict() for p in self.platforms]
+    def save(self, filename="map.json", merge=False):
+        # 확장자가 .vmap 이면 바이너리 포맷으로 저장
+        # merge: 붙어 있는 같은 색/ptype 플랫폼을 합쳐서 저장하고 통계 dict 반환 (편집 중인 맵은 그대로, 게임의 swept 충돌용)
+        # 합치지 않을 때는 플랫폼 객체를 거치지 않고 저장소 열을 바로 쓴다
+        if merge:
+            platforms, stats = merge_platforms(self._platform_tuple(), EditablePlatform)
+            if is_binary_map(filename):
+                save_binary(platforms, filename)
+            else:
+                with open(filename, 'w') as f:
+                    json.dump([p.to_dict() for p in platforms], f, indent=4)
+            return stats
+        store = self.store
+        rows = store.live_rows()
+        columns = (store.x[rows], store.y[rows], store.width[rows], store.height[rows], store.color[rows])
+        if is_binary_map(filename):
+            with BinaryMapWriter(filename) as writer:
+                writer.write_columns(*columns, store.ptype[rows], store.ptypes)
+            return None
+        x, y, width, height, color = columns
+        ptypes = [json.dumps(t) for t in store.ptypes]
+        records = map(_JSON_RECORD.format, x.tolist(), y.tolist(), width.tolist(), height.tolist(),
+                      color[:, 0].tolist(), color[:, 1].tolist(), color[:, 2].tolist(),
+                      [ptypes[t] for t in store.ptype[rows].tolist()])
         with open(filename, 'w') as f:
-            json.dump(data, f, indent=4)
+            f.write("[\n" + ",\n".join(records) + "\n]" if len(rows) else "[]")
+        return None
 
     def load(self, filename="map.json"):
-        import json
-        with open(filename, 'r') as f:
-            data = json.load(f)
+        # 플랫폼 객체를 만들지 않고 열 단위로 한 번에 채운다 (뷰는 처음 접근할 때 만들어진다)
+        if is_binary_map(filename):
+            with BinaryMap(filename) as m:
+                records = m.as_array()
+                # mmap 을 닫을 수 있도록 열은 복사해 둔다
+                columns = (records["x"].astype(np.int64), records["y"].astype(np.int64),
+                           records["width"].astype(np.int64), records["height"].astype(np.int64),
+                           np.stack((records["r"], records["g"], records["b"]), axis=1),
+                           [m.ptypes[i] for i in records["ptype"].tolist()])
+                del records
+        else:
+            with open(filename, 'r') as f:
+                data = json.load(f)
+            columns = (_json_column(data, 'x'), _json_column(data, 'y'),
+                       _json_column(data, 'width'), _json_column(data, 'height'),
+                       np.array([d.get('color', (0, 200, 0))[:3] for d in data], dtype=np.uint8).reshape(-1, 3),
+                       [d.get('ptype', 'default') for d in data])
         self.clear()
-        for item in data:
-            self.add_platform(EditablePlatform.from_dict(item))
+        # 쿼드트리는 새 맵 경계로 처음 쓸 때 다시 만든다
+        self.store.index = self._index = None
+        self.store.extend(*columns)
+
+    def _platform_tuple(self):
+        # 구조가 바뀌지 않았으면 같은 튜플을 재사용한다 (추가/삭제 시에는 새 튜플이 만들어진다)
+        if self._cache is None or self._cache_version != self.store.version:
+            self._cache = tuple(self._view(pid) for pid in self.store.live_ids().tolist())
+            self._cache_version = self.store.version
+        return self._cache
 
     def get_platforms(self):
-        return list(self.platforms)
+        """z-순서 플랫폼 리스트 (복사본 - 고쳐도 맵은 바뀌지 않으므로 순회 중 삭제도 안전하다)"""
+        return list(self._platform_tuple())
 
-def export_platforms(platforms):
+def export_platforms(platforms, merge=False):
+    if merge:
+        platforms, _ = merge_platforms(platforms, EditablePlatform)
     return [p.to_dict() for p in platforms]
 
 def load_platforms(filename="map.json"):
-    import json
+    if is_binary_map(filename):
+        return load_binary(filename, EditablePlatform)
     with open(filename, 'r') as f:
         data = json.load(f)
     return [EditablePlatform.from_dict(item) for item in data]
\ No newline at end of file
@@ -0,0 +1,41 @@
+"""
+절차적 맵 생성 CLI (충돌/렌더링 스트레스 테스트용 레벨)
+
+    python -m map_editor.generate out.vmap --grid 1000 1000 --tile-size 40
+    python -m map_editor.generate out.vmap --terrain 2000000 --seed 7
+    python -m map_editor.generate out.json --spec spec.json
+"""
+import json
+import time
+import argparse
+from .generator import generate_map
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="절차적 맵 생성 (.vmap 권장)")
+    parser.add_argument("target", help="출력 파일 (확장자로 포맷 결정)")
+    kind = parser.add_mutually_exclusive_group(required=True)
+    kind.add_argument("--spec", help="spec JSON 파일")
+    kind.add_argument("--grid", nargs=2, type=int, metavar=("ROWS", "COLS"), help="격자 맵")
+    kind.add_argument("--terrain", type=int, metavar="COLUMNS", help="무작위 지형 열 수")
+    parser.add_argument("--tile-size", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    if args.spec:
+        with open(args.spec) as f:
+            spec = json.load(f)
+    elif args.grid:
+        spec = {"rows": args.grid[0], "cols": args.grid[1]}
+    else:
+        spec = {"type": "terrain", "columns": args.terrain, "seed": args.seed}
+    if args.tile_size is not None:
+        spec["tile_size"] = args.tile_size
+
+    start = time.perf_counter()
+    count = generate_map(spec, args.target)
+    print(f"{count} platforms written to {args.target} in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+절차적 맵 생성기: spec(dict)으로 대량의 플랫폼을 NumPy 배치 단위로 만든다
+
+    격자  : {"rows", "cols", "tile_size", "gap", "start_x", "start_y", "color"}
+    지형  : {"type": "terrain", "seed", "columns", "tile_size", "start_x", "base_y", "min_y", "max_y",
+             "max_step", "thickness", "color", "platform_chance", "platform_length", "platform_height",
+             "platform_color"}
+
+좌표는 BLOCK 개 단위 배치로 벡터 연산해서 만들고, 파일로 저장할 때는 배치를 바로 흘려 써서
+전체를 메모리에 올리지 않는다. 지형은 배치마다 (seed, 배치 번호)로 난수를 만들어서 결과가 항상 같다
+"""
+import json
+
+import numpy as np
+
+from .binary import BinaryMapWriter, RECORD_DTYPE, is_binary_map
+from .core import EditablePlatform
+
+BLOCK = 1 << 16         # 한 배치의 격자 칸/지형 열 수
+
+GRID_DEFAULTS = {
+    "rows": 1, "cols": 1, "tile_size": 40, "gap": 0,
+    "start_x": 0, "start_y": 0, "color": (0, 200, 0), "ptype": "default",
+}
+
+TERRAIN_DEFAULTS = {
+    "seed": 0, "columns": 1000, "tile_size": 32, "start_x": 0,
+    "base_y": 400, "min_y": 160, "max_y": 448,     # 지면 높이 범위 (픽셀, 타일 단위로 맞춰짐)
+    "max_step": 1,                                  # 열마다 지면이 오르내리는 최대 타일 수
+    "thickness": 1,                                 # 지면 두께 (타일)
+    "color": (0, 200, 0), "ptype": "default",
+    "platform_chance": 0.05,                        # 열마다 공중 발판이 생길 확률
+    "platform_length": (2, 6),                      # 공중 발판 길이 (타일, 양 끝 포함)
+    "platform_height": (2, 5),                      # 지면 위 높이 (타일, 양 끝 포함)
+    "platform_color": (150, 100, 50), "platform_ptype": "default",
+}
+
+
+def _records(x, y, width, height, color):
+    rec = np.zeros(len(x), dtype=RECORD_DTYPE)
+    rec["x"], rec["y"], rec["width"], rec["height"] = x, y, width, height
+    rec["r"], rec["g"], rec["b"] = color[:3]
+    return rec
+
+
+def _grid_batches(spec):
+    s = dict(GRID_DEFAULTS, **spec)
+    rows, cols, tile = s["rows"], s["cols"], s["tile_size"]
+    pitch = tile + s["gap"]
+    total = rows * cols
+    for start in range(0, total, BLOCK):
+        i = np.arange(start, min(start + BLOCK, total), dtype=np.int64)
+        x = s["start_x"] + (i % cols) * pitch
+        y = s["start_y"] + (i // cols) * pitch
+        yield _records(x, y, tile, tile, s["color"]), s["ptype"]
+
+
+def _fold(v, lo, hi):
+    # lo~hi 구간에서 튕기는 무작위 보행 (경계에서 반사)
+    span = hi - lo
+    if span <= 0:
+        return np.full_like(v, lo)
+    t = np.mod(v - lo, 2 * span)
+    return lo + np.where(t <= span, t, 2 * span - t)
+
+
+def _terrain_batches(spec):
+    s = dict(TERRAIN_DEFAULTS, **spec)
+    tile = s["tile_size"]
+    lo, hi = s["min_y"] // tile, s["max_y"] // tile
+    walk = s["base_y"] // tile          # 배치 사이에 이어지는 (반사 전) 보행 값
+    columns = s["columns"]
+    p_lo, p_hi = s["platform_length"]
+    h_lo, h_hi = s["platform_height"]
+    for block, start in enumerate(range(0, columns, BLOCK)):
+        n = min(BLOCK, columns - start)
+        rng = np.random.default_rng([s["seed"], block])
+        steps = rng.integers(-s["max_step"], s["max_step"] + 1, n)
+        path = walk + np.cumsum(steps)
+        walk = int(path[-1])
+        ground = _fold(path, lo, hi)
+        col_x = s["start_x"] + (start + np.arange(n, dtype=np.int64)) * tile
+        yield _records(col_x, ground * tile, tile, s["thickness"] * tile, s["color"]), s["ptype"]
+
+        # 공중 발판: 같은 난수 배치에서 위치/길이/높이를 한 번에 뽑는다
+        mask = rng.random(n) < s["platform_chance"]
+        k = int(mask.sum())
+        if k:
+            length = rng.integers(p_lo, p_hi + 1, k)
+            lift = rng.integers(h_lo, h_hi + 1, k)
+            yield (_records(col_x[mask], (ground[mask] - lift) * tile, length * tile, tile, s["platform_color"]),
+                   s["platform_ptype"])
+
+
+def iter_batches(spec):
+    """spec 으로 (RECORD_DTYPE 구조체 배열, ptype) 배치를 차례로 만든다"""
+    kind = spec.get("type", "grid")
+    if kind == "grid":
+        return _grid_batches(spec)
+    if kind == "terrain":
+        return _terrain_batches(spec)
+    raise ValueError(f"unknown map spec type: {kind}")
+
+
+def _write_json(batches, filename):
+    # JSON 도 배치마다 바로 써서 메모리에 전체 목록을 만들지 않는다
+    count = 0
+    with open(filename, "w") as f:
+        f.write("[")
+        for records, ptype in batches:
+            tail = f', "ptype": {json.dumps(ptype)}}}'
+            lines = [
+                f'{{"x": {x}, "y": {y}, "width": {w}, "height": {h}, "color": [{r}, {g}, {b}]{tail}'
+                for x, y, w, h, r, g, b in zip(*(records[name].tolist() for name in
+                                                 ("x", "y", "width", "height", "r", "g", "b")))
+            ]
+            if lines:
+                f.write((",\n" if count else "\n") + ",\n".join(lines))
+                count += len(lines)
+        f.write("\n]\n")
+    return count
+
+
+def generate_map(spec, filename=None):
+    """
+    spec 으로 맵 생성
+    - filename 이 없으면 EditablePlatform 목록 반환
+    - filename 이 있으면 배치 단위로 파일에 흘려 쓰고 플랫폼 수 반환 (.vmap 권장, 그 외는 JSON)
+    """
+    batches = iter_batches(spec)
+    if filename is None:
+        platforms = []
+        for records, ptype in batches:
+            for x, y, w, h, r, g, b in zip(*(records[name].tolist() for name in
+                                             ("x", "y", "width", "height", "r", "g", "b"))):
+                platforms.append(EditablePlatform(x, y, w, h, (r, g, b), ptype))
+        return platforms
+    if is_binary_map(filename):
+        with BinaryMapWriter(filename) as writer:
+            for records, ptype in batches:
+                writer.write_records(records, ptype)
+            return writer.count
+    return _write_json(batches, filename)
+
+
+def generate_into(map_data, spec):
+    """spec 으로 만든 플랫폼을 MapData 저장소에 열 단위로 바로 추가 (플랫폼 객체를 만들지 않음)"""
+    count = 0
+    for records, ptype in iter_batches(spec):
+        color = np.stack([records["r"], records["g"], records["b"]], axis=1)
+        map_data.store.extend(records["x"], records["y"], records["width"], records["height"], color, ptype)
+        count += len(records)
+    return count
@@ -1,7 +1,12 @@
 from PyQt5 import QtWidgets, QtCore, QtGui
-from .core import MapData, EditablePlatform
+import numpy as np
+from .core import MapData, EditablePlatform, load_platforms
+from .optimize import format_stats
+from .history import History, AddPlatform, RemovePlatforms, SetProperty, MovePlatforms, ReplaceAll
 import os
 
+MAP_FILE_FILTER = "JSON Files (*.json);;Binary Map Files (*.vmap)"
+
 class ToolWindow(QtWidgets.QMainWindow):
     """
     별도 툴 윈도우: 색 선택 및 속성 패널
@@ -47,7 +52,9 @@ class ToolWindow(QtWidgets.QMainWindow):
         layout = QtWidgets.QFormLayout(widget)
         self.spin_x = QtWidgets.QSpinBox(); self.spin_y = QtWidgets.QSpinBox()
         self.spin_w = QtWidgets.QSpinBox(); self.spin_h = QtWidgets.QSpinBox()
-        for spin in (self.spin_x, self.spin_y, self.spin_w, self.spin_h): spin.setRange(0, 2000)
+        # 줌/팬으로 음수나 먼 좌표도 쉽게 가므로 저장소 좌표 범위 전체를 받는다 (너비/높이는 0 이상)
+        for spin in (self.spin_x, self.spin_y): spin.setRange(-2 ** 31 + 1, 2 ** 31 - 1)
+        for spin in (self.spin_w, self.spin_h): spin.setRange(0, 2 ** 31 - 1)
         layout.addRow("X:", self.spin_x)
         layout.addRow("Y:", self.spin_y)
         layout.addRow("Width:", self.spin_w)
@@ -100,6 +107,21 @@ class MapEditorGUI(QtWidgets.QMainWindow):
         size_act = QtWidgets.QAction("Game Window Size", self)
         settings_menu.addAction(size_act)
         size_act.triggered.connect(self.on_set_window_size)
+        self.merge_act = QtWidgets.QAction("Merge Platforms on Export", self, checkable=True)
+        settings_menu.addAction(self.merge_act)
+        history_act = QtWidgets.QAction("Undo History Limit", self)
+        settings_menu.addAction(history_act)
+        history_act.triggered.connect(self.on_set_history_limit)
+
+        # View 메뉴
+        view_menu = menubar.addMenu("View")
+        for text, shortcut, slot in (("Zoom In", "Ctrl+=", lambda: self.canvas.zoom_by(1.25)),
+                                     ("Zoom Out", "Ctrl+-", lambda: self.canvas.zoom_by(0.8)),
+                                     ("Fit Map", "Ctrl+0", lambda: self.canvas.fit_view())):
+            act = QtWidgets.QAction(text, self)
+            act.setShortcut(shortcut)
+            view_menu.addAction(act)
+            act.triggered.connect(slot)
 
         # Window 메뉴
         window_menu = menubar.addMenu("Window")
@@ -109,18 +131,25 @@ class MapEditorGUI(QtWidgets.QMainWindow):
 
     def _apply_window_size(self):
         # 캔버스 및 메인 윈도우 크기 설정
-        self.canvas.set_fixed_size(self.max_width, self.max_height)
+        # 캔버스는 창 크기를 따라가므로 화면보다 크게 잡지 않는다 (넘는 부분은 줌/팬으로 본다)
+        self.canvas.set_world_size(self.max_width, self.max_height)
         menu_height = self.menuBar().sizeHint().height()
-        self.resize(self.max_width, self.max_height + menu_height)
+        screen = QtWidgets.QApplication.primaryScreen().availableGeometry()
+        self.resize(min(self.max_width, screen.width()), min(self.max_height + menu_height, screen.height()))
 
     def on_import(self):
-        path, _ = QtWidgets.QFileDialog.getOpenFileName(self, "Import Map", os.getcwd(), "JSON Files (*.json)")
+        path, _ = QtWidgets.QFileDialog.getOpenFileName(self, "Import Map", os.getcwd(), MAP_FILE_FILTER)
         if path:
-            self.canvas.save_history(); self.map_data.load(path); self.canvas.current = None; self.canvas.update()
+            self.canvas.set_selection([])
+            old = self.map_data.get_platforms()
+            self.canvas.history.execute(ReplaceAll(old, load_platforms(path)))
+            self.canvas.update()
 
     def on_export(self):
-        path, _ = QtWidgets.QFileDialog.getSaveFileName(self, "Export Map", os.getcwd(), "JSON Files (*.json)")
-        if path: self.map_data.save(path)
+        path, _ = QtWidgets.QFileDialog.getSaveFileName(self, "Export Map", os.getcwd(), MAP_FILE_FILTER)
+        if not path: return
+        stats = self.map_data.save(path, merge=self.merge_act.isChecked())
+        if stats is not None: self.statusBar().showMessage(format_stats(stats), 5000)
 
     def on_set_window_size(self):
         w, ok1 = QtWidgets.QInputDialog.getInt(self, "Set Width", "Max X (pixels):", self.max_width, 1, 5000)
@@ -130,93 +159,317 @@ class MapEditorGUI(QtWidgets.QMainWindow):
         self.max_width, self.max_height = w, h
         self._apply_window_size()
 
+    def on_set_history_limit(self):
+        history = self.canvas.history
+        n, ok1 = QtWidgets.QInputDialog.getInt(self, "Undo History", "Max entries:", history.max_entries, 1, 1000000)
+        if not ok1: return
+        mb, ok2 = QtWidgets.QInputDialog.getInt(self, "Undo History", "Max memory (MB):", history.max_bytes // (1024 * 1024), 1, 4096)
+        if not ok2: return
+        history.max_entries, history.max_bytes = n, mb * 1024 * 1024
+        history._trim()
+
     def on_show_tool_window(self):
         # ToolWindow를 새로 생성하여 표시
         self.tool_window = ToolWindow(self.canvas)
         self.tool_window.show()
 
 class Canvas(QtWidgets.QWidget):
+    """
+    맵 편집 캔버스: 줌/팬 가능한 월드 뷰
+    - 격자는 줌 배율별 타일 픽스맵으로 캐시해서 브러시 한 번으로 채운다
+    - 바뀐 영역만 다시 그리고(update(rect)), 화면 밖 플랫폼은 건너뛴다
+    - 축소해서 아주 작아진 플랫폼은 점으로 간략화해 그린다
+    """
+    MIN_ZOOM, MAX_ZOOM = 0.01, 16.0
+    LOD_PIXELS = 3          # 화면상 이 크기 미만이면 점으로 그림
+    GRID_MIN_PIXELS = 6     # 격자 칸이 이보다 작아지면 격자를 그리지 않음
+
     def __init__(self, map_data, parent=None):
         super().__init__(parent)
         self.map_data = map_data
         self.grid_size = 40
         self.mode = 'select'
-        self.current = None
+        self.current = None     # 속성 패널에 표시되는 플랫폼 (선택의 마지막)
+        self.selection = []
+        self._band = None       # 러버밴드 다중 선택
+        self._band_origin = None
         self.color = (0, 200, 0)
-        self.history = []
-        # 초기 최대값 설정
+        # 명령 기반 undo/redo (연속 이동/속성 변경은 하나로 합쳐짐)
+        self.history = History(map_data)
+        # 게임 화면 크기 (월드 경계선으로 표시)
         self.max_width = 640
         self.max_height = 480
+        # 뷰 변환: screen = (world - origin) * zoom
+        self.zoom = 1.0
+        self.origin = QtCore.QPointF(0, 0)
+        self._pan_start = None
+        self._grid_tile = None
+        self._grid_tile_zoom = None
+        self._brushes = {}
         self.setFocusPolicy(QtCore.Qt.FocusPolicy.StrongFocus)
         self.setMouseTracking(True)
-        # 초기 캔버스 크기 고정
-        self.setFixedSize(self.max_width, self.max_height)
+        self.setAttribute(QtCore.Qt.WidgetAttribute.WA_OpaquePaintEvent)
+        self.setMinimumSize(200, 150)
 
-    def set_fixed_size(self, w, h):
+    def set_world_size(self, w, h):
+        # 게임 화면 크기(월드 경계) 변경 - 캔버스 자체 크기는 창을 따라간다
         self.max_width, self.max_height = w, h
-        self.setFixedSize(w, h)
         self.update()
 
-    def save_history(self):
-        snap = [EditablePlatform.from_dict(p.to_dict()) for p in self.map_data.get_platforms()]
-        self.history.append(snap)
+    # ------------------------------------------------------------------ 좌표 변환
+    def to_world(self, x, y):
+        return x / self.zoom + self.origin.x(), y / self.zoom + self.origin.y()
 
+    def to_screen_rect(self, x, y, w, h):
+        z = self.zoom
+        return QtCore.QRectF((x - self.origin.x()) * z, (y - self.origin.y()) * z, w * z, h * z)
+
+    def _platform_damage(self, platforms):
+        """플랫폼들이 화면에서 차지하는 영역 (선택 테두리 포함)"""
+        region = QtCore.QRect()
+        for p in platforms:
+            region = region.united(self.to_screen_rect(p.x, p.y, p.width, p.height).toAlignedRect().adjusted(-3, -3, 3, 3))
+        return region
+
+    def _apply(self, action, platforms=None):
+        """편집 실행 후 바뀐 영역만 다시 그린다 (platforms 를 모르면 전체)"""
+        if platforms is None:
+            action(); self.update(); return
+        before = self._platform_damage(platforms)
+        action()
+        self.update(before.united(self._platform_damage(platforms)))
+
+    def _execute(self, command):
+        self._apply(lambda: self.history.execute(command), command.affected())
+
+    # ------------------------------------------------------------------ 편집
     def undo(self):
-        if self.history:
-            snap = self.history.pop(); self.map_data.platforms = snap; self.current = None; self.update()
+        command = self.history.undo_stack[-1] if self.history.can_undo() else None
+        if command: self._apply(self.history.undo, command.affected()); self.set_selection([])
+
+    def redo(self):
+        command = self.history.redo_stack[-1] if self.history.can_redo() else None
+        if command: self._apply(self.history.redo, command.affected()); self.set_selection([])
 
     def set_mode(self, mode): self.mode = mode
     def set_color(self, color): self.color = color
 
+    def set_selection(self, platforms):
+        # 이전 선택만 해제하고 바뀐 영역만 다시 그린다
+        for p in self.selection:
+            p.selected = False
+        platforms = list(platforms)
+        for p in platforms:
+            p.selected = True
+        self.update(self._platform_damage(self.selection + platforms))
+        self.selection = platforms
+        self.current = platforms[-1] if platforms else None
+
+    def _sync_tool_window(self):
+        tw = getattr(self.parent(), 'tool_window', None)
+        if tw is None or self.current is None: return
+        p = self.current
+        # 표시만 맞추는 것이므로 valueChanged -> update_property 로 명령이 쌓이지 않게 막는다
+        for spin, value in ((tw.spin_x, p.x), (tw.spin_y, p.y), (tw.spin_w, p.width), (tw.spin_h, p.height)):
+            spin.blockSignals(True)
+            spin.setValue(int(value))
+            spin.blockSignals(False)
+
+    def update_property(self, attr, val):
+        if self.current and getattr(self.current, attr) != val:
+            self._execute(SetProperty(self.current, attr, getattr(self.current, attr), val))
+
+
+    # ------------------------------------------------------------------ 그리기
+    def _brush(self, color):
+        brush = self._brushes.get(color)
+        if brush is None:
+            brush = self._brushes[color] = QtGui.QBrush(QtGui.QColor(*color))
+        return brush
+
+    def _grid_brush(self):
+        # 현재 줌의 격자 한 칸을 픽스맵 타일로 만들어 두고 재사용
+        cell = self.grid_size * self.zoom
+        if cell < self.GRID_MIN_PIXELS:
+            return None
+        if self._grid_tile is None or self._grid_tile_zoom != self.zoom:
+            # 정수 크기 타일을 칸 크기(실수)로 늘려 쓴다 - 내림이라 배율이 1 이상이어서 선이 빠지지 않는다
+            size = int(cell)
+            tile = QtGui.QPixmap(size, size)
+            tile.fill(QtGui.QColor(0, 0, 0, 0))
+            tp = QtGui.QPainter(tile)
+            tp.setPen(QtGui.QPen(QtGui.QColor(200, 200, 200, 80)))
+            tp.drawLine(0, 0, size - 1, 0); tp.drawLine(0, 0, 0, size - 1)
+            tp.end()
+            self._grid_tile, self._grid_tile_zoom = tile, self.zoom
+        brush = QtGui.QBrush(self._grid_tile)
+        # 월드 원점에 격자를 맞춘다: 타일 k 번째 칸의 시작이 화면 (k * grid_size - origin) * zoom 에 오도록
+        scale = cell / self._grid_tile.width()
+        transform = QtGui.QTransform.fromTranslate(-self.origin.x() * self.zoom, -self.origin.y() * self.zoom)
+        brush.setTransform(transform.scale(scale, scale))
+        return brush
+
+    def _draw_tiny(self, painter, damaged, sx, sy, colors):
+        """
+        화면에서 몇 픽셀도 안 되는 플랫폼(LOD): 점들을 감싸는 크기의 이미지 버퍼에 numpy 로 한 점씩 찍고 한 번에 그린다
+        같은 픽셀에 겹치면 z-순서상 나중 것이 남는다
+        """
+        px = sx.astype(np.int64); py = sy.astype(np.int64)
+        inside = ((px >= damaged.left()) & (px <= damaged.right())
+                  & (py >= damaged.top()) & (py <= damaged.bottom()))
+        if not inside.any():
+            return
+        px, py, colors = px[inside], py[inside], colors[inside].astype(np.uint32)
+        left, top = int(px.min()), int(py.min())
+        w, h = int(px.max()) - left + 1, int(py.max()) - top + 1
+        argb = np.zeros((h, w), dtype=np.uint32)
+        argb[py - top, px - left] = 0xFF000000 | (colors[:, 0] << 16) | (colors[:, 1] << 8) | colors[:, 2]
+        image = QtGui.QImage(argb.data, w, h, w * 4, QtGui.QImage.Format.Format_ARGB32_Premultiplied)
+        painter.drawImage(QtCore.QPoint(left, top), image)
+
     def paintEvent(self, event):
         painter = QtGui.QPainter(self)
-        pen = QtGui.QPen(QtGui.QColor(200, 200, 200, 80))
-        painter.setPen(pen)
-        for y in range(0, self.max_height + 2, self.grid_size): painter.drawLine(0, y, self.max_width, y)
-        for x in range(0, self.max_width + 2, self.grid_size): painter.drawLine(x, 0, x, self.max_height)
-        for p in self.map_data.get_platforms():
-            brush = QtGui.QBrush(QtGui.QColor(*p.color)); painter.setBrush(brush)
-            pen2 = QtGui.QPen(
-                QtCore.Qt.GlobalColor.white if getattr(p, 'selected', False) else QtCore.Qt.GlobalColor.transparent,
-                2
-            )
-            painter.setPen(pen2); painter.drawRect(p.x, p.y, p.width, p.height)
+        damaged = event.rect()
+        painter.setClipRect(damaged)
+        painter.fillRect(damaged, QtGui.QColor(0, 0, 0))
+        grid = self._grid_brush()
+        if grid is not None:
+            painter.fillRect(damaged, grid)
 
-    def update_property(self, attr, val):
-        if self.current: self.save_history(); setattr(self.current, attr, val); self.update()
+        # 월드 경계 (게임 화면 크기)
+        painter.setPen(QtGui.QPen(QtGui.QColor(120, 120, 255), 1, QtCore.Qt.PenStyle.DashLine))
+        painter.setBrush(QtCore.Qt.BrushStyle.NoBrush)
+        painter.drawRect(self.to_screen_rect(0, 0, self.max_width, self.max_height))
+
+        # 손상된 영역과 겹치는 플랫폼만 저장소 열에서 바로 읽어서 그린다
+        store = self.map_data.store
+        wx, wy = self.to_world(damaged.left(), damaged.top())
+        ww, wh = damaged.width() / self.zoom, damaged.height() / self.zoom
+        rows = store.rows_in_rect(wx, wy, ww + 1, wh + 1)
+        if len(rows):
+            z, ox, oy = self.zoom, self.origin.x(), self.origin.y()
+            sx = (store.x[rows] - ox) * z; sy = (store.y[rows] - oy) * z
+            sw = store.width[rows] * z; sh = store.height[rows] * z
+            tiny = (sw < self.LOD_PIXELS) & (sh < self.LOD_PIXELS)
+            # z-순서를 지키도록 점/사각형이 바뀌는 구간마다 나눠서 행 순서대로 그린다 (보통 구간은 하나)
+            cuts = np.flatnonzero(tiny[1:] != tiny[:-1]) + 1
+            for a, b in zip(np.concatenate(([0], cuts)).tolist(), np.concatenate((cuts, [len(rows)])).tolist()):
+                if tiny[a]:
+                    self._draw_tiny(painter, damaged, sx[a:b], sy[a:b], store.color[rows[a:b]])
+                    continue
+                for x, y, w, h, c in zip(sx[a:b].tolist(), sy[a:b].tolist(), sw[a:b].tolist(), sh[a:b].tolist(),
+                                         map(tuple, store.color[rows[a:b]].tolist())):
+                    painter.fillRect(QtCore.QRectF(x, y, w, h), self._brush(c))
+
+        # 선택 테두리 (손상 영역과 겹치는 것만)
+        if self.selection:
+            painter.setPen(QtGui.QPen(QtCore.Qt.GlobalColor.white, 2)); painter.setBrush(QtCore.Qt.BrushStyle.NoBrush)
+            area = QtCore.QRectF(damaged).adjusted(-2, -2, 2, 2)
+            for p in self.selection:
+                r = self.to_screen_rect(p.x, p.y, p.width, p.height)
+                if r.intersects(area):
+                    painter.drawRect(r)
 
+    # ------------------------------------------------------------------ 줌/팬
+    def pan_by(self, dx, dy):
+        """화면 픽셀 단위로 뷰 이동 - 기존 픽셀은 scroll 로 옮기고 드러난 부분만 다시 그림"""
+        dx, dy = int(dx), int(dy)      # 옮기는 픽셀 수와 원점 이동을 같게 맞춘다
+        self.origin -= QtCore.QPointF(dx / self.zoom, dy / self.zoom)
+        self.scroll(dx, dy)
+
+    def zoom_at(self, factor, sx, sy):
+        zoom = min(max(self.zoom * factor, self.MIN_ZOOM), self.MAX_ZOOM)
+        wx, wy = self.to_world(sx, sy)
+        self.zoom = zoom
+        self.origin = QtCore.QPointF(wx - sx / zoom, wy - sy / zoom)
+        self.update()
+
+    def zoom_by(self, factor):
+        self.zoom_at(factor, self.width() / 2, self.height() / 2)
+
+    def fit_view(self):
+        """맵 전체(플랫폼 + 게임 화면 경계)가 보이도록 줌/팬"""
+        box = self.map_data.store.bounding_box()
+        left, top, right, bottom = 0, 0, self.max_width, self.max_height
+        if box is not None:
+            left, top = min(left, box[0]), min(top, box[1])
+            right, bottom = max(right, box[2]), max(bottom, box[3])
+        zoom = min(self.width() / max(1, right - left), self.height() / max(1, bottom - top))
+        self.zoom = min(max(zoom, self.MIN_ZOOM), self.MAX_ZOOM)
+        self.origin = QtCore.QPointF(left, top)
+        self.update()
+
+    def wheelEvent(self, e):
+        delta = e.angleDelta()
+        if e.modifiers() & QtCore.Qt.KeyboardModifier.ControlModifier:
+            self.zoom_at(1.25 ** (delta.y() / 120), e.pos().x(), e.pos().y())
+        else:
+            self.pan_by(delta.x() / 2, delta.y() / 2)
+
+    # ------------------------------------------------------------------ 마우스/키보드
     def mousePressEvent(self, e):
-        x, y = e.x(), e.y()
+        if e.button() == QtCore.Qt.MouseButton.MiddleButton or (
+                e.button() == QtCore.Qt.MouseButton.RightButton):
+            self._pan_start = e.pos(); return
+        wx, wy = self.to_world(e.x(), e.y())
         if self.mode == 'add' and e.button() == QtCore.Qt.MouseButton.LeftButton:
-            self.save_history(); gx = (x // self.grid_size) * self.grid_size; gy = (y // self.grid_size) * self.grid_size
-            self.current = EditablePlatform(gx, gy, self.grid_size, self.grid_size, self.color)
-            self.map_data.add_platform(self.current)
+            gx = int(wx // self.grid_size) * self.grid_size; gy = int(wy // self.grid_size) * self.grid_size
+            p = EditablePlatform(gx, gy, self.grid_size, self.grid_size, self.color)
+            self.history.seal(); self._execute(AddPlatform(p))
+            self.current = p
         elif self.mode == 'select' and e.button() == QtCore.Qt.MouseButton.LeftButton:
-            for p in reversed(self.map_data.get_platforms()):
-                if QtCore.QRect(p.x, p.y, p.width, p.height).contains(x, y):
-                    for q in self.map_data.get_platforms(): q.selected = False
-                    p.selected = True; self.current = p
-                    tw = self.parent().tool_window; tw.spin_x.setValue(p.x); tw.spin_y.setValue(p.y)
-                    tw.spin_w.setValue(p.width); tw.spin_h.setValue(p.height)
-                    break
-        self.update()
+            self.history.seal()
+            shift = e.modifiers() & QtCore.Qt.KeyboardModifier.ShiftModifier
+            p = self.map_data.platform_at(wx, wy)
+            if p is None:
+                # 빈 곳에서 끌면 러버밴드 선택 (Shift 면 기존 선택에 추가)
+                if not shift: self.set_selection([])
+                self._band_origin = e.pos()
+                if self._band is None: self._band = QtWidgets.QRubberBand(QtWidgets.QRubberBand.Shape.Rectangle, self)
+                self._band.setGeometry(QtCore.QRect(e.pos(), QtCore.QSize()))
+                self._band.show()
+            elif shift:
+                self.set_selection([q for q in self.selection if q is not p] if p.selected else self.selection + [p])
+            else:
+                self.set_selection([p]); self._sync_tool_window()
 
     def mouseMoveEvent(self, e):
-        if self.current and self.mode == 'add':
-            gx = (e.x() // self.grid_size) * self.grid_size; gy = (e.y() // self.grid_size) * self.grid_size
-            self.current.x, self.current.y = gx, gy; self.update()
+        if self._pan_start is not None:
+            d = e.pos() - self._pan_start; self._pan_start = e.pos()
+            self.pan_by(d.x(), d.y()); return
+        if self._band_origin is not None:
+            self._band.setGeometry(QtCore.QRect(self._band_origin, e.pos()).normalized()); return
+        if self.current and self.mode == 'add' and e.buttons() & QtCore.Qt.MouseButton.LeftButton:
+            wx, wy = self.to_world(e.x(), e.y())
+            gx = int(wx // self.grid_size) * self.grid_size; gy = int(wy // self.grid_size) * self.grid_size
+            dx, dy = gx - self.current.x, gy - self.current.y
+            if dx or dy: self._execute(MovePlatforms([self.current], dx, dy))
 
-    def mouseReleaseEvent(self, e): self.current = None
+    def mouseReleaseEvent(self, e):
+        if self._pan_start is not None and e.button() in (QtCore.Qt.MouseButton.MiddleButton, QtCore.Qt.MouseButton.RightButton):
+            self._pan_start = None; return
+        if self._band_origin is not None:
+            band = QtCore.QRect(self._band_origin, e.pos()).normalized()
+            self._band.hide(); self._band_origin = None
+            left, top = self.to_world(band.left(), band.top())
+            found = self.map_data.query_rect(left, top, band.width() / self.zoom, band.height() / self.zoom)
+            if e.modifiers() & QtCore.Qt.KeyboardModifier.ShiftModifier:
+                found = self.selection + [p for p in found if not p.selected]
+            self.set_selection(found); self._sync_tool_window()
+        # 추가 모드에서만 놓을 때 해제 (선택 모드는 선택 유지 → 방향키 이동 가능)
+        if self.mode == 'add': self.current = None
+        self.history.seal()
 
     def keyPressEvent(self, e):
-        if self.current and self.mode == 'select' and e.key() in (QtCore.Qt.Key.Key_Delete, QtCore.Qt.Key.Key_Backspace):
-            self.save_history(); self.map_data.remove_platform(self.current); self.current = None; self.update(); return
-        if e.key() == QtCore.Qt.Key.Key_Z and e.modifiers() & QtCore.Qt.KeyboardModifier.ControlModifier: self.undo(); return
-        if self.current and self.mode == 'select':
-            self.save_history()
-            if e.key() == QtCore.Qt.Key.Key_Left:  self.current.x -= 1
-            if e.key() == QtCore.Qt.Key.Key_Right: self.current.x += 1
-            if e.key() == QtCore.Qt.Key.Key_Up:    self.current.y -= 1
-            if e.key() == QtCore.Qt.Key.Key_Down:  self.current.y += 1
-            tw = self.parent().tool_window; tw.spin_x.setValue(self.current.x); tw.spin_y.setValue(self.current.y)
-            self.update()
\ No newline at end of file
+        if self.selection and self.mode == 'select' and e.key() in (QtCore.Qt.Key.Key_Delete, QtCore.Qt.Key.Key_Backspace):
+            removed = self.selection; self.set_selection([]); self._execute(RemovePlatforms(removed)); return
+        ctrl = e.modifiers() & QtCore.Qt.KeyboardModifier.ControlModifier
+        shift = e.modifiers() & QtCore.Qt.KeyboardModifier.ShiftModifier
+        if e.key() == QtCore.Qt.Key.Key_Z and ctrl: self.redo() if shift else self.undo(); return
+        if e.key() == QtCore.Qt.Key.Key_Y and ctrl: self.redo(); return
+        if self.selection and self.mode == 'select':
+            dx, dy = {QtCore.Qt.Key.Key_Left: (-1, 0), QtCore.Qt.Key.Key_Right: (1, 0),
+                      QtCore.Qt.Key.Key_Up: (0, -1), QtCore.Qt.Key.Key_Down: (0, 1)}.get(e.key(), (0, 0))
+            if not (dx or dy): return
+            self._execute(MovePlatforms(self.selection, dx, dy))
+            self._sync_tool_window()
@@ -0,0 +1,241 @@
+import time
+from collections import deque
+
+# 명령 하나가 차지하는 대략적인 메모리 (바이트) - 예산 계산용 추정치
+_ENTRY_BYTES = 160
+_PLATFORM_BYTES = 200
+
+
+class Command:
+    """
+    되돌리기 가능한 편집 명령: 바뀐 내용만 기록한다
+    """
+    def do(self, map_data):
+        raise NotImplementedError
+
+    def undo(self, map_data):
+        raise NotImplementedError
+
+    def merge(self, other):
+        """other 를 이 명령에 합칠 수 있으면 합치고 True"""
+        return False
+
+    def size(self):
+        return _ENTRY_BYTES
+
+    def affected(self):
+        """영향받는 플랫폼 목록 (화면 부분 갱신용, 모르면 None)"""
+        return None
+
+
+class AddPlatform(Command):
+    def __init__(self, platform, index=None):
+        self.platform = platform
+        self.index = index
+
+    def do(self, map_data):
+        map_data.add_platform(self.platform, self.index)
+
+    def undo(self, map_data):
+        map_data.remove_platform(self.platform)
+
+    def affected(self):
+        return [self.platform]
+
+    def merge(self, other):
+        # 추가 직후 끌어서 옮긴 것은 추가 명령 하나로 충분 (되돌리면 통째로 사라짐)
+        return isinstance(other, MovePlatforms) and other.platforms == [self.platform]
+
+
+class RemovePlatform(Command):
+    def __init__(self, platform):
+        self.platform = platform
+        self.index = None
+
+    def do(self, map_data):
+        self.index = map_data.index_of(self.platform)
+        map_data.remove_platform(self.platform)
+
+    def undo(self, map_data):
+        # 원래 z-순서 자리로 복원
+        map_data.add_platform(self.platform, self.index)
+
+    def affected(self):
+        return [self.platform]
+
+
+class RemovePlatforms(Command):
+    """여러 플랫폼 한 번에 삭제 (다중 선택 삭제)"""
+    def __init__(self, platforms):
+        self.platforms = list(platforms)
+        self.removed = []
+
+    def do(self, map_data):
+        # 뒤쪽 z-순서부터 빼야 앞쪽 위치가 변하지 않는다
+        self.removed = sorted(((map_data.index_of(p), p) for p in self.platforms), key=lambda e: e[0], reverse=True)
+        for _, p in self.removed:
+            map_data.remove_platform(p)
+
+    def undo(self, map_data):
+        map_data.add_platforms(self.removed)
+
+    def affected(self):
+        return self.platforms
+
+    def size(self):
+        # 삭제된 플랫폼 객체(값이 슬롯으로 옮겨진 것)를 통째로 들고 있으므로 ReplaceAll 과 같이 개당 _PLATFORM_BYTES
+        return _ENTRY_BYTES + _PLATFORM_BYTES * len(self.platforms)
+
+
+class SetProperty(Command):
+    def __init__(self, platform, attr, old, new):
+        self.platform = platform
+        self.attr = attr
+        self.old = old
+        self.new = new
+
+    def do(self, map_data):
+        setattr(self.platform, self.attr, self.new)
+
+    def undo(self, map_data):
+        setattr(self.platform, self.attr, self.old)
+
+    def affected(self):
+        return [self.platform]
+
+    def merge(self, other):
+        # 스핀박스를 연달아 돌린 경우 하나로 합친다
+        if isinstance(other, SetProperty) and other.platform is self.platform and other.attr == self.attr:
+            self.new = other.new
+            return True
+        return False
+
+
+class MovePlatforms(Command):
+    def __init__(self, platforms, dx, dy):
+        self.platforms = list(platforms)
+        self.dx = dx
+        self.dy = dy
+
+    def do(self, map_data):
+        for p in self.platforms:
+            p.x += self.dx
+            p.y += self.dy
+
+    def undo(self, map_data):
+        for p in self.platforms:
+            p.x -= self.dx
+            p.y -= self.dy
+
+    def affected(self):
+        return self.platforms
+
+    def merge(self, other):
+        # 방향키로 연달아 민 경우 하나로 합친다
+        if isinstance(other, MovePlatforms) and other.platforms == self.platforms:
+            self.dx += other.dx
+            self.dy += other.dy
+            return True
+        return False
+
+
+class ReplaceAll(Command):
+    """맵 불러오기 등 전체 교체: 이전/이후 플랫폼 객체 목록을 보관"""
+    def __init__(self, old, new):
+        self.old = list(old)
+        self.new = list(new)
+
+    def _set(self, map_data, platforms):
+        map_data.clear()
+        for p in platforms:
+            map_data.add_platform(p)
+
+    def do(self, map_data):
+        self._set(map_data, self.new)
+
+    def undo(self, map_data):
+        self._set(map_data, self.old)
+
+    def size(self):
+        # new 는 지금 맵에 들어 있는 객체라 값은 저장소 열에 있다 - 기록이 따로 붙잡는 것은 old 쪽뿐
+        return _ENTRY_BYTES + _PLATFORM_BYTES * len(self.old) + 8 * len(self.new)
+
+
+class History:
+    """
+    명령 기반 undo/redo 스택
+    - 같은 대상에 대한 연속 명령은 merge_window(초) 안이면 하나로 합친다
+    - max_entries / max_bytes 를 넘으면 가장 오래된 기록부터 버린다 (가장 최근 기록 하나는 크기와 상관없이 남긴다)
+    """
+    def __init__(self, map_data, max_entries=1000, max_bytes=16 * 1024 * 1024, merge_window=1.0):
+        self.map_data = map_data
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.merge_window = merge_window
+        self.undo_stack = deque()
+        self.redo_stack = []
+        self.bytes = 0
+        self._last_time = 0.0
+        self._sealed = True
+
+    def execute(self, command):
+        command.do(self.map_data)
+        self.push(command)
+
+    def push(self, command):
+        """이미 적용된 명령을 기록"""
+        now = time.monotonic()
+        self.redo_stack.clear()
+        if (not self._sealed and self.undo_stack and now - self._last_time <= self.merge_window):
+            top = self.undo_stack[-1]
+            before = top.size()
+            if top.merge(command):
+                self.bytes += top.size() - before
+                self._last_time = now
+                return
+        self.undo_stack.append(command)
+        self.bytes += command.size()
+        self._last_time = now
+        self._sealed = False
+        self._trim()
+
+    def seal(self):
+        """다음 명령이 이전 명령과 합쳐지지 않게 한다 (선택 변경 등)"""
+        self._sealed = True
+
+    def _trim(self):
+        while len(self.undo_stack) > 1 and (len(self.undo_stack) > self.max_entries or self.bytes > self.max_bytes):
+            self.bytes -= self.undo_stack.popleft().size()
+
+    def can_undo(self):
+        return bool(self.undo_stack)
+
+    def can_redo(self):
+        return bool(self.redo_stack)
+
+    def undo(self):
+        if not self.undo_stack:
+            return None
+        command = self.undo_stack.pop()
+        self.bytes -= command.size()
+        command.undo(self.map_data)
+        self.redo_stack.append(command)
+        self._sealed = True
+        return command
+
+    def redo(self):
+        if not self.redo_stack:
+            return None
+        command = self.redo_stack.pop()
+        command.do(self.map_data)
+        self.undo_stack.append(command)
+        self.bytes += command.size()
+        self._sealed = True
+        self._trim()
+        return command
+
+    def clear(self):
+        self.undo_stack.clear()
+        self.redo_stack.clear()
+        self.bytes = 0
+        self._sealed = True
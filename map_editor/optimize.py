@@ -0,0 +1,140 @@
+"""
+플랫폼 병합 최적화: 붙어 있는 같은 색/같은 ptype 플랫폼을 최소 개수에 가까운 직사각형으로 합친다
+
+편집기 추가 모드는 grid_size 칸 하나마다 플랫폼을 만들어서 긴 바닥 하나가 수십 개의 사각형이 된다
+합친 결과는 원래 플랫폼들이 덮던 영역과 정확히 같다. 충돌 결과가 같은 것은 swept 충돌(engine.move_swept)뿐이다
+discrete 충돌은 걸어가다 타일 이음매에 걸리므로 합친 맵과 원래 맵에서 결과가 달라진다 - 게임은 --merge 를
+swept 충돌에서만 허용한다
+- 다른 색/ptype 플랫폼과 겹치는 플랫폼은 그리기 순서가 바뀌면 안 되므로 합치지 않는다
+- 크기가 0 인 플랫폼도 그대로 둔다
+"""
+from collections import defaultdict
+
+import numpy as np
+
+
+def _touching(a, b):
+    # 겹치거나 길이가 있는 변을 공유하면 연결 (꼭짓점만 닿는 것은 제외)
+    return ((a[0] <= b[2] and b[0] <= a[2] and a[1] < b[3] and b[1] < a[3])
+            or (a[1] <= b[3] and b[1] <= a[3] and a[0] < b[2] and b[0] < a[2]))
+
+
+def _overlapping(a, b):
+    return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+
+
+def _cells(r, cell):
+    # 경계에 닿는 것까지 찾도록 오른쪽/아래 끝 칸도 포함
+    for cy in range(r[1] // cell, r[3] // cell + 1):
+        for cx in range(r[0] // cell, r[2] // cell + 1):
+            yield cx, cy
+
+
+def _cover(rects):
+    """
+    rects 의 합집합을 겹치지 않는 직사각형으로 덮는다 (탐욕법: 가로로 최대한 늘린 뒤 세로로 늘림)
+    좌표 압축한 격자 위에서 계산하므로 타일 크기가 제각각이어도 된다
+    """
+    xs = sorted({v for r in rects for v in (r[0], r[2])})
+    ys = sorted({v for r in rects for v in (r[1], r[3])})
+    xi = {v: i for i, v in enumerate(xs)}
+    yi = {v: i for i, v in enumerate(ys)}
+    occ = np.zeros((len(ys) - 1, len(xs) - 1), dtype=bool)
+    for r in rects:
+        occ[yi[r[1]]:yi[r[3]], xi[r[0]]:xi[r[2]]] = True
+    rows, cols = occ.shape
+    out = []
+    for i in range(rows):
+        j = 0
+        while j < cols:
+            if not occ[i, j]:
+                j += 1
+                continue
+            j2 = j + 1
+            while j2 < cols and occ[i, j2]:
+                j2 += 1
+            i2 = i + 1
+            while i2 < rows and occ[i2, j:j2].all():
+                i2 += 1
+            occ[i:i2, j:j2] = False
+            out.append((xs[j], ys[i], xs[j2], ys[i2]))
+            j = j2
+    return out
+
+
+def merge_platforms(platforms, factory):
+    """
+    platforms: x/y/width/height/color/ptype 속성을 가진 객체들 (z-순서)
+    factory(x, y, width, height, color, ptype): 합친 사각형으로 새 객체를 만드는 함수
+    반환: (합친 목록, 통계 dict) - 합치지 않은 플랫폼은 원래 객체를 그대로 돌려준다
+    """
+    platforms = list(platforms)
+    rects = [(p.x, p.y, p.x + p.width, p.y + p.height) for p in platforms]
+    keys = [(tuple(p.color), p.ptype) for p in platforms]
+    n = len(platforms)
+
+    # 공간 해시로 이웃 후보만 비교
+    sizes = sorted(max(r[2] - r[0], r[3] - r[1]) for r in rects) or [1]
+    cell = max(16, sizes[len(sizes) // 2])
+    grid = defaultdict(list)
+    for i, r in enumerate(rects):
+        for c in _cells(r, cell):
+            grid[c].append(i)
+
+    parent = list(range(n))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    fixed = [r[2] <= r[0] or r[3] <= r[1] for r in rects]
+    links = []
+    seen = set()
+    for members in grid.values():
+        for a_pos, a in enumerate(members):
+            for b in members[a_pos + 1:]:
+                pair = (a, b) if a < b else (b, a)
+                if pair in seen:
+                    continue
+                seen.add(pair)
+                ra, rb = rects[a], rects[b]
+                if keys[a] != keys[b]:
+                    if _overlapping(ra, rb):
+                        fixed[a] = fixed[b] = True
+                elif _touching(ra, rb):
+                    links.append(pair)
+    # 고정된 플랫폼은 어느 그룹에도 넣지 않는다
+    for a, b in links:
+        if not fixed[a] and not fixed[b]:
+            parent[find(a)] = find(b)
+
+    groups = defaultdict(list)
+    for i in range(n):
+        groups[find(i)].append(i)
+
+    # 결과는 각 그룹의 첫 멤버 자리(z-순서)에 놓는다
+    out = []
+    for i in range(n):
+        members = groups[find(i)]
+        if members[0] != i:
+            continue
+        if len(members) == 1:
+            out.append(platforms[i])
+            continue
+        covered = _cover([rects[m] for m in members])
+        if len(covered) >= len(members):
+            out.extend(platforms[m] for m in members)
+            continue
+        color, ptype = keys[i]
+        out.extend(factory(l, t, r - l, b - t, color, ptype) for l, t, r, b in covered)
+
+    stats = {"before": n, "after": len(out)}
+    return out, stats
+
+
+def format_stats(stats):
+    before, after = stats["before"], stats["after"]
+    saved = 100.0 * (before - after) / before if before else 0.0
+    return f"platforms merged: {before} -> {after} ({saved:.1f}% fewer)"
@@ -0,0 +1,143 @@
+class _Node:
+    __slots__ = ("x", "y", "size", "depth", "items", "children")
+
+    def __init__(self, x, y, size, depth):
+        self.x, self.y, self.size, self.depth = x, y, size, depth
+        self.items = {}         # id -> (left, top, right, bottom)
+        self.children = None
+
+    def contains(self, r):
+        return self.x <= r[0] and self.y <= r[1] and r[2] <= self.x + self.size and r[3] <= self.y + self.size
+
+    def child_for(self, r):
+        """r 을 통째로 담는 자식 노드 (걸치면 None)"""
+        half = self.size / 2
+        mx, my = self.x + half, self.y + half
+        if r[2] <= mx:
+            col = 0
+        elif r[0] >= mx:
+            col = 1
+        else:
+            return None
+        if r[3] <= my:
+            row = 0
+        elif r[1] >= my:
+            row = 1
+        else:
+            return None
+        return self.children[row * 2 + col]
+
+    def split(self):
+        half = self.size / 2
+        d = self.depth + 1
+        self.children = [_Node(self.x, self.y, half, d), _Node(self.x + half, self.y, half, d),
+                         _Node(self.x, self.y + half, half, d), _Node(self.x + half, self.y + half, half, d)]
+
+
+class Quadtree:
+    """
+    사각형 id 공간 인덱스 (정사각 노드 쿼드트리)
+    - 항목은 자신을 통째로 담는 가장 작은 노드에 들어가고, 자식 경계에 걸치면 부모에 남는다
+    - 범위 밖 항목이 들어오면 루트를 두 배씩 키워서 음수 좌표나 끝없이 넓은 맵도 받는다
+    - 결과 순서는 정해져 있지 않으므로 z-순서가 필요하면 호출 쪽에서 정렬한다 (MapData.query_rect 참고)
+    """
+    def __init__(self, bounds=(0, 0, 1024), capacity=16, max_depth=16):
+        x, y, size = bounds
+        self.capacity = capacity
+        self.max_depth = max_depth
+        self.root = _Node(x, y, size, 0)
+        self._where = {}        # id -> 노드
+
+    def __len__(self):
+        return len(self._where)
+
+    def __contains__(self, item):
+        return item in self._where
+
+    def clear(self):
+        r = self.root
+        self.root = _Node(r.x, r.y, r.size, 0)
+        self._where.clear()
+
+    def _grow(self, r):
+        # 루트를 r 쪽으로 두 배씩 넓힌다 (깊이는 상대값이라 다시 매기지 않고 max_depth 만 늘린다)
+        while not self.root.contains(r):
+            old = self.root
+            x = old.x - old.size if r[0] < old.x else old.x
+            y = old.y - old.size if r[1] < old.y else old.y
+            root = _Node(x, y, old.size * 2, old.depth - 1)
+            root.split()
+            root.children[(old.y != y) * 2 + (old.x != x)] = old
+            self.root = root
+
+    def insert(self, item, x, y, width, height):
+        r = (x, y, x + width, y + height)
+        if not self.root.contains(r):
+            self._grow(r)
+        node = self.root
+        while True:
+            if node.children is not None:
+                child = node.child_for(r)
+                if child is not None:
+                    node = child
+                    continue
+            node.items[item] = r
+            self._where[item] = node
+            if (node.children is None and len(node.items) > self.capacity
+                    and node.depth - self.root.depth < self.max_depth):
+                self._split(node)
+            return
+
+    def _split(self, node):
+        node.split()
+        items = node.items
+        node.items = {}
+        for item, r in items.items():
+            target = node.child_for(r) or node
+            target.items[item] = r
+            self._where[item] = target
+
+    def remove(self, item):
+        node = self._where.pop(item)
+        del node.items[item]
+
+    def update(self, item, x, y, width, height):
+        node = self._where[item]
+        r = (x, y, x + width, y + height)
+        # 같은 노드에 그대로 머무는 경우(작은 이동)는 사각형만 바꾼다
+        if node.contains(r) and (node.children is None or node.child_for(r) is None):
+            node.items[item] = r
+            return
+        self.remove(item)
+        self.insert(item, x, y, width, height)
+
+    def query_rect(self, left, top, width, height):
+        """사각형과 겹치는(경계만 닿는 것 제외) id 목록"""
+        right, bottom = left + width, top + height
+        out = []
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if (node.x >= right or node.y >= bottom
+                    or node.x + node.size <= left or node.y + node.size <= top):
+                continue
+            for item, r in node.items.items():
+                if r[0] < right and r[2] > left and r[1] < bottom and r[3] > top:
+                    out.append(item)
+            if node.children is not None:
+                stack.extend(node.children)
+        return out
+
+    def query_point(self, x, y):
+        """점 (x, y)를 포함하는 id 목록 (왼쪽/위 경계 포함, 오른쪽/아래 경계 제외)"""
+        out = []
+        node = self.root
+        while node is not None:
+            for item, r in node.items.items():
+                if r[0] <= x < r[2] and r[1] <= y < r[3]:
+                    out.append(item)
+            if node.children is None:
+                break
+            half = node.size / 2
+            node = node.children[(y >= node.y + half) * 2 + (x >= node.x + half)]
+        return out
@@ -0,0 +1,310 @@
+import numpy as np
+
+
+def _coord(value):
+    # 열은 정수라서 실수 좌표/크기는 명시적으로 반올림한다 (숫자가 아니면 오류)
+    if isinstance(value, (bool, np.bool_)) or not isinstance(value, (int, float, np.integer, np.floating)):
+        raise ValueError(f"platform coordinate must be a number, got {value!r}")
+    return int(value) if isinstance(value, (int, np.integer)) else round(value)
+
+
+def _coords(values):
+    # _coord 의 배열판: 실수 배열은 round() 와 같은 규칙(짝수 쪽 반올림)으로 정수로 바꾼다
+    values = np.asarray(values)
+    if values.dtype.kind in "iu":
+        return values
+    if values.dtype.kind != "f":
+        raise ValueError(f"platform coordinates must be numbers, got dtype {values.dtype}")
+    return np.rint(values).astype(np.int64)
+
+
+class PlatformStore:
+    """
+    플랫폼 컬럼 저장소: x/y/width/height/color/ptype 를 NumPy 배열 열(column)로 보관
+    행 순서가 곧 z-순서(그리기/선택 순서)이며, 각 플랫폼은 바뀌지 않는 id 로 가리킨다
+    삭제는 표시만 해 두었다가(tombstone) 일정 비율이 넘으면 한 번에 압축한다
+    """
+    FIELDS = ("x", "y", "width", "height")
+
+    def __init__(self, capacity=64):
+        self.size = 0           # 사용 중인 행 수 (삭제 표시된 행 포함)
+        self.live = 0           # 살아 있는 행 수
+        self.x = np.zeros(capacity, dtype=np.int64)
+        self.y = np.zeros(capacity, dtype=np.int64)
+        self.width = np.zeros(capacity, dtype=np.int64)
+        self.height = np.zeros(capacity, dtype=np.int64)
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+        self.ptype = np.zeros(capacity, dtype=np.int32)
+        self.ids = np.zeros(capacity, dtype=np.int64)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.ptypes = []        # ptype 문자열 테이블
+        self._ptype_codes = {}
+        self._rows = {}         # id -> 행 번호
+        self._next_id = 0
+        self.version = 0        # 구조(추가/삭제/순서)가 바뀔 때마다 증가
+        self.index = None       # 연결된 공간 인덱스 (attach_index)
+
+    def __len__(self):
+        return self.live
+
+    def __contains__(self, pid):
+        return pid in self._rows
+
+    # ------------------------------------------------------------------ 내부
+    def _columns(self):
+        return (self.x, self.y, self.width, self.height, self.color, self.ptype, self.ids, self.alive)
+
+    def _grow(self, need):
+        capacity = len(self.x)
+        if need <= capacity:
+            return
+        while capacity < need:
+            capacity *= 2
+        for name in ("x", "y", "width", "height", "color", "ptype", "ids", "alive"):
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:self.size] = old[:self.size]
+            setattr(self, name, new)
+
+    def ptype_code(self, ptype):
+        code = self._ptype_codes.get(ptype)
+        if code is None:
+            code = self._ptype_codes[ptype] = len(self.ptypes)
+            self.ptypes.append(ptype)
+        return code
+
+    def row(self, pid):
+        return self._rows[pid]
+
+    # ------------------------------------------------------------------ 추가/삭제
+    def append(self, x, y, width, height, color=(0, 200, 0), ptype="default"):
+        x, y, width, height = _coord(x), _coord(y), _coord(width), _coord(height)
+        self._grow(self.size + 1)
+        r = self.size
+        pid = self._next_id
+        self._next_id += 1
+        self.x[r], self.y[r], self.width[r], self.height[r] = x, y, width, height
+        self.color[r] = color[:3]
+        self.ptype[r] = self.ptype_code(ptype)
+        self.ids[r] = pid
+        self.alive[r] = True
+        self._rows[pid] = r
+        self.size += 1
+        self.live += 1
+        self.version += 1
+        if self.index is not None:
+            self.index.insert(pid, x, y, width, height)
+        return pid
+
+    def insert(self, index, x, y, width, height, color=(0, 200, 0), ptype="default"):
+        """z-순서 index 위치에 끼워 넣기 (되돌리기에서 삭제된 플랫폼을 원래 자리로 복원할 때 사용)"""
+        if index >= self.live:
+            return self.append(x, y, width, height, color, ptype)
+        x, y, width, height = _coord(x), _coord(y), _coord(width), _coord(height)
+        r = int(np.flatnonzero(self.alive[:self.size])[index])
+        self._grow(self.size + 1)
+        for col in self._columns():
+            col[r + 1:self.size + 1] = col[r:self.size].copy()
+        self.size += 1
+        # 한 칸씩 밀린 r 뒤쪽 행만 번호를 고친다
+        shifted = np.flatnonzero(self.alive[r + 1:self.size]) + (r + 1)
+        self._rows.update(zip(self.ids[shifted].tolist(), shifted.tolist()))
+        pid = self._next_id
+        self._next_id += 1
+        self.x[r], self.y[r], self.width[r], self.height[r] = x, y, width, height
+        self.color[r] = color[:3]
+        self.ptype[r] = self.ptype_code(ptype)
+        self.ids[r] = pid
+        self.alive[r] = True
+        self._rows[pid] = r
+        self.live += 1
+        self.version += 1
+        if self.index is not None:
+            self.index.insert(pid, x, y, width, height)
+        return pid
+
+    def insert_many(self, indices, values):
+        """
+        여러 플랫폼을 한 번에 끼워 넣고 id 배열 반환 - 다중 삭제를 되돌릴 때 행 이동/번호 갱신을 한 번만 한다
+        indices: 오름차순 z-순서 위치 (insert 를 그 순서로 부른 것과 같은 결과), values: (x, y, width, height, color, ptype) 목록
+        """
+        n = len(values)
+        if not n:
+            return np.zeros(0, dtype=np.int64)
+        self.compact()
+        old = self.size
+        m = old + n
+        self._grow(m)
+        pos = np.minimum(np.asarray(indices, dtype=np.int64), old + np.arange(n))   # 범위 밖이면 insert 처럼 맨 뒤
+        keep = np.ones(m, dtype=bool)
+        keep[pos] = False
+        keep = np.flatnonzero(keep)
+        for col in self._columns():
+            col[keep] = col[:old].copy()
+        x, y, width, height, color, ptype = zip(*values)
+        self.x[pos], self.y[pos] = [_coord(v) for v in x], [_coord(v) for v in y]
+        self.width[pos], self.height[pos] = [_coord(v) for v in width], [_coord(v) for v in height]
+        self.color[pos] = np.array([c[:3] for c in color], dtype=np.uint8)
+        self.ptype[pos] = [self.ptype_code(t) for t in ptype]
+        ids = np.arange(self._next_id, self._next_id + n, dtype=np.int64)
+        self.ids[pos] = ids
+        self.alive[pos] = True
+        self._next_id += n
+        self.size = m
+        self.live += n
+        self._rows = dict(zip(self.ids[:m].tolist(), range(m)))
+        self.version += 1
+        if self.index is not None:
+            self._index_rows(pos)
+        return ids
+
+    def index_of(self, pid):
+        """살아 있는 플랫폼 중 z-순서 위치"""
+        return int(np.count_nonzero(self.alive[:self._rows[pid]]))
+
+    def extend(self, x, y, width, height, color=(0, 200, 0), ptype="default"):
+        """
+        배열로 여러 플랫폼을 한 번에 추가하고 id 배열 반환
+        color 는 한 색 또는 (n, 3) 배열, ptype 은 공통 문자열 또는 행마다의 문자열 목록
+        """
+        x = _coords(x)
+        n = len(x)
+        self._grow(self.size + n)
+        s, e = self.size, self.size + n
+        self.x[s:e], self.y[s:e] = x, _coords(y)
+        self.width[s:e], self.height[s:e] = _coords(width), _coords(height)
+        self.color[s:e] = np.asarray(color, dtype=np.uint8).reshape(-1, 3)
+        if isinstance(ptype, str):
+            self.ptype[s:e] = self.ptype_code(ptype)
+        else:
+            self.ptype[s:e] = np.fromiter((self.ptype_code(t) for t in ptype), dtype=np.int32, count=n)
+        ids = np.arange(self._next_id, self._next_id + n, dtype=np.int64)
+        self.ids[s:e] = ids
+        self.alive[s:e] = True
+        self._rows.update(zip(ids.tolist(), range(s, e)))
+        self._next_id += n
+        self.size = e
+        self.live += n
+        self.version += 1
+        if self.index is not None:
+            self._index_rows(np.arange(s, e))
+        return ids
+
+    def remove(self, pid):
+        r = self._rows.pop(pid)
+        self.alive[r] = False
+        if self.index is not None:
+            self.index.remove(pid)
+        self.live -= 1
+        self.version += 1
+        if self.size - self.live > max(64, self.size // 2):
+            self.compact()
+
+    def compact(self):
+        """삭제 표시된 행을 걷어내고 순서를 유지한 채 앞으로 당긴다"""
+        keep = np.flatnonzero(self.alive[:self.size])
+        n = len(keep)
+        for col in self._columns():
+            col[:n] = col[keep]
+        self.alive[n:self.size] = False
+        self.size = n
+        self._rows = dict(zip(self.ids[:n].tolist(), range(n)))
+
+    def clear(self):
+        self.alive[:self.size] = False
+        self.size = self.live = 0
+        self._rows.clear()
+        self.version += 1
+        if self.index is not None:
+            self.index.clear()
+
+    # ------------------------------------------------------------------ 공간 인덱스
+    def attach_index(self, index):
+        """
+        공간 인덱스(insert/remove/update/clear 를 가진 객체, 예: Quadtree)를 연결하고 현재 플랫폼으로 채운다
+        이후 추가/삭제/이동/크기 변경이 모두 인덱스에 바로 반영된다
+        """
+        index.clear()
+        self.index = index
+        self._index_rows(self.live_rows())
+        return index
+
+    def _index_rows(self, rows):
+        insert = self.index.insert
+        for pid, x, y, w, h in zip(self.ids[rows].tolist(), self.x[rows].tolist(), self.y[rows].tolist(),
+                                   self.width[rows].tolist(), self.height[rows].tolist()):
+            insert(pid, x, y, w, h)
+
+    # ------------------------------------------------------------------ 값 읽기/쓰기
+    def get(self, pid, field):
+        r = self._rows[pid]
+        if field == "color":
+            return tuple(int(c) for c in self.color[r])
+        if field == "ptype":
+            return self.ptypes[self.ptype[r]]
+        return int(getattr(self, field)[r])
+
+    def set(self, pid, field, value):
+        r = self._rows[pid]
+        if field == "color":
+            self.color[r] = value[:3]
+        elif field == "ptype":
+            self.ptype[r] = self.ptype_code(value)
+        else:
+            getattr(self, field)[r] = _coord(value)
+            if self.index is not None:
+                self.index.update(pid, int(self.x[r]), int(self.y[r]), int(self.width[r]), int(self.height[r]))
+
+    def values(self, pid):
+        return tuple(self.get(pid, f) for f in self.FIELDS + ("color", "ptype"))
+
+    # ------------------------------------------------------------------ 벡터 연산
+    def live_rows(self):
+        return np.flatnonzero(self.alive[:self.size])
+
+    def live_ids(self):
+        return self.ids[self.live_rows()]
+
+    def _rows_of(self, ids):
+        if ids is None:
+            return self.live_rows()
+        return np.fromiter((self._rows[int(i)] for i in ids), dtype=np.int64, count=len(ids))
+
+    def translate(self, dx, dy, ids=None):
+        """ids(없으면 전체) 플랫폼을 (dx, dy) 만큼 이동"""
+        rows = self._rows_of(ids)
+        self.x[rows] += dx
+        self.y[rows] += dy
+        if self.index is not None:
+            update = self.index.update
+            for pid, x, y, w, h in zip(self.ids[rows].tolist(), self.x[rows].tolist(), self.y[rows].tolist(),
+                                       self.width[rows].tolist(), self.height[rows].tolist()):
+                update(pid, x, y, w, h)
+
+    def filter_ptype(self, ptype):
+        """해당 ptype 플랫폼 id 를 z-순서대로 반환"""
+        code = self._ptype_codes.get(ptype)
+        if code is None:
+            return np.zeros(0, dtype=np.int64)
+        rows = self.live_rows()
+        return self.ids[rows[self.ptype[rows] == code]]
+
+    def bounding_box(self, ids=None):
+        """(left, top, right, bottom) - 플랫폼이 없으면 None"""
+        rows = self._rows_of(ids)
+        if not len(rows):
+            return None
+        return (int(self.x[rows].min()), int(self.y[rows].min()),
+                int((self.x[rows] + self.width[rows]).max()), int((self.y[rows] + self.height[rows]).max()))
+
+    def rows_in_rect(self, left, top, width, height):
+        """사각형과 겹치는 살아 있는 행 번호를 z-순서대로 반환 (열을 바로 읽는 그리기용)"""
+        rows = self.live_rows()
+        x, y = self.x[rows], self.y[rows]
+        hit = ((x < left + width) & (x + self.width[rows] > left)
+               & (y < top + height) & (y + self.height[rows] > top))
+        return rows[hit]
+
+    def query_rect(self, left, top, width, height):
+        """사각형과 겹치는 플랫폼 id 를 z-순서대로 반환"""
+        return self.ids[self.rows_in_rect(left, top, width, height)]
@@ -0,0 +1,24 @@
+"""
+BatchPhysics(NumPy 일괄 경로)와 main.Player(스칼라 경로)가 프레임마다 같은 상태를 내는지 검사
+engine/examples/physics_conformance.py 의 run() 을 고정 시드 몇 개로 돌린다
+"""
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from engine.examples.physics_conformance import run
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2, 7])
+def test_single_agent_matches_player(seed):
+    run(agents=1, frames=1500, seed=seed)
+
+
+@pytest.mark.parametrize("seed", [3, 11])
+def test_batch_matches_player(seed):
+    run(agents=4, frames=1000, seed=seed)
@@ -1 +1,24 @@
-from .plotter import plot_value
\ No newline at end of file
+import importlib
+
+# 처음 쓸 때 불러올 이름 -> 모듈 (matplotlib/multiprocessing 등은 실제로 그릴 때만 필요하다)
+_LAZY = {
+    "plot_value": ".plotter",
+    "Monitor": ".monitor",
+    "get_monitor": ".monitor",
+    "ProcessPlot": ".shm",
+    "SharedRing": ".shm",
+    "Recorder": ".telemetry",
+    "TelemetryTail": ".telemetry",
+    "load_telemetry": ".telemetry",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
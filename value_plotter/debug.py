@@ -1,5 +1,4 @@
 import logging
-import remote_pdb as rpdb
 
 
 def setup_logging():
@@ -12,5 +11,6 @@ def setup_logging():
 
 def setup_debugger(port=4444):
     """원격 디버거 대기 상태 설정"""
+    import remote_pdb as rpdb      # 디버거를 켤 때만 필요
     logging.debug(f"Starting remote debugger on port {port}")
     rpdb.set_trace(port=port)
\ No newline at end of file
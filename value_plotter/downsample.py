@@ -0,0 +1,31 @@
+import numpy as np
+
+
+def lttb(x, y, threshold):
+    """
+    Largest-Triangle-Three-Buckets 다운샘플링
+    모양(봉우리/골짜기)을 최대한 유지하면서 점 개수를 threshold 개로 줄인다
+    x 는 오름차순이어야 하며, 점이 threshold 이하이면 그대로 반환
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return x, y
+    # 첫 점과 마지막 점은 항상 유지, 가운데를 threshold-2 개 구간으로 나눈다
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    out = np.empty(threshold, dtype=np.int64)
+    out[0], out[-1] = 0, n - 1
+    a = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        # 다음 구간의 평균점 (마지막 구간은 끝점)
+        if i + 2 < len(edges):
+            nxt = slice(edges[i + 1], edges[i + 2])
+            cx, cy = x[nxt].mean(), y[nxt].mean()
+        else:
+            cx, cy = x[-1], y[-1]
+        ax, ay = x[a], y[a]
+        bx, by = x[start:end], y[start:end]
+        area = np.abs((ax - cx) * (by - ay) - (ax - bx) * (cy - ay))
+        a = start + int(area.argmax())
+        out[i + 1] = a
+    return x[out], y[out]
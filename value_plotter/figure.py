@@ -0,0 +1,79 @@
+import matplotlib.pyplot as plt
+
+
+class BlitFigure:
+    """
+    여러 선을 blit 으로 갱신하는 그림 하나 (축 그룹마다 서브플롯, x 축 공유)
+    축 범위가 바뀔 때만 전체를 다시 그리고, 평소에는 저장해 둔 배경 위에 선만 다시 그린다
+    """
+    def __init__(self, title=None):
+        plt.ion()                     # 인터랙티브 모드 켜기
+        self.fig = plt.figure()
+        if title:
+            self.fig.suptitle(title)
+        self.canvas = self.fig.canvas
+        self.background = None
+        self.axes = {}                # 그룹 -> Axes
+        self.lines = {}               # 이름 -> (Line2D, Axes)
+        self.canvas.mpl_connect("draw_event", self._on_draw)
+        plt.show(block=False)
+
+    def _on_draw(self, _event):
+        # 창 크기 변경 등으로 전체가 다시 그려지면 배경을 새로 저장
+        self.background = self.canvas.copy_from_bbox(self.fig.bbox)
+
+    def layout(self, groups):
+        """groups: {축 이름: [선 이름, ...]} - 순서대로 위에서 아래로 서브플롯"""
+        self.fig.clf()
+        self.axes, self.lines = {}, {}
+        first = None
+        for i, (group, names) in enumerate(groups.items()):
+            ax = self.fig.add_subplot(len(groups), 1, i + 1, sharex=first)
+            first = first or ax
+            ax.set_ylabel(group)
+            for name in names:
+                (line,) = ax.plot([], [], animated=True, label=name)
+                self.lines[name] = (line, ax)
+            if len(names) > 1:
+                ax.legend(loc="upper left")
+            self.axes[group] = ax
+        if first is not None:
+            ax.set_xlabel("time (s)")
+        self.canvas.draw()
+
+    def _fit(self, ax, x0, x1, lo, hi):
+        """데이터가 현재 축 범위를 벗어나면 여유를 두고 넓힌다 (True: 전체 다시 그림 필요)"""
+        changed = False
+        cx0, cx1 = ax.get_xlim()
+        if x0 < cx0 or x1 > cx1:
+            span = max(x1 - x0, 1.0)
+            ax.set_xlim(x0, x0 + span * 1.25)
+            changed = True
+        cy0, cy1 = ax.get_ylim()
+        if lo < cy0 or hi > cy1:
+            pad = max(hi - lo, abs(hi), 1e-9) * 0.1
+            ax.set_ylim(lo - pad, hi + pad)
+            changed = True
+        return changed
+
+    def update(self, data):
+        """data: {선 이름: (x, y)}"""
+        bounds = {}
+        for name, (x, y) in data.items():
+            line, ax = self.lines[name]
+            line.set_data(x, y)
+            if len(x):
+                b = bounds.get(ax)
+                cur = (x[0], x[-1], float(y.min()), float(y.max()))
+                bounds[ax] = cur if b is None else (min(b[0], cur[0]), max(b[1], cur[1]),
+                                                    min(b[2], cur[2]), max(b[3], cur[3]))
+        changed = False
+        for ax, b in bounds.items():
+            changed |= self._fit(ax, *b)
+        if changed or self.background is None:
+            self.canvas.draw()
+        self.canvas.restore_region(self.background)
+        for line, ax in self.lines.values():
+            ax.draw_artist(line)
+        self.canvas.blit(self.fig.bbox)
+        self.canvas.flush_events()
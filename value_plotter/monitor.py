@@ -0,0 +1,147 @@
+import time
+import threading
+from .ring import RingBuffer
+from .downsample import lttb
+from .utils import get_value_and_time
+
+
+class Series:
+    """모니터링 중인 값 하나: 자기 샘플링 주기와 링 버퍼를 가진다"""
+    def __init__(self, name, source, interval, axis, capacity, window, downsample, max_points, sink, plot,
+                 feed=None):
+        if downsample not in (None, "lttb"):
+            raise ValueError(f"unknown downsample mode: {downsample}")
+        self.name = name
+        self.source = source
+        self.interval = interval
+        self.axis = axis or name
+        self.buffer = RingBuffer(capacity)
+        self.window = window
+        self.downsample = downsample
+        self.max_points = max_points
+        self.sink = sink        # 값을 받을 함수 (예: ProcessPlot.push) - 있으면 버퍼 대신 여기로 보낸다
+        self.plot = plot and sink is None
+        self.feed = feed        # 새 (times, values) 배열을 돌려주는 함수 (예: TelemetryTail.poll) - 있으면 source 대신 쓴다
+        self.next_due = 0.0
+
+    def data(self):
+        x, y = self.buffer.view()
+        if self.window is not None and len(x):
+            keep = x >= x[-1] - self.window
+            x, y = x[keep], y[keep]
+        if self.downsample == "lttb":
+            x, y = lttb(x, y, self.max_points)
+        return x, y
+
+
+class Monitor:
+    """
+    여러 값을 스레드 하나로 샘플링하고 그림 하나에 그린다
+    - 값마다 샘플링 주기가 달라도 되며, 가장 먼저 돌아오는 값의 시각까지만 잔다
+    - axis 가 같은 값들은 한 서브플롯을 공유한다
+    - 값을 더해도 스레드/그림 수는 늘지 않는다
+    """
+    def __init__(self, title=None, redraw_interval=1 / 30, show_plot=True):
+        self.title = title
+        self.redraw_interval = redraw_interval
+        self.show_plot = show_plot
+        self.series = []
+        self._lock = threading.Lock()
+        self._layout_version = 0
+        self._stop = threading.Event()
+        self._thread = None
+        self._start = time.monotonic()
+
+    def add(self, name, source, interval=1.0, *, axis=None, capacity=10000, window=None, downsample=None,
+            max_points=2000, sink=None, plot=True, feed=None):
+        """
+        source(함수 또는 값)를 interval 초마다 샘플링하는 값 추가
+        feed 를 주면 interval 초마다 feed()가 돌려주는 샘플 배열을 그대로 붙인다 (시간도 feed 쪽 기준)
+        """
+        series = Series(name, source, interval, axis, capacity, window, downsample, max_points, sink, plot,
+                        feed)
+        with self._lock:
+            if any(s.name == name for s in self.series):
+                raise ValueError(f"series already monitored: {name}")
+            self.series.append(series)
+            self._layout_version += 1
+        self.start()
+        return series
+
+    def remove(self, series):
+        with self._lock:
+            if series not in self.series:
+                return
+            self.series.remove(series)
+            self._layout_version += 1
+
+    def start(self):
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="value-monitor", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout=1.0):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _groups(self, series):
+        groups = {}
+        for s in series:
+            if s.plot:
+                groups.setdefault(s.axis, []).append(s.name)
+        return groups
+
+    def _run(self):
+        figure = None
+        layout_seen = -1
+        next_draw = 0.0
+        while not self._stop.is_set():
+            now = time.monotonic()
+            wake = now + 0.1
+            # 샘플링은 잠금 안에서 한다 - remove() 가 돌아온 뒤에는 그 값의 sink 가 다시 불리지 않는다
+            with self._lock:
+                series = list(self.series)
+                version = self._layout_version
+                for s in series:
+                    if now >= s.next_due and s.feed is not None:
+                        s.buffer.extend(*s.feed())
+                        s.next_due = max(s.next_due + s.interval, now)
+                    elif now >= s.next_due:
+                        _, value = get_value_and_time(s.source)
+                        if s.sink is not None:
+                            s.sink(value)
+                        else:
+                            s.buffer.append(now - self._start, value)
+                        # 밀린 샘플은 몰아서 찍지 않고 건너뛴다
+                        s.next_due = max(s.next_due + s.interval, now)
+                    wake = min(wake, s.next_due)
+
+            if self.show_plot and now >= next_draw:
+                next_draw = now + self.redraw_interval
+                if layout_seen != version:
+                    groups = self._groups(series)
+                    if groups:
+                        if figure is None:
+                            from .figure import BlitFigure
+                            figure = BlitFigure(self.title)
+                        figure.layout(groups)
+                    layout_seen = version
+                if figure is not None:
+                    figure.update({s.name: s.data() for s in series if s.plot})
+            if self.show_plot:
+                wake = min(wake, next_draw)
+            self._stop.wait(max(0.0, wake - time.monotonic()))
+
+
+_default = None
+
+
+def get_monitor():
+    """plot_value 가 함께 쓰는 기본 모니터 (스레드 하나, 그림 하나)"""
+    global _default
+    if _default is None:
+        _default = Monitor()
+    return _default
@@ -1,47 +1,66 @@
-import time
-import matplotlib.pyplot as plt
 import warnings
-from concurrent.futures import ThreadPoolExecutor
 from .debug import setup_logging, setup_debugger
-from .utils import get_value_and_time
+from .monitor import get_monitor
 
 warnings.filterwarnings("ignore")
 
-# 스레드 풀 생성 (최대 2개 워커)
-_executor = ThreadPoolExecutor(max_workers=2)
 
-
-def plot_value(variable_source, *, interval=1.0, enable_logging=False, enable_debug=False, show_plot=True):
+def plot_value(variable_source, *, interval=1.0, enable_logging=False, enable_debug=False, show_plot=True,
+               capacity=10000, window=None, downsample=None, max_points=2000, redraw_interval=1 / 30,
+               backend="thread", name=None, axis=None, follow=None):
     """
     실시간 변수 모니터링 및 플로팅
+    여러 번 불러도 샘플링 스레드 하나와 그림 하나(값마다 서브플롯)를 함께 쓴다
 
     Args:
         variable_source: 값을 반환하는 함수 또는 직접 변수
-        interval (float): 샘플링 주기(초)
+        interval (float): 샘플링 주기(초) - 값마다 다르게 줄 수 있다
         enable_logging (bool): 로깅 활성화
         enable_debug (bool): 디버거 활성화
         show_plot (bool): 플롯 창 표시 여부
+        capacity (int): 보관할 최대 샘플 수 (넘으면 오래된 것부터 버림)
+        window (float): 최근 몇 초만 그릴지 (None 이면 버퍼 전체)
+        downsample (str): "lttb" 면 그릴 점을 max_points 개로 줄임
+        max_points (int): 다운샘플링 후 점 개수
+        redraw_interval (float): 화면 갱신 최소 간격(초) - 샘플링이 더 잦아도 이 주기로만 그린다
+        backend (str): "thread" 면 모니터 스레드에서 샘플링하고 그려서 Series 반환,
+            "process" 면 별도 프로세스에서 그리고 ProcessPlot 반환 - 이 프로세스에는 스레드를 띄우지 않으므로
+            게임 루프에서 매 프레임 plot.sample() (interval 마다 variable_source 를 push) 이나 plot.push(value)를 부른다
+        name (str): 값 이름 (범례/축 제목)
+        axis (str): 같은 axis 이름을 준 값들은 한 서브플롯에 겹쳐 그린다
+        follow (str): 텔레메트리 기록 파일(.vtel) - 주면 variable_source 는 파일 안의 값 이름이고,
+            interval 초마다 파일에 새로 덧붙은 샘플을 읽어서 그린다 (시간축은 기록 시작 기준)
     """
     if enable_logging:
         setup_logging()
     if enable_debug:
         setup_debugger()
+    if downsample not in (None, "lttb"):
+        raise ValueError(f"unknown downsample mode: {downsample}")
+
+    if backend == "process" and follow is None:
+        from .shm import ProcessPlot
+        # 공유 메모리에 쓰는 것은 게임 루프의 몫이라 모니터(샘플링 스레드)를 쓰지 않는다
+        return ProcessPlot(name or getattr(variable_source, "__name__", None) or "value", capacity=capacity,
+                           window=window, downsample=downsample, max_points=max_points,
+                           redraw_interval=redraw_interval, source=variable_source, interval=interval)
+    if backend not in ("thread", "process"):
+        raise ValueError(f"unknown backend: {backend}")
 
-    def _worker():
-        times, values = [], []
-        plt.ion()                     # 인터랙티브 모드 켜기
-        fig = plt.figure()
-        ax = fig.add_subplot(1, 1, 1)
-        plt.show(block=False)
-        while True:
-            ts, val = get_value_and_time(variable_source)
-            times.append(ts)
-            values.append(val)
-            ax.clear()
-            ax.plot(times, values)
-            fig.autofmt_xdate(rotation=30)
-            if show_plot:
-                plt.pause(0.01)         # 비차단 업데이트
-            time.sleep(interval)
+    monitor = get_monitor()
+    if follow is not None:
+        from .telemetry import TelemetryTail
+        tail = TelemetryTail(follow, variable_source)
+        monitor.redraw_interval = redraw_interval
+        return monitor.add(name or variable_source, None, interval, axis=axis, capacity=capacity, window=window,
+                           downsample=downsample, max_points=max_points, plot=show_plot, feed=tail.poll)
+    if name is None:
+        name = getattr(variable_source, "__name__", None) or "value"
+        base, n = name, 1
+        while any(s.name == name for s in monitor.series):
+            n += 1
+            name = f"{base} {n}"
 
-    _executor.submit(_worker)
\ No newline at end of file
+    monitor.redraw_interval = redraw_interval
+    return monitor.add(name, variable_source, interval, axis=axis, capacity=capacity, window=window,
+                       downsample=downsample, max_points=max_points, plot=show_plot)
@@ -0,0 +1,46 @@
+import numpy as np
+
+
+class RingBuffer:
+    """
+    고정 용량 (시간, 값) 링 버퍼 - 가득 차면 가장 오래된 샘플부터 덮어쓴다
+    메모리는 capacity 만큼만 쓰고, append 는 배열 원소 두 개를 쓰는 것뿐이다
+    """
+    def __init__(self, capacity=10000):
+        self.capacity = capacity
+        self.times = np.zeros(capacity, dtype=np.float64)
+        self.values = np.zeros(capacity, dtype=np.float64)
+        self.count = 0          # 지금까지 들어온 샘플 수 (덮어쓴 것 포함)
+
+    def __len__(self):
+        return min(self.count, self.capacity)
+
+    def append(self, t, value):
+        i = self.count % self.capacity
+        self.times[i] = t
+        self.values[i] = value
+        self.count += 1
+
+    def extend(self, times, values):
+        """샘플 여러 개를 한 번에 추가 - 용량보다 많으면 마지막 capacity 개만 남는다"""
+        n = len(times)
+        if n > self.capacity:
+            self.count += n - self.capacity
+            times, values = times[-self.capacity:], values[-self.capacity:]
+            n = self.capacity
+        i = self.count % self.capacity
+        head = min(n, self.capacity - i)
+        self.times[i:i + head] = times[:head]
+        self.values[i:i + head] = values[:head]
+        self.times[:n - head] = times[head:]
+        self.values[:n - head] = values[head:]
+        self.count += n
+
+    def view(self):
+        """시간 순서대로 정렬된 (times, values) - 한 바퀴 돌기 전에는 복사 없는 슬라이스"""
+        n = len(self)
+        if self.count <= self.capacity:
+            return self.times[:n], self.values[:n]
+        i = self.count % self.capacity
+        return (np.concatenate((self.times[i:], self.times[:i])),
+                np.concatenate((self.values[i:], self.values[:i])))
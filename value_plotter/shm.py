@@ -0,0 +1,187 @@
+"""
+프로세스 분리 플로팅: 게임 프로세스는 공유 메모리 링 버퍼에 샘플만 쓰고, 그리기는 별도 프로세스가 한다
+
+    plot = ProcessPlot("velocity_x")
+    ...
+    plot.push(player.velocity_x)     # 게임 루프에서 매 프레임 (잠금 없음, 수 마이크로초)
+    ...
+    plot.close()
+
+matplotlib 은 플롯 프로세스에서만 불러오므로 게임 프로세스의 GIL 과 경쟁하지 않는다
+게임 프로세스에는 샘플링 스레드도 두지 않는다 - 게임 루프가 push()(또는 source 를 준 경우 sample())를 직접 부른다
+"""
+import time
+import multiprocessing
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# 헤더 (int64): 누적 쓰기 수, 닫힘 표시
+_COUNT, _CLOSED, _HEADER = 0, 1, 2
+
+
+class SharedRing:
+    """
+    공유 메모리 (시간, 값) 링 버퍼 - 쓰는 쪽 하나, 읽는 쪽 여럿
+    쓰는 쪽은 데이터를 먼저 쓰고 마지막에 카운터를 올린다 (잠금 없음)
+    읽는 쪽은 복사 전후로 카운터를 읽어서, 복사하는 동안 덮어쓰였을 수 있는 오래된 칸은 버린다
+    """
+    def __init__(self, capacity=10000, name=None):
+        size = 8 * (_HEADER + 2 * capacity)
+        if name is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=size)
+            self.owner = True
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+            self.owner = False
+        self.capacity = capacity
+        buf = self.shm.buf
+        self._header = np.ndarray(_HEADER, dtype=np.int64, buffer=buf)
+        self._times = np.ndarray(capacity, dtype=np.float64, buffer=buf, offset=8 * _HEADER)
+        self._values = np.ndarray(capacity, dtype=np.float64, buffer=buf, offset=8 * (_HEADER + capacity))
+        # 쓰기는 numpy 스칼라 대입보다 훨씬 싼 memoryview 원소 대입으로 한다
+        self._w_header = buf[:8 * _HEADER].cast("q")
+        self._w_times = buf[8 * _HEADER:8 * (_HEADER + capacity)].cast("d")
+        self._w_values = buf[8 * (_HEADER + capacity):size].cast("d")
+        if self.owner:
+            self._header[:] = 0
+        self._count = int(self._header[_COUNT])
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    @property
+    def closed(self):
+        return bool(self._header[_CLOSED])
+
+    def push(self, value, t=None):
+        i = self._count % self.capacity
+        self._w_times[i] = time.monotonic() if t is None else t
+        self._w_values[i] = value
+        self._count += 1
+        self._w_header[_COUNT] = self._count
+
+    def snapshot(self, since=0):
+        """
+        시간 순서의 (times, values, count) 복사본 - since 이후에 쓰인 샘플만 (버퍼에 남아 있는 범위에서)
+        count 를 다음 호출의 since 로 넘기면 새로 들어온 것만 받는다
+        """
+        cap = self.capacity
+        end = int(self._header[_COUNT])
+        start = max(since, end - cap)
+        idx = np.arange(start, end) % cap
+        times, values = self._times[idx], self._values[idx]
+        # 복사하는 동안 쓰는 쪽이 한 바퀴 가까이 돌았으면 덮어쓰인 앞부분을 버린다
+        lost = int(self._header[_COUNT]) - cap - start
+        if lost > 0:
+            times, values = times[lost:], values[lost:]
+        return times, values, end
+
+    def mark_closed(self):
+        self._header[_CLOSED] = 1
+
+    def close(self):
+        # numpy 뷰가 버퍼를 잡고 있으면 닫을 수 없으므로 먼저 놓는다
+        for view in (self._w_header, self._w_times, self._w_values):
+            view.release()
+        self._header = self._times = self._values = None
+        self.shm.close()
+        if self.owner:
+            try:
+                self.shm.unlink()
+            except FileNotFoundError:
+                pass
+
+
+def _plot_process(name, capacity, title, window, downsample, max_points, redraw_interval):
+    """플롯 프로세스: 공유 링 버퍼를 주기적으로 읽어서 그린다"""
+    # spawn 된 자식은 부모의 resource_tracker 를 같이 쓰므로 정리(unlink)는 만든 쪽에 맡긴다
+    ring = SharedRing(capacity, name)
+
+    from .ring import RingBuffer
+    from .downsample import lttb
+    from .figure import BlitFigure
+    plot = BlitFigure(title)
+    plot.layout({title or "value": ["value"]})
+    local = RingBuffer(capacity)
+    seen = 0
+    start = None
+    try:
+        while not ring.closed:
+            times, values, seen = ring.snapshot(seen)
+            if len(times):
+                if start is None:
+                    start = times[0]
+                for t, v in zip((times - start).tolist(), values.tolist()):
+                    local.append(t, v)
+                x, y = local.view()
+                if window is not None:
+                    keep = x >= x[-1] - window
+                    x, y = x[keep], y[keep]
+                if downsample == "lttb":
+                    x, y = lttb(x, y, max_points)
+                plot.update({"value": (x, y)})
+            else:
+                plot.canvas.flush_events()
+            time.sleep(redraw_interval)
+    finally:
+        ring.close()
+
+
+class ProcessPlot:
+    """
+    별도 프로세스에서 도는 실시간 플롯
+    push(value)는 공유 메모리에 두 칸을 쓰고 카운터를 올리는 것뿐이라 게임 프레임에 거의 영향이 없다
+    source(함수 또는 값)를 주면 sample()이 interval 초마다 그 값을 push 한다
+    """
+    def __init__(self, title=None, *, capacity=10000, window=None, downsample=None, max_points=2000,
+                 redraw_interval=1 / 30, source=None, interval=0.0):
+        if downsample not in (None, "lttb"):
+            raise ValueError(f"unknown downsample mode: {downsample}")
+        self.ring = SharedRing(capacity)
+        self.source = source
+        self.interval = interval
+        self._next_due = 0.0
+        # fork 는 pygame/SDL 상태와 스레드까지 복제하므로 spawn 으로 깨끗한 프로세스를 띄운다
+        ctx = multiprocessing.get_context("spawn")
+        self.process = ctx.Process(
+            target=_plot_process,
+            args=(self.ring.name, capacity, title, window, downsample, max_points, redraw_interval),
+            daemon=True,
+        )
+        self.process.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def alive(self):
+        return self.process.is_alive()
+
+    def push(self, value, t=None):
+        self.ring.push(value, t)
+
+    def sample(self):
+        """게임 루프에서 매 프레임 부른다: interval 이 지났으면 source 값을 push (밀린 샘플은 건너뜀)"""
+        now = time.monotonic()
+        if now < self._next_due:
+            return
+        self._next_due += self.interval
+        if self._next_due <= now:
+            self._next_due = now + self.interval
+        source = self.source
+        self.ring.push(source() if callable(source) else source, now)
+
+    def close(self, timeout=2.0):
+        if self.ring.shm is None:
+            return
+        self.ring.mark_closed()
+        self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.terminate()
+        self.ring.close()
+        self.ring.shm = None
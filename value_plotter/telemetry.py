@@ -0,0 +1,212 @@
+"""
+텔레메트리 기록 파일 (.vtel, little-endian, 덧붙이기 전용)
+
+    헤더 : magic(4s) version(H) pad(2x) start_time(d)  - start_time 은 기록 시작 시각 (유닉스 초)
+    청크 : kind(B) pad(x) series(H) count(I) + 내용
+           kind 0 = 값 이름 정의 : UTF-8 이름 count 바이트 (8바이트 경계까지 0 으로 채움)
+           kind 1 = 샘플 묶음   : times(f8 * count) values(f8 * count)  - 시간은 start_time 기준 초
+
+값마다 (시간 배열, 값 배열)을 통째로 쓰는 열 단위 청크라서, 읽을 때는 mmap 위에서 np.frombuffer 로
+파싱 없이 이어 붙이기만 하면 된다. 청크는 한 번의 write 로 쓰고 앞쪽은 다시 건드리지 않으므로
+기록 중인 파일을 다른 프로세스가 따라 읽어도 되고, 끝이 잘린 청크는 다음에 다시 읽는다
+
+    recorder = Recorder("session.vtel")
+    recorder.record("fps", clock.get_fps())      # 게임 루프에서 (메모리 배열에 두 칸 추가)
+    ...
+    recorder.close()
+
+    data = load_telemetry("session.vtel")        # {"fps": (times, values)}
+"""
+import mmap
+import time
+import struct
+from array import array
+
+import numpy as np
+
+MAGIC = b"VNGT"
+VERSION = 1
+EXTENSION = ".vtel"
+
+HEADER = struct.Struct("<4sHxxd")
+CHUNK = struct.Struct("<BxHI")
+_NAME, _SAMPLES = 0, 1
+
+
+def _padded(n):
+    return (n + 7) & ~7
+
+
+class Recorder:
+    """
+    record(name, value)로 받은 샘플을 값마다 배열에 모았다가 batch 개가 차거나
+    flush_interval 초가 지나면 청크로 덧붙인다
+    """
+    def __init__(self, filename, batch=4096, flush_interval=1.0):
+        self.filename = filename
+        self.batch = batch
+        self.flush_interval = flush_interval
+        self.start_time = time.time()
+        self._t0 = time.perf_counter()
+        self._f = open(filename, "wb")
+        self._f.write(HEADER.pack(MAGIC, VERSION, self.start_time))
+        self._series = {}       # 이름 -> (번호, 시간 배열, 값 배열)
+        self._next_flush = self.flush_interval
+        self.count = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _define(self, name):
+        index = len(self._series)
+        raw = name.encode("utf-8")
+        self._f.write(CHUNK.pack(_NAME, index, len(raw)) + raw + bytes(_padded(len(raw)) - len(raw)))
+        entry = self._series[name] = (index, array("d"), array("d"))
+        return entry
+
+    def record(self, name, value, t=None):
+        """샘플 하나 추가 - t 를 안 주면 지금 시각 (기록 시작 기준 초)"""
+        if t is None:
+            t = time.perf_counter() - self._t0
+        entry = self._series.get(name)
+        if entry is None:
+            entry = self._define(name)
+        _, times, values = entry
+        times.append(t)
+        values.append(value)
+        if len(times) >= self.batch:
+            self._write(entry)
+        if t >= self._next_flush:
+            self.flush()
+
+    def _write(self, entry):
+        index, times, values = entry
+        if not times:
+            return
+        # 헤더와 두 열을 한 번에 써서 따라 읽는 쪽이 반쯤 쓰인 청크를 볼 일을 줄인다
+        self._f.write(CHUNK.pack(_SAMPLES, index, len(times)) + times.tobytes() + values.tobytes())
+        self.count += len(times)
+        del times[:]
+        del values[:]
+
+    def flush(self):
+        for entry in self._series.values():
+            self._write(entry)
+        self._f.flush()
+        self._next_flush = time.perf_counter() - self._t0 + self.flush_interval
+
+    def close(self):
+        if self._f.closed:
+            return
+        self.flush()
+        self._f.close()
+
+
+def _read_header(buf, filename):
+    if len(buf) < HEADER.size:
+        raise ValueError(f"not a telemetry file: {filename}")
+    magic, version, start_time = HEADER.unpack_from(buf, 0)
+    if magic != MAGIC:
+        raise ValueError(f"not a telemetry file: {filename}")
+    if version != VERSION:
+        raise ValueError(f"unsupported telemetry version: {version}")
+    return start_time
+
+
+def _chunks(buf, offset, names):
+    """
+    offset 부터 완전한 청크만 읽는다 - (값 번호, times, values) 를 차례로 내고 마지막에 다음 offset 반환
+    이름 정의 청크는 names(list)에 채운다
+    """
+    size = len(buf)
+    while offset + CHUNK.size <= size:
+        kind, index, count = CHUNK.unpack_from(buf, offset)
+        body = offset + CHUNK.size
+        if kind == _NAME:
+            end = body + _padded(count)
+            if end > size:
+                break
+            while len(names) <= index:
+                names.append(None)
+            names[index] = bytes(buf[body:body + count]).decode("utf-8")
+        elif kind == _SAMPLES:
+            end = body + 16 * count
+            if end > size:
+                break
+            times = np.frombuffer(buf, dtype="<f8", count=count, offset=body)
+            values = np.frombuffer(buf, dtype="<f8", count=count, offset=body + 8 * count)
+            yield index, times, values
+        else:
+            raise ValueError(f"bad telemetry chunk kind {kind} at {offset}")
+        offset = end
+    return offset
+
+
+def load_telemetry(filename, names=None):
+    """
+    기록 파일 전체를 {이름: (times, values)} NumPy 배열로 읽는다 (mmap, 값마다 청크를 한 번에 이어 붙임)
+    names 를 주면 그 값들만 읽는다. 반환 배열은 파일과 무관한 복사본이다
+    """
+    with open(filename, "rb") as f:
+        if not f.seek(0, 2):
+            raise ValueError(f"not a telemetry file: {filename}")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            _read_header(mm, filename)
+            series_names = []
+            out = _collect(_chunks(mm, HEADER.size, series_names), series_names, names)
+    return out
+
+
+def _collect(chunks, series_names, names=None):
+    # mmap 위의 뷰는 여기서 모두 복사해서 놓아야 mmap 을 닫을 수 있다
+    parts = {}
+    for index, times, values in chunks:
+        name = series_names[index]
+        if names is None or name in names:
+            parts.setdefault(name, []).append((times, values))
+    return {name: (np.concatenate([t for t, _ in pieces]), np.concatenate([v for _, v in pieces]))
+            for name, pieces in parts.items()}
+
+
+class TelemetryTail:
+    """
+    기록 중인 파일에서 값 하나를 따라 읽는다 - poll()은 지난 호출 이후 새로 쓰인 (times, values)
+    파일 전체를 다시 읽지 않고 마지막으로 읽은 완전한 청크 다음부터만 읽는다
+    """
+    def __init__(self, filename, name):
+        self.filename = filename
+        self.name = name
+        self.start_time = None
+        self._offset = 0
+        self._names = []
+
+    def poll(self):
+        empty = np.empty(0), np.empty(0)
+        try:
+            with open(self.filename, "rb") as f:
+                f.seek(self._offset)
+                data = f.read()
+        except FileNotFoundError:
+            return empty
+        if self.start_time is None:
+            if len(data) < HEADER.size:
+                return empty
+            self.start_time = _read_header(data, self.filename)
+            data = data[HEADER.size:]
+            self._offset = HEADER.size
+        pieces = []
+        chunks = _chunks(data, 0, self._names)
+        while True:
+            try:
+                index, times, values = next(chunks)
+            except StopIteration as stop:
+                self._offset += stop.value
+                break
+            if self._names[index] == self.name:
+                pieces.append((times, values))
+        if not pieces:
+            return empty
+        return np.concatenate([t for t, _ in pieces]), np.concatenate([v for _, v in pieces])